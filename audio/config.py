@@ -0,0 +1,21 @@
+import os
+from dotenv import load_dotenv
+
+# 🔐 Load environment variables from the .env file into the runtime environment
+load_dotenv()
+
+# 🧠 OpenAI API Key used for accessing GPT-4 and Whisper models
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# 📁 Google Drive folder ID where audio-based summaries (meeting notes) will be uploaded
+AUDIO_DRIVE_FOLDER_ID = os.getenv("AUDIO_DRIVE_FOLDER_ID")
+
+# ⚡ Number of audio chunks sent to Whisper at the same time, and retries per failed chunk
+TRANSCRIBE_CONCURRENCY = int(os.getenv("TRANSCRIBE_CONCURRENCY", "4"))
+TRANSCRIBE_RETRIES = int(os.getenv("TRANSCRIBE_RETRIES", "2"))
+
+# 🌊 Stream recordings from Drive into Whisper / the splitter instead of downloading them first
+AUDIO_STREAM_DOWNLOAD = os.getenv("AUDIO_STREAM_DOWNLOAD", "false").lower() == "true"
+
+# 📝 Summarize each chunk of a split recording as soon as it is transcribed
+AUDIO_STREAM_SUMMARY = os.getenv("AUDIO_STREAM_SUMMARY", "true").lower() == "true"
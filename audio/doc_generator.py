@@ -0,0 +1,45 @@
+from common.doc_blocks import block, text_runs
+from common.docx_renderer import render_docx
+
+# Map keys from the JSON to action plan section titles
+ACTION_PLAN_TITLES = {
+    "decision_made": "Key Decisions Made",
+    "key_services_to_promote": "Key Services to Promote",
+    "target_geography": "Target Geography",
+    "budget_and_timeline": "Budget and Timeline",
+    "lead_management_strategy": "Lead Management Strategy",
+    "next_steps_and_ownership": "Next Steps and Ownership",
+}
+
+
+def bullets(items):
+    return [block("ListBullet", text_runs(item.strip())) for item in items]
+
+
+# 🧱 Document blocks for a meeting summary (shared by every output backend)
+def meeting_blocks(summary_data, company_name, meeting_date):
+    # 🏷 Document title and right-aligned meeting date
+    blocks = [
+        block("Title", text_runs(f"{company_name} Meeting Notes")),
+        block("Heading2", text_runs(f"Date: {meeting_date}"), align="right"),
+    ]
+
+    # 1️⃣ Section: Minutes of the Meeting (MoM)
+    blocks.append(block("Heading1", text_runs("1. Minutes of the Meeting (MoM)")))
+    blocks += bullets(summary_data["mom"])
+
+    # 2️⃣ Section: To-Do List
+    blocks.append(block("Heading1", text_runs("2. To-Do List")))
+    blocks += bullets(summary_data["todo_list"])
+
+    # 3️⃣ Section: Action Points / Action Plan, one subsection per action plan key
+    blocks.append(block("Heading1", text_runs("3. Action Points / Action Plan")))
+    for key, title in ACTION_PLAN_TITLES.items():
+        blocks.append(block("Heading2", text_runs(title)))
+        blocks += bullets(summary_data["action_plan"].get(key, []))
+    return blocks
+
+
+# 📝 Generate a structured DOCX meeting summary and return the document content as bytes
+def generate_docx(summary_data, company_name, meeting_date):
+    return render_docx(meeting_blocks(summary_data, company_name, meeting_date))
@@ -0,0 +1,248 @@
+# 📦 Standard Libraries
+import os
+import io
+import time
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# 🌐 Google API Libraries
+from googleapiclient.http import MediaIoBaseDownload
+from common.google_clients import get_drive_service as get_shared_drive_service
+from common.concurrency import drive_slot
+from common.drive_uploads import upload_queue
+from common.profiler import stage
+
+# 🔐 Environment variable loader
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 🔧 Config from .env
+AUDIO_DRIVE_FOLDER_ID = os.getenv(
+    "AUDIO_DRIVE_FOLDER_ID"
+)  # Replace with your actual .env key
+
+# ⬇️ Download settings: bytes per ranged request, retries per chunk, where partial files live
+DRIVE_DOWNLOAD_CHUNK_BYTES = int(os.getenv("DRIVE_DOWNLOAD_CHUNK_MB", "32")) * 1024 * 1024
+DRIVE_DOWNLOAD_RETRIES = int(os.getenv("DRIVE_DOWNLOAD_RETRIES", "5"))
+DRIVE_DOWNLOAD_DIR = os.getenv(
+    "DRIVE_DOWNLOAD_DIR", os.path.join(tempfile.gettempdir(), "smart-summarizer-downloads")
+)
+
+
+# 🔐 Authenticate using service account (shared, per-thread pooled client)
+def get_drive_service():
+    return get_shared_drive_service()
+
+
+# 🎼 Recording formats Whisper accepts (matched on extension or an audio/* MIME type)
+AUDIO_EXTENSIONS = (
+    ".m4a", ".mp3", ".mp4", ".mpeg", ".mpga", ".wav", ".webm", ".ogg", ".oga", ".opus",
+    ".flac", ".aac",
+)
+AUDIO_FILE_FIELDS = "id, name, mimeType, size, md5Checksum, modifiedTime, videoMediaMetadata(durationMillis)"
+
+
+# 📂 Every audio file in a folder (all pages), oldest first so recordings stay in meeting order
+def list_audio_files(folder_id):
+    service = get_drive_service()
+    files = []
+    page_token = None
+    while True:
+        with drive_slot, stage("drive.list"):
+            results = (
+                service.files()
+                .list(
+                    q=(
+                        f"'{folder_id}' in parents and trashed = false "
+                        "and mimeType != 'application/vnd.google-apps.folder'"
+                    ),
+                    pageSize=1000,
+                    pageToken=page_token,
+                    fields=f"nextPageToken, files({AUDIO_FILE_FIELDS})",
+                    includeItemsFromAllDrives=True,
+                    supportsAllDrives=True,
+                )
+                .execute()
+            )
+        files += [
+            file
+            for file in results.get("files", [])
+            if file.get("mimeType", "").startswith("audio/")
+            or file["name"].lower().endswith(AUDIO_EXTENSIONS)
+        ]
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            break
+
+    return sorted(files, key=lambda file: (file.get("modifiedTime", ""), file["name"]))
+
+
+# 📄 Name, size and checksum of a Drive file (used to name, resume and verify downloads)
+def get_file_metadata(file_id):
+    service = get_drive_service()
+    with drive_slot:
+        return (
+            service.files()
+            .get(
+                fileId=file_id,
+                fields=AUDIO_FILE_FIELDS,
+                supportsAllDrives=True,
+            )
+            .execute()
+        )
+
+
+# ⏯️ MediaIoBaseDownload that starts at a byte offset (continues a partial download)
+class ResumableMediaDownload(MediaIoBaseDownload):
+    def __init__(self, fd, request, chunksize=DRIVE_DOWNLOAD_CHUNK_BYTES, offset=0):
+        super().__init__(fd, request, chunksize=chunksize)
+        self._progress = offset
+
+
+# 🧮 File-like writer that hashes everything written through it
+class HashingWriter:
+    def __init__(self, fd, digest):
+        self.fd = fd
+        self.digest = digest
+
+    def write(self, data):
+        self.digest.update(data)
+        return self.fd.write(data)
+
+
+def hash_md5(path):
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _verify_md5(metadata, digest):
+    expected = metadata.get("md5Checksum")
+    if expected and digest.hexdigest() != expected:
+        raise ValueError(
+            f"❌ Checksum mismatch for {metadata['name']}: got {digest.hexdigest()}, Drive says {expected}"
+        )
+
+
+# ⬇️ Download an audio file from Google Drive (authenticated, ranged chunks, resumable)
+#    An interrupted download is continued from its .part file on the next attempt,
+#    and the finished file is verified against Drive's md5Checksum.
+def download_audio_from_drive(file_id, metadata=None):
+    metadata = metadata or get_file_metadata(file_id)
+    extension = os.path.splitext(metadata["name"])[1] or ".m4a"
+    total_size = int(metadata.get("size") or 0)
+
+    os.makedirs(DRIVE_DOWNLOAD_DIR, exist_ok=True)
+    final_path = os.path.join(DRIVE_DOWNLOAD_DIR, f"{file_id}{extension}")
+    part_path = final_path + ".part"
+
+    # ♻️ Left over from an earlier run that failed after downloading: reuse it if intact
+    if os.path.exists(final_path) and metadata.get("md5Checksum"):
+        if hash_md5(final_path) == metadata["md5Checksum"]:
+            print(f"♻️ Reusing verified download: {final_path}")
+            return final_path
+
+    # ⏯️ Hash what is already on disk, then fetch only the missing byte range
+    digest = hashlib.md5()
+    offset = 0
+    if os.path.exists(part_path):
+        offset = os.path.getsize(part_path)
+        if total_size and offset > total_size:
+            os.remove(part_path)
+            offset = 0
+        else:
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+            print(f"⏯️ Resuming download of {metadata['name']} at {offset / (1024*1024):.1f} MB")
+
+    print(f"🌐 Downloading {metadata['name']} ({total_size / (1024*1024):.1f} MB) from Drive...")
+    started = time.perf_counter()
+    if not total_size or offset < total_size:
+        request = get_drive_service().files().get_media(fileId=file_id, supportsAllDrives=True)
+        with open(part_path, "ab") as f:
+            downloader = ResumableMediaDownload(HashingWriter(f, digest), request, offset=offset)
+            done = False
+            while not done:
+                with drive_slot, stage("drive.download") as sample:
+                    received = downloader._progress
+                    _, done = downloader.next_chunk(num_retries=DRIVE_DOWNLOAD_RETRIES)
+                    sample["bytes"] = downloader._progress - received
+
+    try:
+        _verify_md5(metadata, digest)
+    except ValueError:
+        os.remove(part_path)  # Corrupt data: start from scratch next time
+        raise
+    os.replace(part_path, final_path)
+
+    elapsed = time.perf_counter() - started
+    speed = (total_size - offset) / (1024 * 1024) / elapsed if elapsed else 0
+    print(f"✅ Downloaded file to: {final_path} ({speed:.1f} MB/s, checksum verified)")
+    return final_path
+
+
+# 🔒 Downloads in use, per Drive file id: {"lock": download lock, "users": holders}
+_downloads_lock = threading.Lock()
+_downloads = {}
+
+
+# 🤝 Download a recording for the duration of a `with` block. Rows or jobs that reference the
+#    same recording at the same time share one download (the .part file has a fixed path so
+#    it can be resumed, and two appenders would corrupt it); the last one out removes it.
+#    `fetch` replaces the plain download, e.g. to go through a job checkpoint.
+@contextmanager
+def shared_download(file_id, metadata=None, fetch=None):
+    with _downloads_lock:
+        entry = _downloads.setdefault(file_id, {"lock": threading.Lock(), "users": 0})
+        entry["users"] += 1
+
+    audio_path = None
+    try:
+        with entry["lock"]:
+            audio_path = fetch() if fetch else download_audio_from_drive(file_id, metadata)
+        yield audio_path
+    finally:
+        # Removed under the registry lock, so a newcomer can't pick up the file being deleted
+        with _downloads_lock:
+            entry["users"] -= 1
+            if entry["users"] == 0:
+                del _downloads[file_id]
+                if audio_path and os.path.exists(audio_path):
+                    os.remove(audio_path)
+
+
+# 🌊 Yield the file's bytes chunk by chunk without writing them to disk (md5 checked at the end)
+def iter_drive_file(file_id, metadata=None, chunk_size=DRIVE_DOWNLOAD_CHUNK_BYTES):
+    metadata = metadata or get_file_metadata(file_id)
+    request = get_drive_service().files().get_media(fileId=file_id, supportsAllDrives=True)
+    buffer = io.BytesIO()
+    digest = hashlib.md5()
+    downloader = ResumableMediaDownload(HashingWriter(buffer, digest), request, chunksize=chunk_size)
+
+    done = False
+    while not done:
+        with drive_slot, stage("drive.download") as sample:
+            received = downloader._progress
+            _, done = downloader.next_chunk(num_retries=DRIVE_DOWNLOAD_RETRIES)
+            sample["bytes"] = downloader._progress - received
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    _verify_md5(metadata, digest)
+
+
+# 📤 Uploads a DOCX file (in memory) to a Shared Drive, converted to a Google Doc
+#    (through the shared upload queue: multipart for small files, rate-limited)
+def upload_file_to_drive_in_memory(
+    file_data, folder_id=AUDIO_DRIVE_FOLDER_ID, final_name="Meeting Notes.docx"
+):
+    file_id = upload_queue.upload(file_data, final_name, folder_id)
+    print(f"📤 File uploaded: {file_id}")
+    return file_id
@@ -0,0 +1,80 @@
+# 📦 Standard Libraries
+import os
+import json
+import threading
+from dotenv import load_dotenv
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Local record of what was already done for each recordings folder
+FOLDER_MANIFEST_PATH = os.getenv("FOLDER_MANIFEST_PATH", ".cache/folder_manifest.json")
+
+
+# 🗂️ Folder id -> {files: {file_id: id/modifiedTime/md5 + summary}, documents: {signature: links}}
+class FolderManifest:
+    def __init__(self, path=FOLDER_MANIFEST_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.folders = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.folders = json.load(f)
+
+    def _folder(self, folder_id):
+        return self.folders.setdefault(folder_id, {"files": {}, "documents": {}})
+
+    # 🧾 Stored summary for a recording, or None if the file (or the prompt) changed since
+    def get_summary(self, folder_id, file, prompt_hash=None):
+        with self.lock:
+            entry = self._folder(folder_id)["files"].get(file["id"])
+            if not entry:
+                return None
+            if entry["modifiedTime"] != file.get("modifiedTime") or entry["md5"] != file.get("md5Checksum"):
+                return None
+            if entry.get("prompt_hash") != prompt_hash:
+                return None
+            return entry["summary"]
+
+    def set_summary(self, folder_id, file, summary, prompt_hash=None):
+        with self.lock:
+            self._folder(folder_id)["files"][file["id"]] = {
+                "name": file["name"],
+                "modifiedTime": file.get("modifiedTime"),
+                "md5": file.get("md5Checksum"),
+                "summary": summary,
+                "prompt_hash": prompt_hash,
+            }
+
+    # 🧹 Forget recordings that are no longer in the folder
+    def prune(self, folder_id, file_ids):
+        with self.lock:
+            files = self._folder(folder_id)["files"]
+            for file_id in list(files):
+                if file_id not in file_ids:
+                    del files[file_id]
+
+    # 📄 Links of documents already uploaded for exactly these inputs
+    def get_documents(self, folder_id, signature):
+        with self.lock:
+            return self._folder(folder_id)["documents"].get(signature)
+
+    def set_documents(self, folder_id, signature, links):
+        with self.lock:
+            # Only the latest output per folder is worth keeping
+            self._folder(folder_id)["documents"] = {signature: links}
+
+    # 💾 Atomically write the manifest to disk
+    def save(self):
+        with self.lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.folders, f)
+            os.replace(temp_path, self.path)
+
+
+# 🔗 Shared manifest used by every worker thread
+folder_manifest = FolderManifest()
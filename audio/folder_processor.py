@@ -0,0 +1,185 @@
+# 📦 Standard Libraries
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dotenv import load_dotenv
+
+# 🎧 Audio pipeline
+from audio.config import AUDIO_DRIVE_FOLDER_ID, AUDIO_STREAM_DOWNLOAD, AUDIO_STREAM_SUMMARY
+from audio.drive_utils import (
+    list_audio_files,
+    download_audio_from_drive,
+    shared_download,
+    upload_file_to_drive_in_memory,
+)
+from audio.transcription import transcribe_recording, transcribe_drive_recording
+from audio.summarizer import (
+    merge_meeting_summaries,
+    StreamingSummarizer,
+    SYSTEM_PROMPT,
+    OPENAI_MODEL,
+)
+from audio.doc_generator import meeting_blocks
+from audio.folder_manifest import folder_manifest
+from common.map_reduce import reduce_partials
+from common.metrics import submit_in_context
+from common.job_store import checkpointed
+from common.profiler import stage
+from common.doc_output import publish_document
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ "merged" = one meeting-notes document per folder, "per_file" = one per recording
+AUDIO_OUTPUT_MODE = os.getenv("AUDIO_OUTPUT_MODE", "merged").lower()
+
+# ⚡ Recordings of one folder transcribed + summarized at the same time
+AUDIO_FOLDER_CONCURRENCY = int(os.getenv("AUDIO_FOLDER_CONCURRENCY", "2"))
+
+# 🔑 Stored summaries are only reused while the prompt and model stay the same
+PROMPT_HASH = hashlib.sha256(f"{OPENAI_MODEL}\n{SYSTEM_PROMPT}".encode("utf-8")).hexdigest()
+
+
+# 🎙️ Transcript of one Drive recording (streamed, or downloaded and removed afterwards)
+def transcribe_drive_file(file, on_transcript=None):
+    if AUDIO_STREAM_DOWNLOAD:
+        return transcribe_drive_recording(file["id"], file, on_transcript)
+
+    # The download is shared with any other row using this recording right now, and removed
+    # once the last of them is done, even when transcription fails
+    with shared_download(
+        file["id"],
+        file,
+        fetch=lambda: checkpointed(
+            f"downloaded:{recording_key(file)}",
+            download_audio_from_drive,
+            file["id"],
+            file,
+            valid=os.path.exists,
+        ),
+    ) as audio_path:
+        return transcribe_recording(audio_path, on_transcript)
+
+
+# 🔑 Stage-checkpoint suffix for one version of a recording
+def recording_key(file):
+    return f"{file['id']}:{file.get('md5Checksum') or file.get('modifiedTime')}"
+
+
+# ⏯️ Downloaded / transcribed / summarized are checkpointed per recording in daemon mode.
+#    With AUDIO_STREAM_SUMMARY, chunks are summarized while the rest is still transcribing,
+#    so audio.summarize only covers the wait for the last chunk plus the final merge.
+def summarize_drive_file(file):
+    print(f"🎯 Processing recording: {file['name']}")
+    with StreamingSummarizer() as summarizer:
+        on_transcript = summarizer.add if AUDIO_STREAM_SUMMARY else None
+        with stage("audio.transcribe"):
+            transcript = checkpointed(
+                f"transcribed:{recording_key(file)}", transcribe_drive_file, file, on_transcript
+            )
+        with stage("audio.summarize"):
+            return checkpointed(f"summarized:{recording_key(file)}", summarizer.finish, transcript)
+
+
+# 🔑 Identifies one output: same recordings + same settings = same documents
+def output_signature(files, company_name, meeting_date, mode):
+    inputs = [mode, company_name, meeting_date, PROMPT_HASH] + [
+        [file["id"], file.get("md5Checksum"), file.get("modifiedTime")] for file in files
+    ]
+    return hashlib.sha256(json.dumps(inputs).encode("utf-8")).hexdigest()
+
+
+# 📄 Publish one document (checkpointed as "uploaded": rendering is cheap to redo,
+#    an upload is not, since repeating it would leave a duplicate document in Drive)
+def render_and_upload(summary, company_name, meeting_date, final_name, signature):
+    def upload():
+        uploaded_id = publish_document(
+            meeting_blocks(summary, company_name, meeting_date),
+            final_name,
+            AUDIO_DRIVE_FOLDER_ID,
+            lambda docx_bytes, name: upload_file_to_drive_in_memory(
+                docx_bytes, folder_id=AUDIO_DRIVE_FOLDER_ID, final_name=name
+            ),
+        )
+        return f"https://docs.google.com/document/d/{uploaded_id}/edit"
+
+    return checkpointed(f"uploaded:{signature}:{final_name}", upload)
+
+
+# 📂 Summarize every recording in a Drive folder and return the document link(s).
+#    Only new or changed recordings are transcribed; if nothing changed at all,
+#    the documents uploaded last time are returned without any OpenAI or upload calls.
+def process_audio_folder(folder_id, company_name, meeting_date, mode=AUDIO_OUTPUT_MODE):
+    files = list_audio_files(folder_id)
+    if not files:
+        raise FileNotFoundError("No audio files found in folder.")
+
+    summaries = {}
+    pending = []
+    for file in files:
+        summary = folder_manifest.get_summary(folder_id, file, PROMPT_HASH)
+        if summary is None:
+            pending.append(file)
+        else:
+            summaries[file["id"]] = summary
+    print(f"🎧 {len(files)} recording(s) in folder, {len(pending)} new or changed.")
+
+    # ⚡ New/changed recordings run concurrently; each finished one is saved right away,
+    #    so a failure only costs the recordings that failed
+    failures = []
+    if pending:
+        workers = max(1, min(AUDIO_FOLDER_CONCURRENCY, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {submit_in_context(executor, summarize_drive_file, file): file for file in pending}
+            for future in as_completed(futures):
+                file = futures[future]
+                try:
+                    summaries[file["id"]] = future.result()
+                except Exception as e:
+                    print(f"❌ Recording {file['name']} failed: {e}")
+                    failures.append(file["name"])
+                    continue
+                folder_manifest.set_summary(folder_id, file, summaries[file["id"]], PROMPT_HASH)
+                folder_manifest.save()
+    if failures:
+        raise RuntimeError(f"{len(failures)} recording(s) failed: {', '.join(failures)}")
+
+    folder_manifest.prune(folder_id, {file["id"] for file in files})
+
+    # ♻️ Nothing changed since the last upload: reuse those documents
+    signature = output_signature(files, company_name, meeting_date, mode)
+    links = folder_manifest.get_documents(folder_id, signature)
+    if links:
+        print("♻️ Folder unchanged since last run, reusing uploaded document(s).")
+        return links
+
+    if mode == "per_file":
+        links = [
+            render_and_upload(
+                summaries[file["id"]],
+                company_name,
+                meeting_date,
+                f"{company_name} Meeting Notes - {os.path.splitext(file['name'])[0]}.docx",
+                signature,
+            )
+            for file in files
+        ]
+    else:
+        partials = [summaries[file["id"]] for file in files]
+        if len(partials) == 1:
+            summary = partials[0]
+        else:
+            # Many or long recordings are tree-reduced so no merge prompt overflows the context
+            summary = checkpointed(
+                f"merged:{signature}", reduce_partials, partials, merge_meeting_summaries
+            )
+        links = [
+            render_and_upload(
+                summary, company_name, meeting_date, f"{company_name} Meeting Notes.docx", signature
+            )
+        ]
+
+    folder_manifest.set_documents(folder_id, signature, links)
+    folder_manifest.save()
+    return links
@@ -0,0 +1,148 @@
+# 📦 Standard Libraries
+import os
+import time
+import tempfile
+from dotenv import load_dotenv
+
+# 🧩 Shared helpers
+from audio.splitter import run_ffmpeg, probe_audio, detect_silences, SILENCE_NOISE_DB
+from common.profiler import stage
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Whisper only needs speech: mono, 16 kHz (its internal sample rate), low-bitrate speech codec
+AUDIO_PREPROCESS = os.getenv("AUDIO_PREPROCESS", "true").lower() == "true"
+PREPROCESS_CODEC = os.getenv("PREPROCESS_CODEC", "opus").lower()  # opus or mp3
+PREPROCESS_BITRATE = os.getenv("PREPROCESS_BITRATE", "24k")
+PREPROCESS_SAMPLE_RATE = int(os.getenv("PREPROCESS_SAMPLE_RATE", "16000"))
+
+# 🔇 Silences longer than PREPROCESS_MIN_SILENCE_SECONDS are cut down to
+#    PREPROCESS_KEEP_SILENCE_SECONDS (half kept on each side, so words are never clipped)
+PREPROCESS_TRIM_SILENCE = os.getenv("PREPROCESS_TRIM_SILENCE", "true").lower() == "true"
+PREPROCESS_MIN_SILENCE_SECONDS = float(os.getenv("PREPROCESS_MIN_SILENCE_SECONDS", "2.0"))
+PREPROCESS_KEEP_SILENCE_SECONDS = float(os.getenv("PREPROCESS_KEEP_SILENCE_SECONDS", "0.5"))
+
+# 🎼 Output extension + encoder arguments per codec (both are Whisper formats the splitter can stream-copy)
+CODECS = {
+    "opus": (".ogg", ["-c:a", "libopus", "-application", "voip"]),
+    "mp3": (".mp3", ["-c:a", "libmp3lame"]),
+}
+
+
+# ✂️ Parts of [0, duration] to keep, as [(start, end), ...], given the detected silences
+def plan_kept_segments(
+    duration,
+    silences,
+    min_silence=PREPROCESS_MIN_SILENCE_SECONDS,
+    keep_silence=PREPROCESS_KEEP_SILENCE_SECONDS,
+):
+    kept = []
+    position = 0.0
+    for start, end in silences:
+        if end - start < min_silence:
+            continue
+        cut_start, cut_end = start + keep_silence / 2, min(end, duration) - keep_silence / 2
+        if cut_start > position:
+            kept.append((position, cut_start))
+        position = max(position, cut_end)
+    if duration > position:
+        kept.append((position, duration))
+    return kept
+
+
+def encode_args(source, output_path, audio_filter=None, codec=PREPROCESS_CODEC):
+    _, codec_args = CODECS[codec]
+    return [
+        "ffmpeg",
+        "-nostats",
+        "-hide_banner",
+        "-y",
+        "-i", source,
+        "-map", "0:a:0",
+        "-vn",
+        *(["-af", audio_filter] if audio_filter else []),
+        "-ac", "1",
+        "-ar", str(PREPROCESS_SAMPLE_RATE),
+        *codec_args,
+        "-b:a", PREPROCESS_BITRATE,
+        output_path,
+    ]
+
+
+def temp_output_path(codec=PREPROCESS_CODEC):
+    handle, output_path = tempfile.mkstemp(prefix="preprocessed-", suffix=CODECS[codec][0])
+    os.close(handle)
+    return output_path
+
+
+# 🎚️ Downmix, resample, drop long silences and re-encode a recording for Whisper.
+#    Returns (output path, report); the caller removes the output file.
+def preprocess_audio_with_report(audio_path, trim_silence=PREPROCESS_TRIM_SILENCE, codec=PREPROCESS_CODEC):
+    started = time.perf_counter()
+    info = probe_audio(audio_path)
+    duration = info["duration"]
+
+    kept = [(0.0, duration)]
+    if trim_silence and duration:
+        silences = detect_silences(audio_path, SILENCE_NOISE_DB, PREPROCESS_MIN_SILENCE_SECONDS)
+        kept = plan_kept_segments(duration, silences) or kept
+
+    audio_filter = None
+    if kept != [(0.0, duration)]:
+        expression = "+".join(f"between(t,{start:.3f},{end:.3f})" for start, end in kept)
+        # Offsets are not preserved: timestamps in the output (e.g. verbose_json) are NOT original times
+        audio_filter = f"aselect='{expression}',asetpts=N/SR/TB"
+
+    output_path = temp_output_path(codec)
+    try:
+        _, peak_rss_mb = run_ffmpeg(encode_args(audio_path, output_path, audio_filter, codec))
+    except Exception:
+        os.remove(output_path)
+        raise
+
+    kept_seconds = sum(end - start for start, end in kept)
+    report = {
+        "file": os.path.basename(audio_path),
+        "codec": f"{codec} {PREPROCESS_BITRATE}",
+        "original_mb": round(info["size"] / (1024 * 1024), 2),
+        "processed_mb": round(os.path.getsize(output_path) / (1024 * 1024), 2),
+        "trimmed_seconds": round(duration - kept_seconds, 1),
+        "duration_seconds": round(duration, 1),
+        "preprocess_seconds": round(time.perf_counter() - started, 2),
+        "peak_rss_mb": round(peak_rss_mb, 1) if peak_rss_mb is not None else None,
+    }
+    return output_path, report
+
+
+# 🎚️ Preprocess a recording for Whisper (prints the report); returns the output path
+def preprocess_audio(audio_path, **options):
+    with stage("audio.preprocess", os.path.getsize(audio_path)):
+        output_path, report = preprocess_audio_with_report(audio_path, **options)
+    print(
+        f"🎚️ Preprocessed {report['file']} [{report['codec']}]: {report['original_mb']} MB -> "
+        f"{report['processed_mb']} MB, {report['trimmed_seconds']}s of silence trimmed, "
+        f"in {report['preprocess_seconds']}s"
+    )
+    return output_path
+
+
+# 🌊 Preprocess audio arriving as a stream of byte chunks (e.g. straight from Drive).
+#    A pipe can only be read once, so there is no silence pass. MP4/M4A without
+#    "faststart" fails here, like split_audio_stream.
+def preprocess_audio_stream(byte_chunks, name="stream", codec=PREPROCESS_CODEC):
+    started = time.perf_counter()
+    output_path = temp_output_path(codec)
+    try:
+        with stage("audio.preprocess"):
+            run_ffmpeg(encode_args("pipe:0", output_path, codec=codec), input_chunks=byte_chunks)
+    except Exception:
+        os.remove(output_path)
+        raise
+
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    print(
+        f"🎚️ Preprocessed streamed {name} [{codec} {PREPROCESS_BITRATE}]: {size_mb:.2f} MB "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return output_path
@@ -0,0 +1,326 @@
+# 📦 Standard Libraries
+import os
+import re
+import sys
+import json
+import time
+import tempfile
+import threading
+import subprocess
+from dotenv import load_dotenv
+
+# 🧩 Shared helpers
+from common.profiler import stage
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Splitter settings (Whisper rejects uploads over 25 MB, keep a safety margin)
+SPLIT_TARGET_BYTES = int(os.getenv("SPLIT_TARGET_BYTES", str(24 * 1024 * 1024)))
+SPLIT_MAX_CHUNK_SECONDS = float(os.getenv("SPLIT_MAX_CHUNK_SECONDS", "0"))  # 0 = no cap
+SPLIT_STREAM_COPY = os.getenv("SPLIT_STREAM_COPY", "true").lower() == "true"
+SPLIT_ON_SILENCE = os.getenv("SPLIT_ON_SILENCE", "false").lower() == "true"
+SPLIT_REENCODE_BITRATE = os.getenv("SPLIT_REENCODE_BITRATE", "64k")
+
+# 🔇 Silence detection settings (used to avoid cutting words at chunk boundaries)
+SILENCE_NOISE_DB = int(os.getenv("SILENCE_NOISE_DB", "-30"))
+SILENCE_MIN_SECONDS = float(os.getenv("SILENCE_MIN_SECONDS", "0.5"))
+SILENCE_SEARCH_WINDOW_SECONDS = float(os.getenv("SILENCE_SEARCH_WINDOW_SECONDS", "30"))
+
+# 🎼 Codecs that can be cut without re-encoding, and the chunk extension to use
+STREAM_COPY_EXTENSIONS = {
+    "aac": ".m4a",
+    "alac": ".m4a",
+    "mp3": ".mp3",
+    "opus": ".ogg",
+    "vorbis": ".ogg",
+    "flac": ".flac",
+}
+
+# 📦 Headroom for container overhead and VBR peaks when sizing chunks
+SIZE_HEADROOM = 0.92
+
+
+# ▶️ Run an ffmpeg/ffprobe command and return (stderr text, peak child RSS in MB)
+#    `input_chunks` (iterable of bytes) is fed to the command's stdin from a background thread
+def run_ffmpeg(args, input_chunks=None):
+    feed_errors = []
+
+    def feed(stdin):
+        try:
+            for chunk in input_chunks:
+                stdin.write(chunk)
+        except BrokenPipeError:
+            pass  # ffmpeg exited early, its own error is reported below
+        except Exception as e:
+            feed_errors.append(e)
+        finally:
+            try:
+                stdin.close()
+            except BrokenPipeError:
+                pass
+
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE if input_chunks is not None else None,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+        )
+        feeder = None
+        if input_chunks is not None:
+            feeder = threading.Thread(target=feed, args=(process.stdin,), daemon=True)
+            feeder.start()
+
+        # 📏 wait4 gives resource usage for this one child (POSIX only)
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+            peak_rss_mb = usage.ru_maxrss / divisor
+        else:
+            process.wait()
+            peak_rss_mb = None
+        if feeder is not None:
+            feeder.join()
+
+        stderr_file.seek(0)
+        stderr_text = stderr_file.read().decode("utf-8", errors="replace")
+
+    if feed_errors:
+        raise feed_errors[0]
+    if process.returncode != 0:
+        raise RuntimeError(f"{args[0]} failed ({process.returncode}): {stderr_text[-500:]}")
+    return stderr_text, peak_rss_mb
+
+
+# 🔍 Read duration, bitrate and codec from the container headers (no decoding).
+#    With `audio_bytes` the in-memory recording is probed through ffprobe's stdin instead
+#    of a file; a pipe can't be seeked, so a missing duration is estimated from the bitrate.
+def probe_audio(audio_path, audio_bytes=None):
+    output = subprocess.run(
+        [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "format=duration,bit_rate,size:stream=codec_name,bit_rate",
+            "-of", "json",
+            "pipe:0" if audio_bytes is not None else audio_path,
+        ],
+        input=audio_bytes,
+        capture_output=True,
+        check=True,
+    ).stdout
+    data = json.loads(output)
+    fmt = data.get("format", {})
+    stream = (data.get("streams") or [{}])[0]
+
+    duration = float(fmt.get("duration") or 0)
+    size = int(fmt.get("size") or (len(audio_bytes) if audio_bytes is not None else os.path.getsize(audio_path)))
+    bit_rate = stream.get("bit_rate") or fmt.get("bit_rate")
+    if bit_rate:
+        bit_rate = int(bit_rate)
+        duration = duration or size * 8 / bit_rate
+    elif duration:
+        bit_rate = int(size * 8 / duration)
+
+    return {
+        "duration": duration,
+        "size": size,
+        "bit_rate": bit_rate or 0,
+        "codec": stream.get("codec_name", ""),
+    }
+
+
+# 🔇 Stream the file through ffmpeg's silencedetect filter and return [(start, end), ...]
+def detect_silences(
+    audio_path, noise_db=SILENCE_NOISE_DB, min_silence=SILENCE_MIN_SECONDS
+):
+    stderr_text, _ = run_ffmpeg(
+        [
+            "ffmpeg",
+            "-nostats",
+            "-hide_banner",
+            "-i", audio_path,
+            "-af", f"silencedetect=noise={noise_db}dB:d={min_silence}",
+            "-f", "null",
+            "-",
+        ]
+    )
+
+    silences = []
+    start = None
+    for line in stderr_text.splitlines():
+        start_match = re.search(r"silence_start: (-?[\d.]+)", line)
+        end_match = re.search(r"silence_end: ([\d.]+)", line)
+        if start_match:
+            start = max(0.0, float(start_match.group(1)))
+        elif end_match and start is not None:
+            silences.append((start, float(end_match.group(1))))
+            start = None
+    return silences
+
+
+# ✂️ Pick cut times every `segment_seconds`, pulled back to the nearest silence when possible
+def plan_cut_points(
+    duration, segment_seconds, silences=None, window=SILENCE_SEARCH_WINDOW_SECONDS
+):
+    midpoints = [(start + end) / 2 for start, end in (silences or [])]
+    cuts = []
+    last_cut = 0.0
+
+    while duration - last_cut > segment_seconds:
+        target = last_cut + segment_seconds
+
+        # Only look backwards so a chunk never grows past its size budget
+        candidates = [m for m in midpoints if target - window <= m <= target and m > last_cut]
+        cut = max(candidates) if candidates else target
+
+        cuts.append(round(cut, 3))
+        last_cut = cut
+
+    return cuts
+
+
+# 🎧 Split audio into size-targeted chunks, streaming through ffmpeg (returns chunks + report)
+def split_audio_with_report(
+    audio_path,
+    target_bytes=SPLIT_TARGET_BYTES,
+    max_chunk_seconds=SPLIT_MAX_CHUNK_SECONDS,
+    stream_copy=SPLIT_STREAM_COPY,
+    split_on_silence=SPLIT_ON_SILENCE,
+):
+    started = time.perf_counter()
+    info = probe_audio(audio_path)
+
+    # 🎼 Stream copy when the codec allows it, otherwise re-encode to fixed-bitrate MP3
+    extension = STREAM_COPY_EXTENSIONS.get(info["codec"]) if stream_copy else None
+    if extension and info["bit_rate"]:
+        codec_args = ["-c", "copy"]
+        bytes_per_second = info["bit_rate"] / 8
+        mode = "copy"
+    else:
+        extension = ".mp3"
+        codec_args = ["-c:a", "libmp3lame", "-b:a", SPLIT_REENCODE_BITRATE]
+        bytes_per_second = int(SPLIT_REENCODE_BITRATE.rstrip("k")) * 1000 / 8
+        mode = "mp3"
+
+    segment_seconds = target_bytes * SIZE_HEADROOM / bytes_per_second
+    if max_chunk_seconds:
+        segment_seconds = min(segment_seconds, max_chunk_seconds)
+
+    silences = detect_silences(audio_path) if split_on_silence else None
+    cuts = plan_cut_points(info["duration"], segment_seconds, silences)
+
+    peak_rss_mb = None
+    if not cuts and mode == "copy" and info["size"] <= target_bytes:
+        # Already fits in one request, nothing to do
+        chunks = [audio_path]
+    else:
+        pattern = f"{audio_path}_part%03d{extension}"
+        segment_args = ["-segment_times", ",".join(str(c) for c in cuts)] if cuts else []
+        _, peak_rss_mb = run_ffmpeg(
+            [
+                "ffmpeg",
+                "-nostats",
+                "-hide_banner",
+                "-y",
+                "-i", audio_path,
+                "-map", "0:a:0",
+                "-vn",
+                *codec_args,
+                "-f", "segment",
+                *segment_args,
+                "-reset_timestamps", "1",
+                pattern,
+            ]
+        )
+        chunks = [pattern % index for index in range(len(cuts) + 1)]
+        chunks = [chunk for chunk in chunks if os.path.exists(chunk)]
+
+    # 📏 The copy-mode estimate uses the audio bitrate only: a video track, a wrong header
+    #    bitrate or VBR peaks can still leave a chunk over the limit, so re-encode instead
+    if mode == "copy" and any(os.path.getsize(chunk) > target_bytes for chunk in chunks):
+        print(f"⚠️ Stream-copied chunk over {target_bytes / (1024*1024):.0f} MB, re-encoding instead...")
+        for chunk in chunks:
+            if chunk != audio_path:
+                os.remove(chunk)
+        chunks, report = split_audio_with_report(
+            audio_path, target_bytes, max_chunk_seconds, stream_copy=False, split_on_silence=split_on_silence
+        )
+        report["split_seconds"] = round(time.perf_counter() - started, 2)
+        return chunks, report
+
+    report = {
+        "file": os.path.basename(audio_path),
+        "mode": mode,
+        "chunks": len(chunks),
+        "duration_seconds": round(info["duration"], 1),
+        "split_seconds": round(time.perf_counter() - started, 2),
+        "peak_rss_mb": round(peak_rss_mb, 1) if peak_rss_mb is not None else None,
+        "silence_aware": bool(split_on_silence),
+    }
+    return chunks, report
+
+
+# ✂️ Split audio into chunks that fit Whisper's upload limit (prints the split report)
+def split_audio(audio_path, **options):
+    with stage("audio.split"):
+        chunks, report = split_audio_with_report(audio_path, **options)
+    print(
+        f"✂️ Split {report['file']} into {report['chunks']} chunk(s) "
+        f"[{report['mode']}] in {report['split_seconds']}s, "
+        f"peak memory {report['peak_rss_mb']} MB"
+    )
+    return chunks
+
+
+# 🌊 Split audio that arrives as a stream of byte chunks (e.g. straight from Drive) without
+#    writing the source to disk. A pipe cannot be probed or seeked, so chunks are re-encoded
+#    to fixed-bitrate MP3 and cut every N seconds. MP4/M4A files only stream when the moov
+#    atom comes first ("faststart"); otherwise ffmpeg fails and the caller downloads instead.
+def split_audio_stream(
+    byte_chunks,
+    name="stream",
+    target_bytes=SPLIT_TARGET_BYTES,
+    max_chunk_seconds=SPLIT_MAX_CHUNK_SECONDS,
+):
+    started = time.perf_counter()
+    bytes_per_second = int(SPLIT_REENCODE_BITRATE.rstrip("k")) * 1000 / 8
+    segment_seconds = target_bytes * SIZE_HEADROOM / bytes_per_second
+    if max_chunk_seconds:
+        segment_seconds = min(segment_seconds, max_chunk_seconds)
+
+    output_dir = tempfile.mkdtemp(prefix="split-")
+    pattern = os.path.join(output_dir, "part%03d.mp3")
+    try:
+        with stage("audio.split"):
+            _, peak_rss_mb = run_ffmpeg(
+                [
+                    "ffmpeg",
+                    "-nostats",
+                    "-hide_banner",
+                    "-y",
+                    "-i", "pipe:0",
+                    "-map", "0:a:0",
+                    "-vn",
+                    "-c:a", "libmp3lame", "-b:a", SPLIT_REENCODE_BITRATE,
+                    "-f", "segment",
+                    "-segment_time", str(segment_seconds),
+                    "-reset_timestamps", "1",
+                    pattern,
+                ],
+                input_chunks=byte_chunks,
+            )
+    except Exception:
+        for leftover in os.listdir(output_dir):
+            os.remove(os.path.join(output_dir, leftover))
+        os.rmdir(output_dir)
+        raise
+
+    chunks = sorted(os.path.join(output_dir, chunk) for chunk in os.listdir(output_dir))
+    print(
+        f"✂️ Split streamed {name} into {len(chunks)} chunk(s) [mp3] in "
+        f"{time.perf_counter() - started:.2f}s, peak memory {round(peak_rss_mb or 0, 1)} MB"
+    )
+    return chunks
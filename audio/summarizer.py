@@ -0,0 +1,302 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from audio.utils import extract_json_block
+from common.openai_client import cached_chat, request_missing_sections
+from common.map_reduce import needs_map_reduce, map_reduce, reduce_partials, MAP_CONCURRENCY
+from common.tokens import TokenUsage, count_tokens
+from common.metrics import fit_to_budget, submit_in_context
+
+# 🤖 Model settings (also part of the response cache key)
+OPENAI_MODEL = "gpt-4.1-2025-04-14"
+TEMPERATURE = 0.3  # Low temperature = more consistent and factual output
+
+# 📜 System prompt that instructs GPT to act as a business analyst and return a JSON object
+SYSTEM_PROMPT = """
+You are an expert business analyst. You will be given a raw transcript from a client-agency meeting.
+
+Your task is to extract a comprehensive and structured summary in JSON format using the schema below.
+
+Please follow these guidelines strictly:
+- Be concise but informative. Ensure each bullet is standalone and easy to understand.
+- Use consistent formatting (no sentence fragments; start with verbs where applicable).
+- For To-Do items, include responsible parties and estimated deadlines if mentioned or inferable.
+- Include actionable insights and KPIs if discussed.
+- Maintain professional tone. Avoid repetition.
+
+Return **only valid JSON** with no extra text, markdown, or explanation.
+
+Schema:
+{
+  "mom": ["<Key discussion points and agreements>", "..."],
+  "todo_list": ["<Actionable task with responsible person and timeframe, if known>", "..."],
+  "action_plan": {
+    "decision_made": ["<Key decisions taken>", "..."],
+    "key_services_to_promote": ["<Service list>", "..."],
+    "target_geography": ["<Location list>", "..."],
+    "budget_and_timeline": ["<Budget, timeline details>", "..."],
+    "lead_management_strategy": ["<Lead handling strategy>", "..."],
+    "next_steps_and_ownership": ["<Task and responsible person>", "..."]
+  }
+}
+"""
+
+# 🔗 Prompt used to merge partial summaries of consecutive transcript segments
+MERGE_PROMPT = """
+You are an expert business analyst. You will be given several partial JSON summaries, each covering a consecutive segment of the same client-agency meeting.
+
+Merge them into ONE summary that uses exactly the same schema as the partial summaries.
+
+Please follow these guidelines strictly:
+- Keep every distinct fact, decision, task and owner; merge duplicates and near-duplicates into a single bullet.
+- Resolve contradictions in favour of the later segment.
+- Keep bullets concise, standalone and professional.
+
+Return **only valid JSON** with no extra text, markdown, or explanation.
+"""
+
+
+# 📐 Fields every meeting summary must have (all lists of strings)
+MEETING_FIELDS = ["mom", "todo_list"]
+ACTION_PLAN_FIELDS = [
+    "decision_made",
+    "key_services_to_promote",
+    "target_geography",
+    "budget_and_timeline",
+    "lead_management_strategy",
+    "next_steps_and_ownership",
+]
+
+# 🩹 Follow-up prompt when an answer left fields out (only those fields are regenerated)
+MEETING_FILL_PROMPT = """
+Your JSON is missing these fields: {fields}.
+
+Return **only valid JSON** containing just those fields, using the same schema as before (fields written as action_plan.<name> go inside an "action_plan" object).
+"""
+
+
+# 📐 Coerce a parsed answer into the meeting schema and list the fields it is missing
+def normalize_meeting_summary(data):
+    def as_list(value):
+        if isinstance(value, str):
+            return [value] if value.strip() else []
+        if isinstance(value, list):
+            return [str(item) for item in value if item not in (None, "")]
+        return None
+
+    summary = {}
+    missing = []
+    for field in MEETING_FIELDS:
+        summary[field] = as_list(data.get(field))
+        if summary[field] is None:
+            missing.append(field)
+
+    action_plan = data.get("action_plan") if isinstance(data.get("action_plan"), dict) else {}
+    summary["action_plan"] = {}
+    for field in ACTION_PLAN_FIELDS:
+        value = as_list(action_plan.get(field, data.get(f"action_plan.{field}")))
+        summary["action_plan"][field] = value
+        if value is None:
+            missing.append(f"action_plan.{field}")
+    return summary, missing
+
+
+# 🩹 Regenerate only the missing fields (one follow-up call); anything still missing is left empty
+def complete_meeting_summary(messages, data, usage=None, fill=True):
+    summary, missing = normalize_meeting_summary(data)
+    if missing and fill:
+        print(f"🩹 Meeting summary missing {missing}, requesting only those fields...")
+        fill = request_missing_sections(
+            OPENAI_MODEL,
+            messages,
+            TEMPERATURE,
+            data,
+            MEETING_FILL_PROMPT.format(fields=", ".join(missing)),
+            namespace="meeting-fill",
+            template=MEETING_FILL_PROMPT,
+            usage=usage,
+        )
+        filled, _ = normalize_meeting_summary(fill)
+        for field in missing:
+            if field.startswith("action_plan."):
+                name = field.split(".", 1)[1]
+                summary["action_plan"][name] = filled["action_plan"][name]
+            else:
+                summary[field] = filled[field]
+
+    # Still missing after the follow-up: empty list, so the document can always be rendered
+    for field in MEETING_FIELDS:
+        summary[field] = summary[field] or []
+    for field in ACTION_PLAN_FIELDS:
+        summary["action_plan"][field] = summary["action_plan"][field] or []
+    return summary
+
+
+# 🧩 Summarize one transcript (or transcript segment) into the meeting schema
+def summarize_transcript_piece(transcript_text, usage=None, stage="single"):
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},     # System-level instructions
+        {"role": "user", "content": transcript_text},     # Actual input transcript
+    ]
+    data = cached_chat(
+        OPENAI_MODEL,
+        messages,
+        TEMPERATURE,
+        parse=extract_json_block,
+        namespace="meeting",
+        template=SYSTEM_PROMPT,
+        usage=usage,
+        stage=stage,
+    )
+    # Map pieces only cover part of the input, so gaps are left for the merge step to fill
+    return complete_meeting_summary(messages, data, usage, fill=stage != "map")
+
+
+# 🔗 Merge partial meeting summaries into one summary with the same schema
+def merge_meeting_summaries(partials, usage=None):
+    messages = [
+        {"role": "system", "content": MERGE_PROMPT},
+        {"role": "user", "content": json.dumps(partials, ensure_ascii=False, indent=2)},
+    ]
+    data = cached_chat(
+        OPENAI_MODEL,
+        messages,
+        TEMPERATURE,
+        parse=extract_json_block,
+        namespace="meeting-merge",
+        template=MERGE_PROMPT,
+        usage=usage,
+        stage="reduce",
+    )
+    return complete_meeting_summary(messages, data, usage)
+
+
+# 🧠 Generates a structured summary from meeting transcript using OpenAI GPT
+def generate_summary(transcript_text):
+    usage = TokenUsage()
+
+    # 💰 Trim the transcript up front if the row/run budget can't cover all of it
+    transcript_text = fit_to_budget(
+        transcript_text, OPENAI_MODEL, overhead_tokens=count_tokens(SYSTEM_PROMPT)
+    )
+
+    # 🗺️ Long meetings are summarized segment by segment in parallel, then merged
+    if needs_map_reduce(transcript_text):
+        summary = map_reduce(
+            transcript_text,
+            map_fn=lambda piece: summarize_transcript_piece(piece, usage, stage="map"),
+            reduce_fn=lambda partials: merge_meeting_summaries(partials, usage),
+        )
+    else:
+        summary = summarize_transcript_piece(transcript_text, usage)
+
+    print(f"🔢 Meeting summary tokens: {usage.summary()}")
+    return summary
+
+
+# 📄 A meeting summary with every field empty
+def empty_meeting_summary():
+    summary = {field: [] for field in MEETING_FIELDS}
+    summary["action_plan"] = {field: [] for field in ACTION_PLAN_FIELDS}
+    return summary
+
+
+# 🧺 Fold a partial summary into `folded` (in place): lists are appended in order and
+#    bullets already present (ignoring case and spacing) are skipped, so folding the same
+#    partials in the same order always gives the same notes, without an API call
+def fold_meeting_summary(folded, partial):
+    def extend(target, items):
+        seen = {" ".join(item.lower().split()) for item in target}
+        for item in items:
+            key = " ".join(item.lower().split())
+            if key not in seen:
+                seen.add(key)
+                target.append(item)
+
+    for field in MEETING_FIELDS:
+        extend(folded[field], partial[field])
+    for field in ACTION_PLAN_FIELDS:
+        extend(folded["action_plan"][field], partial["action_plan"][field])
+    return folded
+
+
+# 🌊 Summarizes a split recording while it is still being transcribed: add() (the
+#    transcribe_chunks callback) starts a summary of each chunk as soon as its transcript
+#    arrives, finished chunks are folded into running notes in chunk order (progress), and
+#    finish() only has to wait for the last chunk and merge the chunk summaries: one call
+#    when they fit in a reduce prompt, a budgeted tree-reduce for long meetings.
+class StreamingSummarizer:
+    def __init__(self, max_workers=MAP_CONCURRENCY):
+        self.usage = TokenUsage()
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        self.lock = threading.Lock()
+        self.futures = {}
+        self.total = 0
+        self.partials = {}  # Finished chunks waiting for an earlier one
+        self.chunk_summaries = {}
+        self.folded = empty_meeting_summary()
+        self.folded_chunks = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # On failure, chunk summaries that have not started yet are dropped
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    # 📥 One chunk transcript is ready
+    def add(self, index, total, transcript):
+        if total < 2:
+            return  # A recording sent to Whisper in one piece is summarized as a whole
+        self.total = total
+        self.futures[index] = submit_in_context(self.executor, self.summarize_chunk, index, transcript)
+
+    def summarize_chunk(self, index, transcript):
+        partial = empty_meeting_summary()
+        if transcript.strip():
+            transcript = fit_to_budget(
+                transcript, OPENAI_MODEL, overhead_tokens=count_tokens(SYSTEM_PROMPT)
+            )
+            if needs_map_reduce(transcript):
+                partial = map_reduce(
+                    transcript,
+                    map_fn=lambda piece: summarize_transcript_piece(piece, self.usage, stage="map"),
+                    reduce_fn=lambda partials: merge_meeting_summaries(partials, self.usage),
+                )
+            else:
+                partial = summarize_transcript_piece(transcript, self.usage, stage="map")
+        self.collect(index, partial)
+        return partial
+
+    # 🧺 Fold every finished chunk that continues the folded prefix into the running notes
+    def collect(self, index, partial):
+        with self.lock:
+            self.chunk_summaries[index] = partial
+            self.partials[index] = partial
+            folded_before = self.folded_chunks
+            while self.folded_chunks in self.partials:
+                fold_meeting_summary(self.folded, self.partials.pop(self.folded_chunks))
+                self.folded_chunks += 1
+            if self.folded_chunks > folded_before:
+                print(
+                    f"📝 Notes so far (chunks 1-{self.folded_chunks} of {self.total}): "
+                    f"{len(self.folded['mom'])} MoM point(s), {len(self.folded['todo_list'])} to-do(s)"
+                )
+
+    # 🏁 Summary of the whole recording. If its chunks were not streamed in (transcript
+    #    cache hit, single upload, resumed job), the transcript is summarized as usual.
+    def finish(self, transcript):
+        if not self.total or len(self.futures) < self.total:
+            return generate_summary(transcript)
+
+        for index in sorted(self.futures):
+            self.futures[index].result()  # Re-raises a failed chunk summary
+
+        print(f"🔗 Merging the summaries of {self.total} chunk(s)...")
+        summary = reduce_partials(
+            [self.chunk_summaries[index] for index in range(self.total)],
+            lambda partials: merge_meeting_summaries(partials, self.usage),
+            executor=self.executor,
+        )
+        print(f"🔢 Meeting summary tokens: {self.usage.summary()}")
+        return summary
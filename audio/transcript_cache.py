@@ -0,0 +1,133 @@
+# 📦 Standard Libraries
+import os
+import hashlib
+import threading
+from dotenv import load_dotenv
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Cache location and size budget (least recently used entries are evicted first)
+TRANSCRIPT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", ".cache/transcripts")
+TRANSCRIPT_CACHE_MAX_BYTES = int(
+    os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(200 * 1024 * 1024))
+)
+
+
+# 🔑 SHA-256 of a file's content, read in 1 MB blocks
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# 🗃️ On-disk transcript store keyed by audio content hash + model + task
+class TranscriptCache:
+    def __init__(self, directory=TRANSCRIPT_CACHE_DIR, max_bytes=TRANSCRIPT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = None  # Scanned once on the first write, then tracked per write
+
+    # 🔑 Build the cache key for an audio hash transcribed with a given model/task
+    def make_key(self, content_hash, model, task):
+        return hashlib.sha256(f"{content_hash}:{model}:{task}".encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.txt")
+
+    # 📥 Return the cached transcript, or None on a miss
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            with self.lock:
+                self.misses += 1
+            return None
+
+        with self.lock:
+            self.hits += 1
+            # Touch the entry so LRU eviction keeps recently used transcripts
+            # (an eviction in another process may already have removed it)
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+        return text
+
+    # 💾 Store a transcript atomically; the directory is only rescanned and trimmed once
+    #    the running total crosses the size budget
+    def set(self, key, text):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+        with self.lock:
+            if self.total_bytes is None:
+                self.total_bytes = sum(size for _, size, _ in self._entries())
+            try:
+                self.total_bytes -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            self.total_bytes += os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    # 📂 (mtime, size, path) of every cached transcript
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".txt"):
+                    full_path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(full_path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, full_path))
+        return entries
+
+    # 🧹 Remove least recently used entries until the cache is back under 90% of max_bytes
+    #    (the headroom keeps a full cache from rescanning the directory on every write)
+    def evict(self):
+        with self.lock:
+            self._evict()
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, full_path in sorted(entries):
+            if total <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(full_path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self.total_bytes = total
+
+    # 📊 Hit/miss statistics for the current process
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+# 🌍 Shared cache instance used by the transcription module
+transcript_cache = TranscriptCache()
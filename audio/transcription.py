@@ -0,0 +1,239 @@
+import os
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from audio.config import TRANSCRIBE_CONCURRENCY, TRANSCRIBE_RETRIES
+from audio.splitter import split_audio, split_audio_stream, probe_audio
+from audio.preprocess import preprocess_audio, preprocess_audio_stream, AUDIO_PREPROCESS
+from audio.transcript_cache import transcript_cache, hash_file
+from audio.drive_utils import get_file_metadata, iter_drive_file, shared_download
+from common.openai_client import transcribe, RETRYABLE_ERRORS
+from common.metrics import submit_in_context, audio_budget_active, BudgetExceeded
+
+# 🎙️ Whisper settings (also part of the transcript cache key)
+WHISPER_MODEL = "whisper-1"
+WHISPER_TASK = "translate"
+
+# 📏 Whisper rejects uploads over 25 MB
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+# ⏱️ Duration in seconds (0 when ffprobe is unavailable, so only the budget check is skipped)
+def get_audio_seconds(audio_path):
+    try:
+        return probe_audio(audio_path)["duration"]
+    except Exception:
+        return 0.0
+
+
+# ⏱️ Duration of an in-memory recording: Drive's own figure for video containers, otherwise
+#    ffprobe reads the buffer from a pipe, and only when an audio budget needs the number
+def get_buffer_seconds(audio_bytes, metadata):
+    duration_ms = (metadata.get("videoMediaMetadata") or {}).get("durationMillis")
+    if duration_ms:
+        return int(duration_ms) / 1000
+    if not audio_budget_active():
+        return 0.0
+    try:
+        return probe_audio(metadata["name"], audio_bytes)["duration"]
+    except Exception:
+        return 0.0
+
+
+# 🎧 Transcribe an audio file to English text using OpenAI Whisper API
+def transcribe_audio(audio_path, content_hash=None):
+    # 🗃️ Skip Whisper entirely if this exact audio was transcribed before
+    content_hash = content_hash or hash_file(audio_path)
+    cache_key = transcript_cache.make_key(content_hash, WHISPER_MODEL, WHISPER_TASK)
+    cached = transcript_cache.get(cache_key)
+    if cached is not None:
+        print("🗃️ Transcript cache hit, skipping Whisper.")
+        return cached
+
+    print("🎙️ Transcribing with OpenAI Whisper API...")
+
+    # ⏱️ Audio length drives Whisper cost (checked against the budget before sending)
+    audio_seconds = get_audio_seconds(audio_path)
+
+    # 📂 Open the audio file in binary read mode
+    with open(audio_path, "rb") as audio_file:
+        # 📡 Send the audio to OpenAI Whisper for transcription
+        response = transcribe(
+            audio_file,                # Audio file stream
+            model=WHISPER_MODEL,       # Whisper model for audio-to-text
+            task=WHISPER_TASK,         # Auto-translates non-English to English
+            response_format="text",    # Return plain text response
+            audio_seconds=audio_seconds,
+        )
+
+    # 🧾 Cache and return the transcribed text, stripped of extra whitespace
+    text = response.strip()
+    transcript_cache.set(cache_key, text)
+    return text
+
+
+# 🔁 Transcribe a single chunk, retrying only this chunk if it fails
+#    (rate limits / timeouts are already retried with backoff inside the OpenAI client)
+def transcribe_chunk_with_retry(index, chunk_path, retries=TRANSCRIBE_RETRIES):
+    for attempt in range(retries + 1):
+        try:
+            return transcribe_audio(chunk_path)
+        except (BudgetExceeded,) + RETRYABLE_ERRORS:
+            raise
+        except Exception as e:
+            if attempt == retries:
+                raise
+            wait_seconds = 2**attempt
+            print(f"⚠️ Chunk {index} failed ({e}), retrying in {wait_seconds}s...")
+            time.sleep(wait_seconds)
+
+
+# ⚡ Transcribe chunks concurrently and return the transcripts in chunk order.
+#    on_transcript(index, total, text) is called as each chunk finishes (in completion order),
+#    so the caller can start working on it while the other chunks are still transcribing.
+def transcribe_chunks(
+    chunk_paths, max_workers=TRANSCRIBE_CONCURRENCY, retries=TRANSCRIBE_RETRIES, on_transcript=None
+):
+    transcripts = [None] * len(chunk_paths)
+    if not chunk_paths:
+        return transcripts
+
+    workers = max(1, min(max_workers, len(chunk_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            submit_in_context(executor, transcribe_chunk_with_retry, index, path, retries): index
+            for index, path in enumerate(chunk_paths)
+        }
+
+        # 🧩 Slot each transcript back into its original position as it arrives
+        for future in as_completed(futures):
+            index = futures[future]
+            transcripts[index] = future.result()
+            if on_transcript:
+                on_transcript(index, len(chunk_paths), transcripts[index])
+
+    return transcripts
+
+
+# 🎧 Transcribe one local file: whole when it fits in a Whisper request, otherwise in chunks
+#    (on_transcript only fires for split files, see transcribe_chunks)
+def transcribe_file(audio_path, content_hash=None, on_transcript=None):
+    file_size_bytes = os.path.getsize(audio_path)
+    if file_size_bytes <= MAX_UPLOAD_BYTES:
+        print(
+            f"ℹ️ Audio file size {file_size_bytes / (1024*1024):.2f} MB is under 25 MB, processing whole file."
+        )
+        return transcribe_audio(audio_path, content_hash=content_hash)
+
+    print(
+        f"⚠️ Audio file size {file_size_bytes / (1024*1024):.2f} MB exceeds 25 MB, splitting..."
+    )
+    chunks = split_audio(audio_path)
+    try:
+        transcripts = transcribe_chunks(chunks, on_transcript=on_transcript)
+    finally:
+        # Clean up chunk files (never the file that was split)
+        for chunk_file in chunks:
+            if chunk_file != audio_path and os.path.exists(chunk_file):
+                os.remove(chunk_file)
+    return "\n".join(transcripts)
+
+
+# 🎧 Transcribe a full recording: preprocessed for speech first (mono, 16 kHz, low bitrate,
+#    long silences cut), then sent whole or split if it is still over Whisper's upload limit.
+#    If preprocessing fails (e.g. no ffmpeg), the original file is used.
+def transcribe_recording(audio_path, on_transcript=None):
+    # 🗃️ A re-run of the same recording skips splitting and Whisper altogether
+    content_hash = hash_file(audio_path)
+    recording_key = transcript_cache.make_key(
+        content_hash, WHISPER_MODEL, f"{WHISPER_TASK}:recording"
+    )
+    cached = transcript_cache.get(recording_key)
+    if cached is not None:
+        print("🗃️ Transcript cache hit for full recording, skipping Whisper.")
+        return cached
+
+    processed_path = None
+    if AUDIO_PREPROCESS:
+        try:
+            processed_path = preprocess_audio(audio_path)
+        except Exception as e:
+            print(f"⚠️ Audio preprocessing failed ({str(e)[-120:]}), sending the original file...")
+
+    if processed_path:
+        try:
+            text = transcribe_file(processed_path, on_transcript=on_transcript)
+        finally:
+            os.remove(processed_path)
+    else:
+        text = transcribe_file(audio_path, content_hash, on_transcript)
+
+    transcript_cache.set(recording_key, text)
+    return text
+
+
+# 🌊 Transcribe a Drive recording without saving the whole file first: with
+#    AUDIO_PREPROCESS it is piped through the preprocessor and only the (small) speech
+#    encoding is written; otherwise under 25 MB it goes from Drive to Whisper in memory
+#    and larger files are piped into the splitter. Drive's md5Checksum doubles as the
+#    cache key, so a re-run of the same recording skips the download too.
+def transcribe_drive_recording(file_id, metadata=None, on_transcript=None):
+    metadata = metadata or get_file_metadata(file_id)
+    content_hash = f"md5:{metadata['md5Checksum']}" if metadata.get("md5Checksum") else None
+    recording_key = None
+    if content_hash:
+        recording_key = transcript_cache.make_key(
+            content_hash, WHISPER_MODEL, f"{WHISPER_TASK}:recording"
+        )
+        cached = transcript_cache.get(recording_key)
+        if cached is not None:
+            print("🗃️ Transcript cache hit for full recording, skipping download and Whisper.")
+            return cached
+
+    file_size_bytes = int(metadata.get("size") or 0)
+    if AUDIO_PREPROCESS:
+        print(f"🌊 Streaming {metadata['name']} from Drive into the preprocessor...")
+        try:
+            processed_path = preprocess_audio_stream(iter_drive_file(file_id, metadata), metadata["name"])
+        except RuntimeError as e:
+            # Not streamable (e.g. M4A with the index at the end): fall back to a file download
+            print(f"⚠️ Streaming preprocess failed ({str(e)[-120:]}), downloading instead...")
+            with shared_download(file_id, metadata) as audio_path:
+                return transcribe_recording(audio_path, on_transcript)
+        try:
+            text = transcribe_file(processed_path, on_transcript=on_transcript)
+        finally:
+            os.remove(processed_path)
+    elif file_size_bytes and file_size_bytes <= MAX_UPLOAD_BYTES:
+        print(f"🌊 Streaming {metadata['name']} ({file_size_bytes / (1024*1024):.2f} MB) to Whisper in memory...")
+        audio_bytes = b"".join(iter_drive_file(file_id, metadata))
+        audio_file = io.BytesIO(audio_bytes)
+        audio_file.name = metadata["name"]  # Whisper uses the extension to detect the format
+        text = transcribe(
+            audio_file,
+            model=WHISPER_MODEL,
+            task=WHISPER_TASK,
+            response_format="text",
+            audio_seconds=get_buffer_seconds(audio_bytes, metadata),
+        ).strip()
+    else:
+        print(f"🌊 Streaming {metadata['name']} from Drive into the splitter...")
+        try:
+            chunks = split_audio_stream(iter_drive_file(file_id, metadata), metadata["name"])
+        except RuntimeError as e:
+            # Not streamable (e.g. M4A with the index at the end): fall back to a file download
+            print(f"⚠️ Streaming split failed ({str(e)[-120:]}), downloading instead...")
+            with shared_download(file_id, metadata) as audio_path:
+                return transcribe_recording(audio_path, on_transcript)
+        try:
+            text = "\n".join(transcribe_chunks(chunks, on_transcript=on_transcript))
+        finally:
+            for chunk_file in chunks:
+                if os.path.exists(chunk_file):
+                    os.remove(chunk_file)
+            if chunks:
+                os.rmdir(os.path.dirname(chunks[0]))
+
+    if recording_key:
+        transcript_cache.set(recording_key, text)
+    return text
@@ -0,0 +1,15 @@
+from common.json_repair import parse_json_object
+
+
+# 🔍 Extracts the JSON object from a text response (commonly from GPT/OpenAI)
+def extract_json_block(text):
+
+    # 🧠 Balanced-brace scan + repair of common mistakes (trailing commas, smart quotes, truncation)
+    try:
+        return parse_json_object(text)
+
+    # ❌ Nothing usable in the response: print debug info and re-raise the error
+    except ValueError:
+        print("❌ No valid JSON found in OpenAI response.")
+        print("Raw output:", text)
+        raise
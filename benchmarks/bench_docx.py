@@ -0,0 +1,166 @@
+# ⏱️ DOCX rendering benchmark: python-docx built from scratch vs the template renderer
+#
+# Usage (from the repo root):
+#   python -m benchmarks.bench_docx --docs 200 --bullets 20
+#
+# Renders synthetic website and meeting summaries with the original generators (kept
+# below as the baseline) and with the current ones, reports documents/second and peak
+# memory per document, and checks that both produce the same paragraphs, styles and runs.
+
+# 📦 Standard Libraries
+import io
+import re
+import time
+import random
+import argparse
+import tracemalloc
+
+from docx import Document
+
+from benchmarks.synthetic import make_sentence
+from website.document import create_docx_in_memory
+from audio.doc_generator import generate_docx, ACTION_PLAN_TITLES
+
+
+# 🐢 The original create_docx_in_memory, kept here as the baseline
+def legacy_website_docx(summary_json, document_title):
+    doc = Document()
+    doc.add_heading(document_title, level=0)
+    for section in summary_json.get("sections", []):
+        doc.add_heading(section["heading"], level=1)
+        for line in section["content"].split("\n"):
+            line = line.strip()
+            if line.startswith("- "):
+                line = line[2:].strip()
+                para = doc.add_paragraph(style="List Bullet")
+                parts = re.split(r"(\*\*.*?\*\*)", line)
+                for part in parts:
+                    run = para.add_run()
+                    if part.startswith("**") and part.endswith("**"):
+                        run.text = part[2:-2]
+                        run.bold = True
+                    else:
+                        run.text = part
+            else:
+                doc.add_paragraph(line.strip())
+    doc_stream = io.BytesIO()
+    doc.save(doc_stream)
+    doc_stream.seek(0)
+    return doc_stream
+
+
+# 🐢 The original generate_docx, kept here as the baseline
+def legacy_meeting_docx(summary_data, company_name, meeting_date):
+    doc = Document()
+    doc.add_heading(f"{company_name} Meeting Notes", level=0)
+    doc.add_paragraph(f"Date: {meeting_date}", style="Heading 2").alignment = 2
+    doc.add_heading("1. Minutes of the Meeting (MoM)", level=1)
+    for line in summary_data["mom"]:
+        doc.add_paragraph(line.strip(), style="List Bullet")
+    doc.add_heading("2. To-Do List", level=1)
+    for item in summary_data["todo_list"]:
+        doc.add_paragraph(item.strip(), style="List Bullet")
+    doc.add_heading("3. Action Points / Action Plan", level=1)
+    for key, title in ACTION_PLAN_TITLES.items():
+        doc.add_heading(title, level=2)
+        for item in summary_data["action_plan"].get(key, []):
+            doc.add_paragraph(item.strip(), style="List Bullet")
+    docx_stream = io.BytesIO()
+    doc.save(docx_stream)
+    docx_stream.seek(0)
+    return docx_stream.read()
+
+
+def make_website_summary(rng, bullets):
+    return {
+        "title": "Bench Website Summary",
+        "sections": [
+            {
+                "heading": f"Section {n}",
+                "content": "\n".join(
+                    f"- **{make_sentence(rng, 2)}** {make_sentence(rng)}" for _ in range(bullets)
+                ),
+            }
+            for n in range(8)
+        ],
+    }
+
+
+def make_meeting_summary(rng, bullets):
+    return {
+        "mom": [make_sentence(rng) for _ in range(bullets)],
+        "todo_list": [make_sentence(rng) for _ in range(bullets)],
+        "action_plan": {key: [make_sentence(rng) for _ in range(bullets // 2 or 1)] for key in ACTION_PLAN_TITLES},
+    }
+
+
+# 🔍 (style, alignment, runs) per paragraph, with empty runs dropped and equal runs merged
+def paragraph_signature(docx_bytes):
+    document = Document(io.BytesIO(docx_bytes))
+    signature = []
+    for paragraph in document.paragraphs:
+        runs = []
+        for run in paragraph.runs:
+            if not run.text:
+                continue
+            formatting = (bool(run.bold), bool(run.italic))
+            if runs and runs[-1][1] == formatting:
+                runs[-1] = (runs[-1][0] + run.text, formatting)
+            else:
+                runs.append((run.text, formatting))
+        signature.append((paragraph.style.name, paragraph.alignment, runs))
+    return signature
+
+
+def measure(render, inputs):
+    tracemalloc.start()
+    peaks = []
+    started = time.perf_counter()
+    for item in inputs:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        render(item)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    elapsed = time.perf_counter() - started
+    tracemalloc.stop()
+    return len(inputs) / elapsed, max(peaks) / (1024 * 1024)
+
+
+def as_bytes(output):
+    return output.getvalue() if isinstance(output, io.BytesIO) else output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DOCX rendering benchmark")
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--bullets", type=int, default=12, help="Bullets per section")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    websites = [make_website_summary(rng, args.bullets) for _ in range(args.docs)]
+    meetings = [make_meeting_summary(rng, args.bullets) for _ in range(args.docs)]
+
+    cases = [
+        ("website", websites, lambda s: legacy_website_docx(s, "Bench Website Summary"),
+         lambda s: create_docx_in_memory(s, "Bench Website Summary")),
+        ("meeting", meetings, lambda s: legacy_meeting_docx(s, "Bench", "2026-01-01"),
+         lambda s: generate_docx(s, "Bench", "2026-01-01")),
+    ]
+
+    # ✅ Same paragraphs/styles/runs as the original generators
+    for name, inputs, legacy, current in cases:
+        same = paragraph_signature(as_bytes(legacy(inputs[0]))) == paragraph_signature(as_bytes(current(inputs[0])))
+        print(f"{'✅' if same else '❌'} {name}: output {'matches' if same else 'DIFFERS FROM'} the original generator")
+
+    create_docx_in_memory(websites[0], "Warm-up")  # The base package is built on first use
+    print(f"\n⏱️ {args.docs} document(s) per case, {args.bullets} bullet(s) per section\n")
+    print(f"{'case':<10}{'renderer':<12}{'docs/s':>10}{'peak MB/doc':>14}")
+    for name, inputs, legacy, current in cases:
+        for label, render in (("python-docx", legacy), ("template", current)):
+            docs_per_second, peak_mb = measure(render, inputs)
+            print(f"{name:<10}{label:<12}{docs_per_second:>10.1f}{peak_mb:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# ⏱️ HTML-to-text benchmark: legacy BeautifulSoup path vs the extraction backends
+#
+# Usage (from the repo root):
+#   python -m benchmarks.bench_extract
+#   python -m benchmarks.bench_extract --fixtures path/to/saved/pages --repeat 20
+#
+# Reports mean parse time per page and the token count of the text sent to GPT.
+
+# 📦 Standard Libraries
+import os
+import glob
+import time
+import argparse
+import statistics
+
+from common.tokens import count_tokens
+from website.extract import BACKENDS, lxml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "html")
+
+
+# 🐢 The original extract_text_from_url parsing, kept here as the baseline
+def legacy_html_to_text(html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    for script in soup(["script", "style"]):
+        script.decompose()
+    text = soup.get_text(separator="\n")
+    lines = [line.strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def available_engines():
+    engines = {"legacy (bs4, no cleanup)": legacy_html_to_text}
+    for name, extractor in BACKENDS.items():
+        if name == "lxml" and lxml is None:
+            continue
+        engines[name] = lambda html, extractor=extractor: extractor(html)[0]
+    return engines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML extraction benchmark")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.fixtures, "*.html")))
+    pages = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            pages[os.path.basename(path)] = f.read()
+
+    print(f"⏱️ {len(pages)} fixture(s), {args.repeat} repeat(s) each\n")
+    print(f"{'engine':<26}{'page':<24}{'ms/page':>10}{'tokens':>10}")
+
+    for engine_name, extract in available_engines().items():
+        total_ms = []
+        total_tokens = 0
+        for page_name, html in pages.items():
+            samples = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                text = extract(html)
+                samples.append((time.perf_counter() - started) * 1000)
+            tokens = count_tokens(text)
+            total_ms.append(statistics.mean(samples))
+            total_tokens += tokens
+            print(f"{engine_name:<26}{page_name:<24}{statistics.mean(samples):>10.2f}{tokens:>10}")
+        print(f"{engine_name:<26}{'TOTAL':<24}{sum(total_ms):>10.2f}{total_tokens:>10}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# ⏱️ Per-row Google API setup overhead: per-call build() vs the shared client factory
+#
+# Usage (from the repo root):
+#   python -m benchmarks.bench_google_clients --rows 50
+#
+# Uses GOOGLE_SERVICE_ACCOUNT_FILE when set, otherwise a throwaway key is generated.
+# No requests are sent: this measures credential loading + client construction only,
+# which is the work the old code repeated several times per row.
+
+# 📦 Standard Libraries
+import os
+import json
+import time
+import argparse
+import tempfile
+import statistics
+
+
+# 🔑 Write a throwaway service-account JSON so the benchmark runs without real secrets
+def make_fake_service_account_file(token_uri="https://oauth2.googleapis.com/token"):
+    # cryptography is already required by google-auth, so no extra dependency is needed
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    )
+    info = {
+        "type": "service_account",
+        "project_id": "bench",
+        "private_key_id": "bench",
+        "private_key": private_key.decode("utf-8"),
+        "client_email": "bench@bench.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": token_uri,
+    }
+    handle = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+    json.dump(info, handle)
+    handle.close()
+    return handle.name
+
+
+# 🐢 Old pattern: every helper reloads credentials and calls build()
+def setup_per_call(service_account_file, calls_per_row):
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
+    for _ in range(calls_per_row):
+        credentials = service_account.Credentials.from_service_account_file(
+            service_account_file, scopes=["https://www.googleapis.com/auth/drive"]
+        )
+        build("drive", "v3", credentials=credentials)
+
+
+# 🚀 New pattern: shared credentials/discovery document, one client per thread
+def setup_shared(calls_per_row):
+    from common.google_clients import get_drive_service
+
+    for _ in range(calls_per_row):
+        get_drive_service()
+
+
+def timed(fn, rows):
+    samples = []
+    for _ in range(rows):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def report(label, samples):
+    print(
+        f"{label:<28} mean {statistics.mean(samples):8.2f} ms/row   "
+        f"p50 {statistics.median(samples):8.2f}   max {max(samples):8.2f}   "
+        f"total {sum(samples):9.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Google API client setup benchmark")
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument(
+        "--calls-per-row",
+        type=int,
+        default=4,
+        help="Drive client setups per row in the old code (list, folder name, upload, ...)",
+    )
+    args = parser.parse_args()
+
+    service_account_file = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE")
+    if not service_account_file:
+        service_account_file = make_fake_service_account_file()
+        os.environ["GOOGLE_SERVICE_ACCOUNT_FILE"] = service_account_file
+
+    print(f"⏱️ {args.rows} rows x {args.calls_per_row} Drive client setups per row\n")
+    report(
+        "before: per-call build()",
+        timed(lambda: setup_per_call(service_account_file, args.calls_per_row), args.rows),
+    )
+    report(
+        "after: shared factory",
+        timed(lambda: setup_shared(args.calls_per_row), args.rows),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# ⏱️ OpenAI client benchmark: throughput and retries against the local stub
+#
+# Usage (from the repo root):
+#   python -m benchmarks.bench_openai_client --calls 60 --workers 8 --stub-rpm 30 --error-rate 0.1
+#
+# Starts benchmarks/openai_stub.py in-process, points the client at it and fires
+# concurrent chat calls. With OPENAI_RPM set just under --stub-rpm the limiter keeps
+# the stub from ever returning a rate-limit 429.
+
+# 📦 Standard Libraries
+import os
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI client benchmark (local stub)")
+    parser.add_argument("--calls", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--stub-rpm", type=int, default=30)
+    parser.add_argument("--client-rpm", type=int, default=None, help="Defaults to 90%% of --stub-rpm")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # 🔧 The client reads its settings at import time
+    client_rpm = args.client_rpm if args.client_rpm is not None else int(args.stub_rpm * 0.9)
+    os.environ["OPENAI_API_BASE"] = f"http://127.0.0.1:{args.port}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "stub")
+    os.environ["OPENAI_RPM"] = str(client_rpm)
+    os.environ["OPENAI_BACKOFF_MAX"] = "4"
+    os.environ["MAX_OPENAI_CALLS"] = str(args.workers)
+    os.environ["METRICS_FILE"] = os.path.join(".cache", "metrics", "bench_openai_client.jsonl")
+
+    from benchmarks.openai_stub import start_stub
+    from common.openai_client import chat_completion
+    from common.metrics import run_budget
+
+    server = start_stub(args.port, args.stub_rpm, args.error_rate, args.latency)
+    messages = [{"role": "user", "content": "Summarize: " + "lorem ipsum " * 200}]
+
+    def one_call(_):
+        try:
+            chat_completion("gpt-4.1-2025-04-14", messages, 0.3)
+            return True
+        except Exception as e:
+            print(f"❌ {type(e).__name__}: {e}")
+            return False
+
+    print(f"⏱️ {args.calls} call(s), {args.workers} worker(s), stub {args.stub_rpm} rpm, client {client_rpm} rpm")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        succeeded = sum(executor.map(one_call, range(args.calls)))
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    print(f"\n✅ {succeeded}/{args.calls} succeeded in {elapsed:.1f}s ({succeeded / elapsed * 60:.1f} calls/min)")
+    print(f"🧪 Stub responses: {server.state.counts}")
+    print(f"💰 Client totals: {run_budget.totals()}")
+
+
+if __name__ == "__main__":
+    main()
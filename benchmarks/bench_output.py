@@ -0,0 +1,132 @@
+# ⏱️ Output backend benchmark: DOCX upload + Drive conversion vs native Google Docs
+#
+# Usage (from the repo root):
+#   python -m benchmarks.bench_output --docs 50 --workers 4
+#   python -m benchmarks.bench_output --live --folder-id <Drive folder id>
+#
+# Publishes the same synthetic website and meeting summaries with both OUTPUT_BACKEND
+# values and reports per-document end-to-end latency (p50/p95), documents/second and
+# Google API calls per document. By default it runs against benchmarks/google_stub.py,
+# which checks every batchUpdate range but does not model Drive's server-side DOCX
+# conversion; use --live (GOOGLE_SERVICE_ACCOUNT_FILE from the environment) for real
+# numbers. Documents created with --live are left in the folder.
+
+# 📦 Standard Libraries
+import io
+import os
+import sys
+import time
+import json
+import random
+import argparse
+import statistics
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.google_stub import start_google_stub, make_stub_service_account_file
+from benchmarks.bench_docx import make_website_summary, make_meeting_summary
+
+BACKENDS = ("docx", "gdocs")
+
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DOCX vs native Google Docs output benchmark")
+    parser.add_argument("--docs", type=int, default=20, help="Documents per case and backend")
+    parser.add_argument("--bullets", type=int, default=12, help="Bullets per section")
+    parser.add_argument("--workers", type=int, default=1, help="Documents published in parallel")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub response latency in seconds")
+    parser.add_argument("--live", action="store_true", help="Use the real Google APIs")
+    parser.add_argument("--folder-id", default="bench-output")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = None
+    if not args.live:
+        server = start_google_stub(0, audio_seconds=(), latency=args.latency)
+        port = server.server_address[1]
+        os.environ["GOOGLE_API_ENDPOINT"] = f"http://127.0.0.1:{port}"
+        os.environ["GOOGLE_SERVICE_ACCOUNT_FILE"] = make_stub_service_account_file(port)
+    os.environ["WEBSITE_DRIVE_FOLDER_ID"] = args.folder_id
+
+    # Imported after the environment is set: these modules read it at import time
+    from common import doc_output
+    from website.document import website_blocks
+    from website.drive import upload_docx_to_gdrive
+    from audio.doc_generator import meeting_blocks
+
+    rng = random.Random(args.seed)
+    cases = [
+        ("website", [website_blocks(make_website_summary(rng, args.bullets), "Bench Website Summary")
+                     for _ in range(args.docs)]),
+        ("meeting", [meeting_blocks(make_meeting_summary(rng, args.bullets), "Bench", "2026-01-01")
+                     for _ in range(args.docs)]),
+    ]
+
+    def publish(blocks):
+        started = time.perf_counter()
+        try:
+            doc_output.publish_document(
+                blocks,
+                "Bench Output.docx",
+                args.folder_id,
+                lambda docx_bytes, name: upload_docx_to_gdrive(io.BytesIO(docx_bytes), name),
+            )
+        except Exception as e:
+            return e
+        return time.perf_counter() - started
+
+    print(f"⏱️ {args.docs} document(s) per case and backend, {args.workers} worker(s), "
+          f"{'live Google APIs' if args.live else f'stub latency {args.latency}s'}\n")
+    print(f"{'case':<10}{'backend':<9}{'p50 s':>8}{'p95 s':>8}{'docs/s':>9}{'calls/doc':>11}")
+    results = []
+    for name, documents in cases:
+        for backend in BACKENDS:
+            doc_output.OUTPUT_BACKEND = backend
+            calls_before = dict(server.state.counts) if server else {}
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(args.workers) as pool:
+                latencies = list(pool.map(publish, documents))
+            elapsed = time.perf_counter() - started
+
+            # ❌ Latencies of a backend that could not publish are not comparable: stop here
+            errors = [latency for latency in latencies if isinstance(latency, Exception)]
+            if errors:
+                print(f"❌ {len(errors)}/{len(documents)} {name} document(s) failed with {backend}: {errors[0]!r}")
+                if server:
+                    server.shutdown()
+                sys.exit(1)
+
+            calls = None
+            if server:
+                counts = dict(server.state.counts)
+                calls = sum(
+                    value - calls_before.get(key, 0)
+                    for key, value in counts.items()
+                    if key not in ("token", "documents.requests") and not key.startswith(("bytes_", "injected_"))
+                ) / len(documents)
+            result = {
+                "case": name,
+                "backend": backend,
+                "p50_s": round(statistics.median(latencies), 4),
+                "p95_s": round(percentile(latencies, 0.95), 4),
+                "docs_per_s": round(len(documents) / elapsed, 2),
+                "calls_per_doc": calls,
+            }
+            results.append(result)
+            print(
+                f"{name:<10}{backend:<9}{result['p50_s']:>8.3f}{result['p95_s']:>8.3f}"
+                f"{result['docs_per_s']:>9.1f}{'' if calls is None else f'{calls:.1f}':>11}"
+            )
+
+    if server:
+        print(f"\n🧪 Stub calls: {json.dumps(server.state.counts)}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# ⏱️ End-to-end pipeline benchmark, fully offline
+#
+# Usage (from the repo root):
+#   python -m benchmarks.bench_pipeline --scenario mixed
+#   python -m benchmarks.bench_pipeline --scenario audio --audio-seconds 60,1200 --workers 4
+#   AUDIO_STREAM_DOWNLOAD=true python -m benchmarks.bench_pipeline --scenario audio
+#
+# Starts local stand-ins for OpenAI (benchmarks/openai_stub.py), Drive + Sheets
+# (benchmarks/google_stub.py) and the client websites (benchmarks/site_stub.py), then
+# runs the real `python main.py` against them with every cache in a fresh temp dir.
+# Reports rows/minute, peak RSS (pipeline or ffmpeg, whichever was larger) and the
+# per-stage latency table from the run report, and saves everything as JSON.
+# Settings not forced here (AUDIO_STREAM_DOWNLOAD, MAP_CONCURRENCY, ...) are taken from
+# the environment, so the same scenario can be compared before/after a change.
+# Needs ffmpeg on PATH for recordings over 25 MB (≈ 13 minutes of synthetic audio).
+
+# 📦 Standard Libraries
+import os
+import sys
+import glob
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from benchmarks.openai_stub import start_stub
+from benchmarks.site_stub import start_site_stub
+from benchmarks.google_stub import start_google_stub, make_stub_service_account_file, BENCH_SHEET_ID
+from benchmarks.synthetic import make_sheet_rows
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULTS = {
+    "rows": 10,
+    "website": True,
+    "audio_seconds": "120",
+    "pages": 6,
+    "workers": None,
+    "openai_latency": 0.3,
+    "openai_error_rate": 0.0,
+    "openai_rpm": 0,
+    "whisper_upload_mb_s": 10.0,
+    "google_latency": 0.05,
+    "google_error_rate": 0.0,
+    "drive_bandwidth_mb_s": 20.0,
+    "site_latency": 0.05,
+    "site_error_rate": 0.0,
+    "seed": 0,
+}
+
+# 🎬 Named scenarios (command-line options override them)
+SCENARIOS = {
+    "website": {"rows": 20, "audio_seconds": ""},
+    "audio": {"rows": 4, "website": False, "audio_seconds": "120,900"},
+    "mixed": {},
+    "flaky": {"openai_error_rate": 0.05, "google_error_rate": 0.02, "site_error_rate": 0.05},
+}
+
+
+# 🔧 Environment for the pipeline process: stub endpoints + every cache under the work dir
+def pipeline_env(workdir, ports, options):
+    env = dict(os.environ)
+    env.update(
+        {
+            "OPENAI_API_KEY": "stub",
+            "OPENAI_API_BASE": f"http://127.0.0.1:{ports['openai']}/v1",
+            "OPENAI_BACKOFF_MAX": "4",
+            "GOOGLE_API_ENDPOINT": f"http://127.0.0.1:{ports['google']}",
+            "GOOGLE_SERVICE_ACCOUNT_FILE": make_stub_service_account_file(ports["google"]),
+            "GOOGLE_SHEET_ID": BENCH_SHEET_ID,
+            "WEBSITE_DRIVE_FOLDER_ID": "bench-output",
+            "AUDIO_DRIVE_FOLDER_ID": "bench-output",
+            "FETCH_CACHE_DIR": os.path.join(workdir, "http"),
+            "TRANSCRIPT_CACHE_DIR": os.path.join(workdir, "transcripts"),
+            "LLM_CACHE_BACKEND": "none",
+            "ROW_INDEX_PATH": os.path.join(workdir, "row_index.json"),
+            "SHEET_JOURNAL_PATH": os.path.join(workdir, "sheet_results.jsonl"),
+            "JOB_STORE_PATH": os.path.join(workdir, "jobs.sqlite3"),
+            "FOLDER_MANIFEST_PATH": os.path.join(workdir, "folder_manifest.json"),
+            "METRICS_FILE": os.path.join(workdir, "metrics", "openai_calls.jsonl"),
+            "PROFILE_DIR": os.path.join(workdir, "profiles"),
+            "DRIVE_DOWNLOAD_DIR": os.path.join(workdir, "downloads"),
+            "PYTHONUNBUFFERED": "1",
+        }
+    )
+    if options["workers"]:
+        env["MAX_ROW_WORKERS"] = str(options["workers"])
+    if options["openai_rpm"]:
+        env["OPENAI_RPM"] = str(int(options["openai_rpm"] * 0.9))
+    return env
+
+
+# ▶️ Run main.py and return (exit code, wall seconds, peak RSS in MB)
+def run_pipeline(env, log_path):
+    with open(log_path, "w", encoding="utf-8") as log:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "main.py"], cwd=REPO_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+        # wait4 gives the pipeline's own resource usage (incl. the ffmpeg processes it waited for)
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, elapsed, usage.ru_maxrss / 1024
+
+
+def latest_run_report(profile_dir):
+    paths = sorted(glob.glob(os.path.join(profile_dir, "run-*.json")))
+    if not paths:
+        return None
+    with open(paths[-1], "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline benchmark")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--rows", type=int)
+    parser.add_argument("--audio-seconds", help="Recording lengths per folder, comma-separated ('' = no audio)")
+    parser.add_argument("--no-website", dest="website", action="store_false", default=None)
+    parser.add_argument("--pages", type=int, help="Pages per synthetic site")
+    parser.add_argument("--workers", type=int, help="MAX_ROW_WORKERS for the pipeline")
+    parser.add_argument("--openai-latency", type=float)
+    parser.add_argument("--openai-error-rate", type=float)
+    parser.add_argument("--openai-rpm", type=int, help="Stub rate limit (the client gets 90%% of it)")
+    parser.add_argument("--whisper-upload-mb-s", type=float, help="Upload bandwidth to the OpenAI stub")
+    parser.add_argument("--google-latency", type=float)
+    parser.add_argument("--google-error-rate", type=float)
+    parser.add_argument("--drive-bandwidth-mb-s", type=float, help="Drive download bandwidth")
+    parser.add_argument("--site-latency", type=float)
+    parser.add_argument("--site-error-rate", type=float)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="Result JSON path (default: .cache/benchmarks/)")
+    parser.add_argument("--keep", action="store_true", help="Keep the work dir (logs, caches, downloads)")
+    args = parser.parse_args()
+
+    options = dict(DEFAULTS, **SCENARIOS[args.scenario])
+    options.update({k: v for k, v in vars(args).items() if k in DEFAULTS and v is not None})
+    audio_seconds = [float(value) for value in options["audio_seconds"].split(",") if value]
+
+    workdir = tempfile.mkdtemp(prefix="bench-pipeline-")
+    openai_server = start_stub(
+        0, options["openai_rpm"], options["openai_error_rate"], options["openai_latency"],
+        options["whisper_upload_mb_s"],
+    )
+    site_server = start_site_stub(
+        0, options["pages"], latency=options["site_latency"],
+        error_rate=options["site_error_rate"], seed=options["seed"],
+    )
+    site_base_url = f"http://127.0.0.1:{site_server.server_address[1]}" if options["website"] else None
+    google_server = start_google_stub(
+        0,
+        make_sheet_rows(options["rows"], site_base_url, with_audio=bool(audio_seconds)),
+        audio_seconds,
+        options["google_latency"],
+        options["google_error_rate"],
+        options["drive_bandwidth_mb_s"],
+        options["seed"],
+    )
+    ports = {
+        "openai": openai_server.server_address[1],
+        "google": google_server.server_address[1],
+    }
+
+    print(f"⏱️ Scenario '{args.scenario}': {json.dumps(options)}")
+    log_path = os.path.join(workdir, "pipeline.log")
+    try:
+        exit_code, elapsed, peak_rss_mb = run_pipeline(pipeline_env(workdir, ports, options), log_path)
+        report = latest_run_report(os.path.join(workdir, "profiles"))
+    finally:
+        for server in (openai_server, site_server, google_server):
+            server.shutdown()
+
+    # ❌ A pipeline that crashed (e.g. failed imports) or never got to its run report has
+    #    nothing to measure: show why and stop instead of saving a meaningless result
+    if exit_code != 0 or report is None:
+        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+            log_tail = f.readlines()[-20:]
+        print(f"❌ Pipeline exited with {exit_code} without a run report. Last log lines:\n")
+        print("".join(log_tail))
+        print(f"📁 Work dir kept: {workdir}")
+        sys.exit(1)
+
+    # 📊 Row statuses as written back to the (stub) sheet
+    statuses = {}
+    for row in google_server.state.sheet[1:]:
+        status = row[5] if len(row) > 5 and row[5] else "unwritten"
+        statuses[status] = statuses.get(status, 0) + 1
+    finished = statuses.get("done", 0)
+
+    result = {
+        "scenario": args.scenario,
+        "options": options,
+        "exit_code": exit_code,
+        "wall_s": round(elapsed, 2),
+        "rows": options["rows"],
+        "statuses": statuses,
+        "rows_per_minute": round(finished / elapsed * 60, 2) if elapsed else 0,
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "stubs": {
+            "openai": openai_server.state.counts,
+            "google": google_server.state.counts,
+            "site": site_server.state.counts,
+        },
+        "run_report": report,
+    }
+
+    print(f"\n✅ {finished}/{options['rows']} row(s) done in {elapsed:.1f}s -> {result['rows_per_minute']} rows/min")
+    print(f"📋 Row statuses: {statuses}")
+    print(f"💾 Peak RSS: {result['peak_rss_mb']} MB")
+    print(f"🧪 Stub calls: {json.dumps(result['stubs'])}")
+    if report:
+        print(f"\n{'stage':<22}{'count':>7}{'p50 s':>9}{'p95 s':>9}{'MB':>9}")
+        for name, stage in report["stages"].items():
+            print(
+                f"{name:<22}{stage['count']:>7}{stage['p50_s']:>9.2f}{stage['p95_s']:>9.2f}"
+                f"{stage['bytes'] / (1024*1024):>9.2f}"
+            )
+    output = args.output or os.path.join(
+        REPO_ROOT, ".cache", "benchmarks", f"pipeline-{args.scenario}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"💾 Result saved to {output}")
+
+    # ❌ Unfinished rows mean the rows/min figure is not a measurement of the pipeline:
+    #    show the failures and exit non-zero so scripted comparisons don't take it at face value
+    if finished < options["rows"]:
+        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+            errors = [line for line in f if "❌" in line or "Error" in line][-10:]
+        print(f"\n❌ Only {finished}/{options['rows']} row(s) finished. Last errors:\n")
+        print("".join(errors))
+        print(f"📁 Work dir kept: {workdir}")
+        sys.exit(1)
+
+    if args.keep:
+        print(f"📁 Work dir kept: {workdir}")
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
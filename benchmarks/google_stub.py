@@ -0,0 +1,549 @@
+# 🧪 Local stand-in for the Google Drive v3 / Sheets v4 / Docs v1 APIs and the OAuth token endpoint
+#
+# Usage (from the repo root):
+#   python -m benchmarks.google_stub --port 8090 --rows 20 --audio-seconds 120,900
+#
+# It prints the GOOGLE_* settings that point the pipeline at it (a throwaway service
+# account whose token_uri is the stub, and GOOGLE_API_ENDPOINT). The stub serves:
+#   - Sheet1 of spreadsheet "bench-sheet" (synthetic rows, D:F writes are kept)
+#   - folders "bench-folder-<n>" holding synthetic WAV recordings
+#   - media downloads with Range support, resumable + multipart uploads
+#   - Drive batch requests (/batch/drive/v3) of files.get calls
+#   - Google Docs created with files.create, filled by documents.batchUpdate (indexes are
+#     checked against the document text, so a bad range fails like the real API would)
+# Latency, download bandwidth and injected 429/500/503 errors are configurable.
+# Sheet reads are never failed, so a run always gets past loading the rows.
+
+# 📦 Standard Libraries
+import re
+import json
+import time
+import uuid
+import random
+import hashlib
+import argparse
+import threading
+from urllib.parse import urlparse, parse_qs, unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.synthetic import make_wav, make_sheet_rows
+
+BENCH_SHEET_ID = "bench-sheet"
+MODIFIED_TIME = "2026-01-01T00:00:00.000Z"
+FOLDER_PREFIX = "bench-folder-"
+GOOGLE_DOC_MIME_TYPE = "application/vnd.google-apps.document"
+RANGE_PATTERN = re.compile(r"^(?:[^!]+!)?([A-Z]+)(\d+)?(?::([A-Z]+)(\d+)?)?$")
+
+
+def column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index - 1
+
+
+class GoogleState:
+    def __init__(self, sheet_rows, audio_seconds, latency, error_rate, bandwidth_mb_s, seed):
+        self.sheet = [list(row) for row in sheet_rows]
+        self.audio_seconds = audio_seconds
+        self.latency = latency
+        self.error_rate = error_rate
+        self.bandwidth_mb_s = bandwidth_mb_s
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.recordings = {}  # (seconds, index) -> (WAV bytes, md5), shared by every folder
+        self.uploads = {}     # upload session id -> metadata
+        self.files = {}       # uploaded file id -> metadata
+        self.documents = {}   # Google Doc id -> body text (a new document is a single newline)
+        self.counts = {"injected_errors": 0, "bytes_downloaded": 0, "bytes_uploaded": 0}
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    # 🚦 (delay, injected error status or None) for the next request
+    def admit(self, can_fail=True):
+        with self.lock:
+            delay = self.latency * self.random.uniform(0.5, 1.5)
+            if can_fail and self.random.random() < self.error_rate:
+                self.counts["injected_errors"] += 1
+                return delay, self.random.choice([429, 500, 503])
+        return delay, None
+
+    def recording(self, seconds, index):
+        with self.lock:
+            key = (seconds, index)
+            if key not in self.recordings:
+                content = make_wav(seconds, seed=index)
+                self.recordings[key] = (content, hashlib.md5(content).hexdigest())
+            return self.recordings[key]
+
+    # 🎙️ Metadata of every recording in a bench folder (same fields Drive returns)
+    def folder_files(self, folder_id):
+        if not folder_id.startswith(FOLDER_PREFIX):
+            return []
+        files = []
+        for index, seconds in enumerate(self.audio_seconds):
+            content, md5 = self.recording(seconds, index)
+            files.append(
+                {
+                    "id": f"{folder_id}.rec-{index}",
+                    "name": f"recording-{index}.wav",
+                    "mimeType": "audio/wav",
+                    "size": str(len(content)),
+                    "md5Checksum": md5,
+                    "modifiedTime": MODIFIED_TIME,
+                }
+            )
+        return files
+
+    def file_metadata(self, file_id):
+        if file_id == BENCH_SHEET_ID:
+            return {"id": file_id, "name": "Bench Sheet", "modifiedTime": MODIFIED_TIME}
+        if file_id.startswith(FOLDER_PREFIX) and ".rec-" not in file_id:
+            return {
+                "id": file_id,
+                "name": f"Bench Client {file_id[len(FOLDER_PREFIX):]}",
+                "mimeType": "application/vnd.google-apps.folder",
+                "modifiedTime": MODIFIED_TIME,
+            }
+        if ".rec-" in file_id:
+            folder_id = file_id.split(".rec-")[0]
+            for file in self.folder_files(folder_id):
+                if file["id"] == file_id:
+                    return file
+        with self.lock:
+            return self.files.get(file_id)
+
+    def file_content(self, file_id):
+        if ".rec-" not in file_id:
+            return None
+        index = int(file_id.split(".rec-")[1])
+        if index >= len(self.audio_seconds):
+            return None
+        return self.recording(self.audio_seconds[index], index)[0]
+
+    def create_file(self, metadata, size):
+        file_id = f"uploaded-{uuid.uuid4().hex[:12]}"
+        with self.lock:
+            self.files[file_id] = dict(metadata, id=file_id, size=str(size), modifiedTime=MODIFIED_TIME)
+            if metadata.get("mimeType") == GOOGLE_DOC_MIME_TYPE and not size:
+                self.documents[file_id] = "\n"
+            self.counts["bytes_uploaded"] += size
+        return self.files[file_id]
+
+    def delete_file(self, file_id):
+        with self.lock:
+            self.documents.pop(file_id, None)
+            return self.files.pop(file_id, None) is not None
+
+    # 📝 Apply a documents.batchUpdate; returns an error message or None. All requests are
+    #    checked first and applied together, as the real API does (all or nothing).
+    def update_document(self, document_id, requests):
+        with self.lock:
+            if document_id not in self.documents:
+                return f"Document not found: {document_id}"
+            text = self.documents[document_id]
+            for number, request in enumerate(requests):
+                text, error = apply_document_request(text, request)
+                if error:
+                    return f"requests[{number}]: {error}"
+            self.documents[document_id] = text
+            return None
+
+    def read_range(self, cell_range):
+        match = RANGE_PATTERN.match(cell_range)
+        if not match:
+            return []
+        first_col, first_row, last_col, last_row = match.groups()
+        first_row = int(first_row or 1)
+        last_row = int(last_row) if last_row else len(self.sheet)
+        first = column_index(first_col)
+        last = column_index(last_col or first_col)
+        with self.lock:
+            rows = [row[first : last + 1] for row in self.sheet[first_row - 1 : last_row]]
+        # Like the real API: trailing empty cells and rows are left out
+        for row in rows:
+            while row and row[-1] == "":
+                row.pop()
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def write_range(self, cell_range, values):
+        match = RANGE_PATTERN.match(cell_range)
+        first_col, first_row = match.group(1), int(match.group(2))
+        first = column_index(first_col)
+        with self.lock:
+            for offset, row_values in enumerate(values):
+                row_number = first_row + offset
+                while len(self.sheet) < row_number:
+                    self.sheet.append([])
+                row = self.sheet[row_number - 1]
+                row.extend([""] * (first + len(row_values) - len(row)))
+                row[first : first + len(row_values)] = row_values
+
+
+# ✂️ First part (JSON metadata) and second part (content) of a multipart/related body
+# 📏 Docs indexes are UTF-16 code units starting at 1; the text is kept as UTF-16-LE bytes
+def utf16(text):
+    return text.encode("utf-16-le")
+
+
+def check_range(units, document_range):
+    start, end = document_range.get("startIndex"), document_range.get("endIndex")
+    if start is None or end is None or not 1 <= start < end <= units + 1:
+        return f"Invalid range {start}-{end} for a document of length {units + 1}"
+    return None
+
+
+# ✏️ (new text, error) for one request of the kinds the pipeline sends
+def apply_document_request(text, request):
+    data = utf16(text)
+    units = len(data) // 2
+    kind = next(iter(request), None)
+    body = request.get(kind) or {}
+
+    if kind == "insertText":
+        index = body.get("location", {}).get("index")
+        if index is None or not 1 <= index <= units:
+            return text, f"Insert index {index} must be within 1-{units}"
+        offset = (index - 1) * 2
+        return (data[:offset] + utf16(body.get("text", "")) + data[offset:]).decode("utf-16-le"), None
+
+    if kind in ("updateParagraphStyle", "updateTextStyle"):
+        error = check_range(units, body.get("range", {}))
+        if error is None and not body.get("fields"):
+            error = "fields is required"
+        return text, error
+
+    if kind == "createParagraphBullets":
+        error = check_range(units, body.get("range", {}))
+        if error:
+            return text, error
+        # Leading tabs of every paragraph in the range become nesting levels and are removed
+        start, end = body["range"]["startIndex"] - 1, body["range"]["endIndex"] - 1
+        before, inside, after = text_slices(data, start, end)
+        lines = inside.split("\n")
+        inside = "\n".join(line.lstrip("\t") for line in lines)
+        return before + inside + after, None
+
+    return text, f"Unsupported request: {kind}"
+
+
+# ✂️ Text before, within (extended back to the start of its first paragraph) and after
+#    a range of UTF-16 units
+def text_slices(data, start, end):
+    before = data[: start * 2].decode("utf-16-le")
+    paragraph_start = before.rfind("\n") + 1
+    inside = before[paragraph_start:] + data[start * 2 : end * 2].decode("utf-16-le")
+    return before[:paragraph_start], inside, data[end * 2 :].decode("utf-16-le")
+
+
+# 📦 [(Content-ID, method, path with query)] of a multipart/mixed batch request
+def split_batch(body, content_type):
+    boundary = content_type.split("boundary=", 1)[1].strip('"').encode()
+    calls = []
+    for part in body.replace(b"\r\n", b"\n").split(b"--" + boundary)[1:]:
+        if part.startswith(b"--"):
+            break
+        headers, _, inner = part.strip(b"\n").partition(b"\n\n")
+        content_id = re.search(rb"(?im)^content-id: <([^>]+)>", headers).group(1).decode()
+        method, target, _ = inner.split(b"\n", 1)[0].decode().split(" ", 2)
+        calls.append((content_id, method, target))
+    return calls
+
+
+# 📦 multipart/mixed batch response: (content type, body)
+def batch_response(replies):
+    boundary = f"batch_{uuid.uuid4().hex}"
+    parts = []
+    for content_id, status, payload in replies:
+        reason = "OK" if status == 200 else "Error"
+        parts.append(
+            f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: <response-{content_id}>\r\n\r\n"
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n\r\n{json.dumps(payload)}\r\n"
+        )
+    return f"multipart/mixed; boundary={boundary}", ("".join(parts) + f"--{boundary}--\r\n").encode("utf-8")
+
+
+def split_multipart(body, content_type):
+    boundary = content_type.split("boundary=")[1].strip('"').encode("utf-8")
+    parts = []
+    for part in body.split(b"--" + boundary)[1:]:
+        if part.startswith(b"--"):
+            break
+        separator = b"\r\n\r\n" if b"\r\n\r\n" in part else b"\n\n"
+        parts.append(part.split(separator, 1)[1].rstrip(b"\r\n"))
+    return json.loads(parts[0] or b"{}"), parts[1] if len(parts) > 1 else b""
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body=b"", content_type="application/json", headers=None):
+            if isinstance(body, (dict, list)):
+                body = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _error(self, status, message):
+            retry = {"Retry-After": "1"} if status == 429 else None
+            self._send(status, {"error": {"code": status, "message": message}}, headers=retry)
+
+        def _body(self):
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        def _admit(self, route, can_fail=True):
+            state.count(route)
+            delay, status = state.admit(can_fail)
+            time.sleep(delay)
+            if status:
+                self._error(status, f"Injected {status} error")
+                return False
+            return True
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            path = unquote(url.path)
+
+            if path == "/_stats":
+                with state.lock:
+                    self._send(200, dict(state.counts))
+                return
+
+            if path.startswith("/v4/spreadsheets/") and path.endswith("/values:batchGet"):
+                if self._admit("values.batchGet", can_fail=False):
+                    ranges = query.get("ranges", [])
+                    self._send(200, {"valueRanges": [
+                        {"range": cell_range, "values": state.read_range(cell_range)} for cell_range in ranges
+                    ]})
+                return
+
+            if path.startswith("/v4/spreadsheets/") and "/values/" in path:
+                if self._admit("values.get", can_fail=False):
+                    cell_range = path.split("/values/", 1)[1]
+                    self._send(200, {"range": cell_range, "values": state.read_range(cell_range)})
+                return
+
+            if path == "/drive/v3/files":
+                if not self._admit("files.list"):
+                    return
+                parent = re.search(r"'([^']+)' in parents", query.get("q", [""])[0])
+                files = state.folder_files(parent.group(1)) if parent else []
+                start = int(query.get("pageToken", ["0"])[0])
+                page_size = int(query.get("pageSize", ["100"])[0])
+                page = {"files": files[start : start + page_size]}
+                if start + page_size < len(files):
+                    page["nextPageToken"] = str(start + page_size)
+                self._send(200, page)
+                return
+
+            if path.startswith("/drive/v3/files/"):
+                file_id = path[len("/drive/v3/files/") :]
+                if query.get("alt") == ["media"]:
+                    self._media(file_id)
+                elif self._admit("files.get"):
+                    metadata = state.file_metadata(file_id)
+                    if metadata is None:
+                        self._error(404, f"File not found: {file_id}")
+                    else:
+                        self._send(200, metadata)
+                return
+
+            self._error(404, f"Unknown stub route: {path}")
+
+        # ⬇️ Ranged media download, throttled to the configured bandwidth
+        def _media(self, file_id):
+            if not self._admit("files.get_media"):
+                return
+            content = state.file_content(file_id)
+            if content is None:
+                self._error(404, f"No content for {file_id}")
+                return
+
+            start, end = 0, len(content) - 1
+            range_header = self.headers.get("Range")
+            if range_header:
+                first, _, last = range_header.split("=", 1)[1].partition("-")
+                start = int(first)
+                end = min(int(last), len(content) - 1) if last else len(content) - 1
+            chunk = content[start : end + 1]
+            if state.bandwidth_mb_s:
+                time.sleep(len(chunk) / (state.bandwidth_mb_s * 1024 * 1024))
+            state.count("bytes_downloaded", len(chunk))
+
+            headers = {"Content-Range": f"bytes {start}-{end}/{len(content)}"} if range_header else None
+            self._send(206 if range_header else 200, chunk, "application/octet-stream", headers)
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            path = unquote(url.path)
+            body = self._body()
+
+            if path == "/token":
+                state.count("token")
+                self._send(200, {"access_token": "stub-token", "expires_in": 3600, "token_type": "Bearer"})
+                return
+
+            if path.endswith("/values:batchUpdate"):
+                if self._admit("values.batchUpdate"):
+                    request = json.loads(body or b"{}")
+                    for data in request.get("data", []):
+                        state.write_range(data["range"], data["values"])
+                    self._send(200, {"totalUpdatedRows": len(request.get("data", []))})
+                return
+
+            if path == "/upload/drive/v3/files":
+                upload_type = query.get("uploadType", [""])[0]
+                if upload_type == "resumable":
+                    if self._admit("upload.resumable"):
+                        upload_id = uuid.uuid4().hex
+                        with state.lock:
+                            state.uploads[upload_id] = json.loads(body or b"{}")
+                        location = f"http://{self.headers['Host']}{path}?uploadType=resumable&upload_id={upload_id}"
+                        self._send(200, {}, headers={"Location": location})
+                    return
+                if self._admit("upload.multipart"):
+                    metadata, content = split_multipart(body, self.headers.get("Content-Type", ""))
+                    self._send(200, state.create_file(metadata, len(content)))
+                return
+
+            if path == "/batch/drive/v3":
+                if self._admit("batch"):
+                    replies = []
+                    for content_id, method, target in split_batch(body, self.headers.get("Content-Type", "")):
+                        state.count("batch.calls")
+                        file_path = unquote(urlparse(target).path)
+                        metadata = None
+                        if method == "GET" and file_path.startswith("/drive/v3/files/"):
+                            metadata = state.file_metadata(file_path[len("/drive/v3/files/") :])
+                        if metadata is None:
+                            replies.append((content_id, 404, {"error": {"code": 404, "message": f"Not found: {target}"}}))
+                        else:
+                            replies.append((content_id, 200, metadata))
+                    content_type, response = batch_response(replies)
+                    self._send(200, response, content_type)
+                return
+
+            if path == "/drive/v3/files":
+                if self._admit("files.create"):
+                    self._send(200, state.create_file(json.loads(body or b"{}"), 0))
+                return
+
+            if path.startswith("/v1/documents/") and path.endswith(":batchUpdate"):
+                if self._admit("documents.batchUpdate"):
+                    document_id = path[len("/v1/documents/") : -len(":batchUpdate")]
+                    requests = json.loads(body or b"{}").get("requests", [])
+                    state.count("documents.requests", len(requests))
+                    error = state.update_document(document_id, requests)
+                    if error:
+                        self._error(404 if error.startswith("Document not found") else 400, error)
+                    else:
+                        self._send(200, {"documentId": document_id, "replies": [{} for _ in requests]})
+                return
+
+            self._error(404, f"Unknown stub route: {path}")
+
+        def do_DELETE(self):
+            path = unquote(urlparse(self.path).path)
+            self._body()
+            if path.startswith("/drive/v3/files/"):
+                if self._admit("files.delete"):
+                    if state.delete_file(path[len("/drive/v3/files/") :]):
+                        self._send(204)
+                    else:
+                        self._error(404, "File not found")
+                return
+            self._error(404, f"Unknown stub route: {path}")
+
+        # 📤 Second step of a resumable upload: the whole file in one PUT
+        def do_PUT(self):
+            query = parse_qs(urlparse(self.path).query)
+            body = self._body()
+            if not self._admit("upload.resumable_put"):
+                return
+            with state.lock:
+                metadata = state.uploads.pop(query.get("upload_id", [""])[0], None)
+            if metadata is None:
+                self._error(404, "Unknown upload session")
+                return
+            self._send(200, state.create_file(metadata, len(body)))
+
+    return Handler
+
+
+# 🚀 Start the stub in a background thread (returns the server; call shutdown() to stop)
+def start_google_stub(
+    port=8090,
+    sheet_rows=None,
+    audio_seconds=(120,),
+    latency=0.0,
+    error_rate=0.0,
+    bandwidth_mb_s=0.0,
+    seed=0,
+):
+    state = GoogleState(
+        sheet_rows or make_sheet_rows(0), list(audio_seconds), latency, error_rate, bandwidth_mb_s, seed
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.daemon_threads = True
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# 🔑 Service-account file for the stub: a throwaway key whose token_uri is the stub itself
+def make_stub_service_account_file(port):
+    from benchmarks.bench_google_clients import make_fake_service_account_file
+
+    return make_fake_service_account_file(token_uri=f"http://127.0.0.1:{port}/token")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Google Drive/Sheets API stub")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--rows", type=int, default=20, help="Synthetic sheet rows")
+    parser.add_argument("--site-base-url", default="", help="e.g. http://127.0.0.1:8091 (benchmarks/site_stub.py)")
+    parser.add_argument("--audio-seconds", default="120", help="Recording lengths per folder, comma-separated")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean response latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 429/500/503")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="Download MB/s (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    audio_seconds = [float(value) for value in args.audio_seconds.split(",") if value]
+    server = start_google_stub(
+        args.port,
+        make_sheet_rows(args.rows, args.site_base_url or None, with_audio=bool(audio_seconds)),
+        audio_seconds,
+        args.latency,
+        args.error_rate,
+        args.bandwidth,
+        args.seed,
+    )
+    print(f"🧪 Google stub listening on http://127.0.0.1:{args.port} (Ctrl+C to stop)")
+    print(f"   GOOGLE_API_ENDPOINT=http://127.0.0.1:{args.port}")
+    print(f"   GOOGLE_SERVICE_ACCOUNT_FILE={make_stub_service_account_file(args.port)}")
+    print(f"   GOOGLE_SHEET_ID={BENCH_SHEET_ID}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(f"📊 {server.state.counts}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
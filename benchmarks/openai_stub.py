@@ -0,0 +1,167 @@
+# 🧪 Local stand-in for the OpenAI API (chat completions + Whisper)
+#
+# Usage (from the repo root):
+#   python -m benchmarks.openai_stub --port 8089 --rpm 60 --error-rate 0.05 --latency 0.5
+#   OPENAI_API_BASE=http://127.0.0.1:8089/v1 OPENAI_API_KEY=stub python main.py
+#
+# The stub enforces its own requests-per-minute limit (429 + Retry-After), randomly
+# injects 429/500/503 errors and adds latency, so retries and the shared rate limiter
+# can be exercised without spending anything.
+
+# 📦 Standard Libraries
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 🧾 One answer that satisfies both the website and the meeting schema, so no fill-in
+#    calls are triggered and the documents have realistic sections and bullets
+STUB_BULLETS = "\n".join(f"- **Point {n}:** generated by the local OpenAI stub." for n in range(1, 5))
+STUB_SUMMARY = {
+    "title": "Stub Summary",
+    "sections": [
+        {"heading": heading, "content": STUB_BULLETS}
+        for heading in (
+            "Purpose",
+            "Target Audience",
+            "About the Company",
+            "Company Information",
+            "Unique Selling Proposition (USP)",
+            "Reviews/Testimonials",
+            "Products/Service Categories",
+            "Offers",
+        )
+    ],
+    "mom": [f"Stub meeting minute {n}." for n in range(1, 6)],
+    "todo_list": [f"Stub task {n}" for n in range(1, 4)],
+    "action_plan": {
+        field: [f"Stub {field.replace('_', ' ')}."]
+        for field in (
+            "decision_made",
+            "key_services_to_promote",
+            "target_geography",
+            "budget_and_timeline",
+            "lead_management_strategy",
+            "next_steps_and_ownership",
+        )
+    },
+}
+STUB_TRANSCRIPT = "This is a transcript produced by the local OpenAI stub."
+
+
+class StubState:
+    def __init__(self, rpm, error_rate, latency, upload_mb_s=0.0):
+        self.rpm = rpm
+        self.error_rate = error_rate
+        self.latency = latency
+        self.upload_mb_s = upload_mb_s
+        self.lock = threading.Lock()
+        self.window = []  # Request timestamps in the last 60s
+        self.counts = {"ok": 0, "rate_limited": 0, "injected_errors": 0}
+
+    # 🚦 (status, retry_after) for the next request
+    def admit(self):
+        with self.lock:
+            now = time.monotonic()
+            self.window = [t for t in self.window if now - t < 60]
+            if self.rpm and len(self.window) >= self.rpm:
+                self.counts["rate_limited"] += 1
+                return 429, 60 - (now - self.window[0])
+            self.window.append(now)
+
+            if random.random() < self.error_rate:
+                self.counts["injected_errors"] += 1
+                return random.choice([429, 500, 503]), 1
+            self.counts["ok"] += 1
+            return 200, None
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body, content_type="application/json", retry_after=None):
+            payload = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            if retry_after is not None:
+                self.send_header("Retry-After", f"{retry_after:.2f}")
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            request_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            time.sleep(state.latency * random.uniform(0.5, 1.5))
+            if state.upload_mb_s:
+                time.sleep(len(request_body) / (state.upload_mb_s * 1024 * 1024))
+
+            status, retry_after = state.admit()
+            if status != 200:
+                error = {"error": {"message": f"Stub error {status}", "type": "stub_error"}}
+                self._send(status, json.dumps(error), retry_after=retry_after)
+                return
+
+            if self.path.endswith("/chat/completions"):
+                request = json.loads(request_body or b"{}")
+                prompt_tokens = sum(len(m.get("content", "")) for m in request.get("messages", [])) // 4
+                content = "```json\n" + json.dumps(STUB_SUMMARY) + "\n```"
+                response = {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "model": request.get("model", "stub"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": len(content) // 4,
+                        "total_tokens": prompt_tokens + len(content) // 4,
+                    },
+                }
+                self._send(200, json.dumps(response))
+            elif "/audio/" in self.path:
+                self._send(200, STUB_TRANSCRIPT, content_type="text/plain")
+            else:
+                self._send(404, json.dumps({"error": {"message": "Unknown stub route"}}))
+
+    return Handler
+
+
+# 🚀 Start the stub in a background thread (returns the server; call shutdown() to stop)
+def start_stub(port=8089, rpm=0, error_rate=0.0, latency=0.0, upload_mb_s=0.0):
+    state = StubState(rpm, error_rate, latency, upload_mb_s)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI API stub")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--rpm", type=int, default=0, help="Requests per minute before 429s (0 = no limit)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 429/500/503")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean response latency in seconds")
+    parser.add_argument("--upload-bandwidth", type=float, default=0.0, help="Request body MB/s, e.g. audio uploads (0 = unlimited)")
+    args = parser.parse_args()
+
+    server = start_stub(args.port, args.rpm, args.error_rate, args.latency, args.upload_bandwidth)
+    print(f"🧪 OpenAI stub listening on http://127.0.0.1:{args.port}/v1 (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(f"📊 {server.state.counts}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
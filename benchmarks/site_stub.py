@@ -0,0 +1,125 @@
+# 🧪 Local web server with synthetic client websites for the website branch
+#
+# Usage (from the repo root):
+#   python -m benchmarks.site_stub --port 8091 --pages 6 --latency 0.05
+#
+# Serves /site/<n>/page-<k>.html for any site number n (see benchmarks/synthetic.py)
+# and an allow-all robots.txt, with optional latency and injected 5xx errors.
+
+# 📦 Standard Libraries
+import re
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.synthetic import make_html_page
+
+PAGE_PATH = re.compile(r"^/site/(\d+)/page-(\d+)\.html$")
+
+
+class SiteState:
+    def __init__(self, pages_per_site, paragraphs, latency, error_rate, seed):
+        self.pages_per_site = pages_per_site
+        self.paragraphs = paragraphs
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.pages = {}
+        self.counts = {"pages": 0, "robots": 0, "injected_errors": 0, "bytes": 0}
+
+    def page(self, site, page):
+        with self.lock:
+            key = (site, page)
+            if key not in self.pages:
+                self.pages[key] = make_html_page(
+                    site, page, self.pages_per_site, self.paragraphs, self.seed
+                )
+            return self.pages[key]
+
+    def admit(self):
+        with self.lock:
+            delay = self.latency * self.random.uniform(0.5, 1.5)
+            failed = self.random.random() < self.error_rate
+            if failed:
+                self.counts["injected_errors"] += 1
+        return delay, failed
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like real sites
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body, content_type="text/html; charset=utf-8"):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            delay, failed = state.admit()
+            time.sleep(delay)
+            if self.path == "/robots.txt":
+                with state.lock:
+                    state.counts["robots"] += 1
+                self._send(200, b"User-agent: *\nAllow: /\n", "text/plain")
+                return
+            if failed:
+                self._send(503, b"Injected error")
+                return
+
+            match = PAGE_PATH.match(self.path.split("?")[0])
+            if not match or int(match.group(2)) >= state.pages_per_site:
+                self._send(404, b"Not found")
+                return
+
+            body = state.page(int(match.group(1)), int(match.group(2)))
+            with state.lock:
+                state.counts["pages"] += 1
+                state.counts["bytes"] += len(body)
+            self._send(200, body)
+
+    return Handler
+
+
+# 🚀 Start the site server in a background thread (returns the server; call shutdown() to stop)
+def start_site_stub(port=8091, pages_per_site=6, paragraphs=12, latency=0.0, error_rate=0.0, seed=0):
+    state = SiteState(pages_per_site, paragraphs, latency, error_rate, seed)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.daemon_threads = True
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic website server")
+    parser.add_argument("--port", type=int, default=8091)
+    parser.add_argument("--pages", type=int, default=6, help="Pages per site")
+    parser.add_argument("--paragraphs", type=int, default=12, help="Paragraphs per page")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean response latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of page requests failing with 503")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = start_site_stub(
+        args.port, args.pages, args.paragraphs, args.latency, args.error_rate, args.seed
+    )
+    print(f"🧪 Sites at http://127.0.0.1:{args.port}/site/<n>/page-0.html (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(f"📊 {server.state.counts}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# 🧪 Synthetic fixtures for the offline benchmarks: websites, recordings and sheet rows
+#
+# Everything is generated from a seed, so two runs with the same options see exactly
+# the same pages, audio and rows.
+
+# 📦 Standard Libraries
+import io
+import math
+import wave
+import random
+from array import array
+
+WORDS = (
+    "agency growth campaign client brand strategy content search social paid media "
+    "conversion funnel audience launch budget report analytics creative retention "
+    "pipeline revenue quarter market product pricing onboarding partner channel "
+    "engagement insight roadmap customer service platform team results performance"
+).split()
+
+# 🎙️ Recordings: 16 kHz mono 16-bit PCM (≈ 1.9 MB per minute, so 15 min crosses Whisper's 25 MB)
+SAMPLE_RATE = 16000
+SPEECH_SECONDS = 2.4
+PAUSE_SECONDS = 0.6
+
+
+def make_sentence(rng, words=14):
+    sentence = " ".join(rng.choice(WORDS) for _ in range(words))
+    return sentence.capitalize() + "."
+
+
+# 🌐 One page of a synthetic site: boilerplate (nav, cookie banner, footer) around real
+#    content, plus links to the other pages so the crawler has something to follow
+def make_html_page(site, page, pages_per_site, paragraphs=12, seed=0):
+    rng = random.Random(f"{seed}:{site}:{page}")
+    links = "".join(
+        f'<li><a href="/site/{site}/page-{other}.html">Page {other}</a></li>'
+        for other in range(pages_per_site)
+        if other != page
+    )
+    sections = []
+    for section in range(max(1, paragraphs // 4)):
+        body = "".join(
+            f"<p>{' '.join(make_sentence(rng) for _ in range(4))}</p>" for _ in range(4)
+        )
+        bullets = "".join(f"<li>{make_sentence(rng, 8)}</li>" for _ in range(3))
+        sections.append(f"<h2>{make_sentence(rng, 4)}</h2>{body}<ul>{bullets}</ul>")
+
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>Site {site} - Page {page}</title>"
+        "<style>body{font-family:sans-serif}</style><script>var tracking = true;</script>"
+        "</head><body>"
+        f'<header class="site-header"><nav class="navbar"><ul>{links}</ul></nav></header>'
+        '<div class="cookie-banner">We use cookies to improve your experience.</div>'
+        f"<main><article><h1>Site {site} page {page}</h1>{''.join(sections)}</article></main>"
+        f'<footer><ul>{links}</ul><p>© Site {site}</p></footer>'
+        "</body></html>"
+    ).encode("utf-8")
+
+
+# 🎙️ WAV recording of the given length: tone bursts with short pauses, so silence-based
+#    splitting has somewhere to cut. One burst/pause cycle is built once and repeated.
+def make_wav(seconds, seed=0):
+    rng = random.Random(seed)
+    frequency = rng.choice([180, 220, 260])
+    cycle = array("h")
+    for n in range(int(SPEECH_SECONDS * SAMPLE_RATE)):
+        t = n / SAMPLE_RATE
+        envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 3 * t)  # Syllable-like loudness
+        cycle.append(int(8000 * envelope * math.sin(2 * math.pi * frequency * t)))
+    cycle.extend([0] * int(PAUSE_SECONDS * SAMPLE_RATE))
+
+    cycle_bytes = cycle.tobytes()
+    total_bytes = int(seconds * SAMPLE_RATE) * 2
+    frames = (cycle_bytes * (total_bytes // len(cycle_bytes) + 1))[:total_bytes]
+
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(frames)
+    return output.getvalue()
+
+
+# 📊 Sheet1 values: header + one row per site/folder (columns A:C, results go to D:F)
+def make_sheet_rows(rows, site_base_url=None, with_audio=True):
+    values = [["Date", "Website", "Audio Folder", "Website Summary", "Audio Summary", "Status"]]
+    for row in range(rows):
+        website = f"{site_base_url.rstrip('/')}/site/{row}/page-0.html" if site_base_url else ""
+        audio = f"https://drive.google.com/drive/folders/bench-folder-{row}" if with_audio else ""
+        values.append([f"2026-01-{row % 28 + 1:02d} 10:00", website, audio])
+    return values
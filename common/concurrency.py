@@ -0,0 +1,16 @@
+import os
+import threading
+from dotenv import load_dotenv
+
+# 🔐 Load environment variables from .env
+load_dotenv()
+
+# ⚙️ Worker pool size and in-flight API call caps (tunable via .env)
+MAX_ROW_WORKERS = int(os.getenv("MAX_ROW_WORKERS", "8"))
+MAX_OPENAI_CALLS = int(os.getenv("MAX_OPENAI_CALLS", "4"))
+MAX_DRIVE_CALLS = int(os.getenv("MAX_DRIVE_CALLS", "8"))
+
+# 🚦 Process-wide semaphores shared by every worker thread
+#    Wrap each OpenAI / Drive request in `with openai_slot:` / `with drive_slot:`
+openai_slot = threading.BoundedSemaphore(MAX_OPENAI_CALLS)
+drive_slot = threading.BoundedSemaphore(MAX_DRIVE_CALLS)
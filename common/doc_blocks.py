@@ -0,0 +1,68 @@
+# 📦 Standard Libraries
+import re
+
+# 🧱 Shared document model used by every output backend.
+#    A document is a list of blocks: {"style": ..., "runs": [(text, bold, italic), ...], "align": ...}
+#    Styles are the built-in Word style ids (Title, Heading1, Heading2, ListBullet, ListBullet2, ...),
+#    None for a plain paragraph; align is a Word justification value ("right", "center", ...).
+
+# ✨ Inline markdown: ***bold italic***, **bold** / __bold__, *italic* / _italic_
+INLINE_PATTERN = re.compile(
+    r"\*\*\*(?P<bold_italic>.+?)\*\*\*"
+    r"|\*\*(?P<bold>.+?)\*\*"
+    r"|__(?P<bold_alt>.+?)__"
+    r"|(?<![\w*])\*(?![\s*])(?P<italic>[^*]+?)(?<!\s)\*(?![\w*])"
+    r"|(?<![\w_])_(?![\s_])(?P<italic_alt>[^_]+?)(?<!\s)_(?![\w_])"
+)
+
+# ➤ Markdown bullet: "- item", indented by two spaces (or a tab) per nesting level
+BULLET_PATTERN = re.compile(r"^(?P<indent>[ \t]*)- (?P<text>.*)$")
+
+# 📏 Deepest bullet level with its own style (ListBullet, ListBullet2, ListBullet3)
+MAX_BULLET_LEVEL = 3
+
+
+def block(style, runs, align=None):
+    return {"style": style, "runs": runs, "align": align}
+
+
+# 🔤 A single unformatted run
+def text_runs(text):
+    return [(text, False, False)] if text else []
+
+
+# ✨ Split a line into (text, bold, italic) runs
+def markdown_runs(text):
+    runs = []
+    position = 0
+    for match in INLINE_PATTERN.finditer(text):
+        if match.start() > position:
+            runs.append((text[position : match.start()], False, False))
+        kind = match.lastgroup
+        bold = kind in ("bold_italic", "bold", "bold_alt")
+        italic = kind in ("bold_italic", "italic", "italic_alt")
+        runs.append((match.group(kind), bold, italic))
+        position = match.end()
+    if position < len(text):
+        runs.append((text[position:], False, False))
+    return runs
+
+
+def bullet_style(level):
+    level = max(1, min(level, MAX_BULLET_LEVEL))
+    return "ListBullet" if level == 1 else f"ListBullet{level}"
+
+
+# 📌 Blocks for a markdown section body: "- " lines become (nested) bullets,
+#    every other line a plain paragraph (blank lines included, as before)
+def markdown_blocks(content):
+    blocks = []
+    for line in content.split("\n"):
+        match = BULLET_PATTERN.match(line.rstrip())
+        if match:
+            indent = match.group("indent").replace("\t", "  ")
+            level = 1 + len(indent) // 2
+            blocks.append(block(bullet_style(level), markdown_runs(match.group("text").strip())))
+        else:
+            blocks.append(block(None, markdown_runs(line.strip())))
+    return blocks
@@ -0,0 +1,31 @@
+# 📦 Standard Libraries
+import os
+import time
+from dotenv import load_dotenv
+
+# 🧩 Shared helpers
+from common.docx_renderer import render_docx
+from common.gdocs_renderer import create_google_doc
+from common.profiler import stage
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ "docx" = render a .docx and let Drive convert it, "gdocs" = write a native Google Doc
+OUTPUT_BACKEND = os.getenv("OUTPUT_BACKEND", "docx").lower()
+
+
+# 📤 Publish document blocks to a Drive folder with the configured backend; returns the file id.
+#    `upload_docx(docx_bytes, name)` is the branch's DOCX upload, used by the "docx" backend.
+#    The end-to-end time per document shows up as output.<backend> in the run report.
+def publish_document(blocks, name, folder_id, upload_docx):
+    started = time.perf_counter()
+    with stage(f"output.{OUTPUT_BACKEND}"):
+        if OUTPUT_BACKEND == "gdocs":
+            file_id = create_google_doc(blocks, name, folder_id)
+        else:
+            with stage("docx.render"):
+                docx_bytes = render_docx(blocks)
+            file_id = upload_docx(docx_bytes, name)
+    print(f"📄 {name}: {OUTPUT_BACKEND} output in {time.perf_counter() - started:.2f}s")
+    return file_id
@@ -0,0 +1,96 @@
+# 📦 Standard Libraries
+import io
+import re
+import zipfile
+import threading
+from xml.sax.saxutils import escape
+
+# 📄 python-docx is only used once, to produce the base package
+from docx import Document
+
+# 🧱 DOCX renderer: the base package (styles, numbering, theme, ...) is created once per
+#    process and reused; every document only gets a new word/document.xml, assembled as
+#    XML text from blocks (see common/doc_blocks.py) instead of element by element.
+
+DOCUMENT_PART = "word/document.xml"
+
+# 🚫 Control characters XML 1.0 does not allow (python-docx raises on them, here they are dropped)
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_lock = threading.Lock()
+_base = None
+
+
+# 📦 (parts in package order with None in place of document.xml, document.xml before
+#    the body end, document.xml after it), built once
+def get_base_package():
+    global _base
+    with _lock:
+        if _base is None:
+            stream = io.BytesIO()
+            Document().save(stream)
+            with zipfile.ZipFile(stream) as package:
+                parts = [(info, package.read(info.filename)) for info in package.infolist()]
+
+            document_xml = next(data for info, data in parts if info.filename == DOCUMENT_PART)
+            document_xml = document_xml.decode("utf-8")
+            # New paragraphs go right before the section properties, like python-docx does
+            split_at = document_xml.rfind("<w:sectPr")
+            _base = (
+                [(info, None if info.filename == DOCUMENT_PART else data) for info, data in parts],
+                document_xml[:split_at],
+                document_xml[split_at:],
+            )
+        return _base
+
+
+# 🔤 <w:t> content; tabs and line breaks become their own elements, as python-docx does
+def text_xml(text):
+    text = INVALID_XML_CHARS.sub("", text)
+    pieces = []
+    for index, line in enumerate(text.split("\n")):
+        if index:
+            pieces.append("<w:br/>")
+        for tab_index, chunk in enumerate(line.split("\t")):
+            if tab_index:
+                pieces.append("<w:tab/>")
+            if chunk:
+                space = ' xml:space="preserve"' if chunk != chunk.strip() else ""
+                pieces.append(f"<w:t{space}>{escape(chunk)}</w:t>")
+    return "".join(pieces)
+
+
+def run_xml(text, bold, italic):
+    properties = ("<w:b/>" if bold else "") + ("<w:i/>" if italic else "")
+    if properties:
+        properties = f"<w:rPr>{properties}</w:rPr>"
+    return f"<w:r>{properties}{text_xml(text)}</w:r>"
+
+
+def paragraph_xml(block):
+    properties = ""
+    if block["style"]:
+        properties += f'<w:pStyle w:val="{block["style"]}"/>'
+    if block.get("align"):
+        properties += f'<w:jc w:val="{block["align"]}"/>'
+    if properties:
+        properties = f"<w:pPr>{properties}</w:pPr>"
+    runs = "".join(run_xml(text, bold, italic) for text, bold, italic in block["runs"] if text)
+    return f"<w:p>{properties}{runs}</w:p>"
+
+
+# 📄 Render blocks into DOCX bytes
+def render_docx(blocks):
+    parts, head, tail = get_base_package()
+    body = "".join(paragraph_xml(block) for block in blocks)
+
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as package:
+        for info, data in parts:
+            # A fresh ZipInfo per write: writestr() fills in sizes/offsets, so a shared one
+            # would be modified by renders running in other threads
+            entry = zipfile.ZipInfo(info.filename, info.date_time)
+            entry.compress_type = info.compress_type
+            entry.external_attr = info.external_attr
+            package.writestr(entry, data if data is not None else head + body + tail)
+    return stream.getvalue()
@@ -0,0 +1,109 @@
+# 📦 Standard Libraries
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+# 🌐 Google API Libraries
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaInMemoryUpload
+
+# 🧩 Shared helpers
+from common.concurrency import drive_slot
+from common.google_clients import get_drive_service, new_batch_request
+from common.metrics import submit_in_context
+from common.profiler import stage
+from common.rate_limiter import RateLimiter
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Files up to DRIVE_MULTIPART_MAX_MB go up in one multipart request; bigger ones use a
+#    resumable session (one extra round trip, but it can resume after a dropped connection)
+DRIVE_MULTIPART_MAX_BYTES = int(float(os.getenv("DRIVE_MULTIPART_MAX_MB", "5")) * 1024 * 1024)
+
+# 🚦 Uploads from every row go through one queue: a fixed number of upload workers and an
+#    optional writes-per-minute cap (0 = none), so bursts of finished rows don't hit 429s
+DRIVE_UPLOAD_WORKERS = int(os.getenv("DRIVE_UPLOAD_WORKERS", "4"))
+DRIVE_UPLOADS_PER_MINUTE = int(os.getenv("DRIVE_UPLOADS_PER_MINUTE", "0"))
+DRIVE_UPLOAD_RETRIES = int(os.getenv("DRIVE_UPLOAD_RETRIES", "3"))
+
+# 📦 Drive accepts at most 100 calls per batch request
+DRIVE_BATCH_SIZE = 100
+
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+GOOGLE_DOC_MIME_TYPE = "application/vnd.google-apps.document"
+
+
+# ⏳ Seconds to back off for a Drive rate-limit error, or None if the error is something else.
+#    Only requests Drive rejected outright are retried: nothing was created, so no duplicates.
+def rate_limit_delay(error, attempt):
+    status = error.resp.status
+    if status == 429 or (status == 403 and b"ateLimitExceeded" in (error.content or b"")):
+        retry_after = error.resp.get("retry-after")
+        return float(retry_after) if retry_after else 2**attempt
+    return None
+
+
+# 📤 Shared upload queue (one per process)
+class UploadQueue:
+    def __init__(self, workers=DRIVE_UPLOAD_WORKERS, uploads_per_minute=DRIVE_UPLOADS_PER_MINUTE):
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="drive-upload")
+        self.limiter = RateLimiter(uploads_per_minute)
+
+    # 📤 Upload bytes as a new file in `folder_id` and return its id. DOCX content is
+    #    converted to a Google Doc (convert_to=None keeps the file as it is).
+    def upload(self, data, name, folder_id, mimetype=DOCX_MIME_TYPE, convert_to=GOOGLE_DOC_MIME_TYPE):
+        future = submit_in_context(self.executor, self._upload, data, name, folder_id, mimetype, convert_to)
+        return future.result()
+
+    def _upload(self, data, name, folder_id, mimetype, convert_to):
+        metadata = {"name": name, "parents": [folder_id]}
+        if convert_to:
+            metadata["mimeType"] = convert_to
+
+        for attempt in range(DRIVE_UPLOAD_RETRIES + 1):
+            # A fresh media object per attempt: a failed upload leaves it partly consumed
+            media = MediaInMemoryUpload(
+                data, mimetype=mimetype, resumable=len(data) > DRIVE_MULTIPART_MAX_BYTES
+            )
+            self.limiter.acquire()
+            try:
+                with drive_slot, stage("drive.upload", len(data)):
+                    return (
+                        get_drive_service()
+                        .files()
+                        .create(body=metadata, media_body=media, fields="id", supportsAllDrives=True)
+                        .execute()
+                    )["id"]
+            except HttpError as e:
+                delay = rate_limit_delay(e, attempt)
+                if delay is None or attempt == DRIVE_UPLOAD_RETRIES:
+                    raise
+                print(f"⏳ Drive rate limit on upload of {name}, retrying in {delay:.0f}s...")
+                self.limiter.pause(delay)
+
+
+upload_queue = UploadQueue()
+
+
+# 📇 Metadata of many files with one batch request per 100 ids: {file_id: metadata}.
+#    Files that could not be read are left out (callers fall back to a single get).
+def get_files_metadata(file_ids, fields="id, name"):
+    file_ids = list(dict.fromkeys(file_ids))
+    found = {}
+
+    def collect(request_id, response, exception):
+        if exception is None:
+            found[request_id] = response
+
+    service = get_drive_service()
+    for start in range(0, len(file_ids), DRIVE_BATCH_SIZE):
+        batch = new_batch_request("drive", "v3", callback=collect)
+        for file_id in file_ids[start : start + DRIVE_BATCH_SIZE]:
+            batch.add(
+                service.files().get(fileId=file_id, fields=fields, supportsAllDrives=True),
+                request_id=file_id,
+            )
+        with drive_slot, stage("drive.batch"):
+            batch.execute()
+    return found
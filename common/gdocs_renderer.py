@@ -0,0 +1,145 @@
+# 🧩 Shared helpers
+from common.concurrency import drive_slot
+from common.drive_uploads import upload_queue
+from common.google_clients import get_drive_service, get_docs_service
+from common.profiler import stage
+
+# 📝 Native Google Docs output: an empty Doc is created in the folder and filled with ONE
+#    documents.batchUpdate built from the same blocks as the DOCX renderer, so there is no
+#    DOCX serialization, no media upload and no server-side conversion.
+
+GOOGLE_DOC_MIME_TYPE = "application/vnd.google-apps.document"
+
+# 🎨 Word style ids (common/doc_blocks.py) -> Docs named styles; bullets are NORMAL_TEXT + a list
+NAMED_STYLES = {
+    "Title": "TITLE",
+    "Heading1": "HEADING_1",
+    "Heading2": "HEADING_2",
+    "Heading3": "HEADING_3",
+}
+ALIGNMENTS = {"left": "START", "center": "CENTER", "right": "END", "both": "JUSTIFIED"}
+BULLET_PRESET = "BULLET_DISC_CIRCLE_SQUARE"
+
+
+# 📏 Docs indexes count UTF-16 code units, not Python characters
+def utf16_len(text):
+    return len(text.encode("utf-16-le")) // 2
+
+
+def bullet_level(style):
+    if not style or not style.startswith("ListBullet"):
+        return 0
+    return int(style[len("ListBullet") :] or 1)
+
+
+# 🧾 batchUpdate requests for a list of blocks, written into a new (empty) document.
+#    All text goes in with one insertText; styles follow. Bullets come last, from the end of
+#    the document backwards: createParagraphBullets turns leading tabs into nesting levels
+#    and removes them, which shifts every index after the list.
+def blocks_to_requests(blocks):
+    paragraphs = []
+    for block in blocks:
+        level = bullet_level(block["style"])
+        prefix = "\t" * (level - 1) if level > 1 else ""
+        paragraphs.append((block, prefix, prefix + "".join(text for text, _, _ in block["runs"])))
+
+    document_text = "\n".join(text for _, _, text in paragraphs)
+    requests = [{"insertText": {"location": {"index": 1}, "text": document_text}}] if document_text else []
+
+    style_requests = []
+    bullet_ranges = []
+    index = 1
+    for block, prefix, text in paragraphs:
+        start, end = index, index + utf16_len(text) + 1  # Paragraph range includes its newline
+
+        paragraph_style = {"namedStyleType": NAMED_STYLES.get(block["style"], "NORMAL_TEXT")}
+        if block.get("align") in ALIGNMENTS:
+            paragraph_style["alignment"] = ALIGNMENTS[block["align"]]
+        if paragraph_style != {"namedStyleType": "NORMAL_TEXT"}:
+            style_requests.append(
+                {
+                    "updateParagraphStyle": {
+                        "range": {"startIndex": start, "endIndex": end},
+                        "paragraphStyle": paragraph_style,
+                        "fields": ",".join(paragraph_style),
+                    }
+                }
+            )
+
+        # ✨ Bold/italic ranges
+        position = start + utf16_len(prefix)
+        for run_text, bold, italic in block["runs"]:
+            length = utf16_len(run_text)
+            if length and (bold or italic):
+                style_requests.append(
+                    {
+                        "updateTextStyle": {
+                            "range": {"startIndex": position, "endIndex": position + length},
+                            "textStyle": {"bold": bold, "italic": italic},
+                            "fields": "bold,italic",
+                        }
+                    }
+                )
+            position += length
+
+        if bullet_level(block["style"]):
+            bullet_ranges.append((start, end))
+        index = end
+
+    # 📌 One list per run of consecutive bullet paragraphs (so nesting stays within a list)
+    lists = []
+    current = None
+    for start, end in bullet_ranges:
+        if current and current[1] == start:
+            current[1] = end
+        else:
+            current = [start, end]
+            lists.append(current)
+    bullet_requests = [
+        {
+            "createParagraphBullets": {
+                "range": {"startIndex": start, "endIndex": end},
+                "bulletPreset": BULLET_PRESET,
+            }
+        }
+        for start, end in reversed(lists)
+    ]
+    return requests + style_requests + bullet_requests
+
+
+# 📝 Create a Google Doc named `name` in `folder_id` from blocks; returns the file id.
+#    Two API calls per document: Drive files.create + Docs documents.batchUpdate.
+def create_google_doc(blocks, name, folder_id):
+    upload_queue.limiter.acquire()  # Same writes-per-minute budget as DOCX uploads
+    with drive_slot, stage("drive.create"):
+        created = (
+            get_drive_service()
+            .files()
+            .create(
+                body={"name": name, "parents": [folder_id], "mimeType": GOOGLE_DOC_MIME_TYPE},
+                fields="id",
+                supportsAllDrives=True,
+            )
+            .execute()
+        )
+
+    requests = blocks_to_requests(blocks)
+    try:
+        if requests:
+            with drive_slot, stage("drive.docs_update"):
+                get_docs_service().documents().batchUpdate(
+                    documentId=created["id"], body={"requests": requests}
+                ).execute()
+    except Exception:
+        # 🧹 Do not leave an empty document behind
+        try:
+            with drive_slot:
+                get_drive_service().files().delete(
+                    fileId=created["id"], supportsAllDrives=True
+                ).execute()
+        except Exception as e:
+            print(f"⚠️ Could not delete unfinished document {created['id']}: {e}")
+        raise
+
+    print(f"📝 Google Doc created: {name} (ID: {created['id']})")
+    return created["id"]
@@ -0,0 +1,109 @@
+# 📦 Standard Libraries
+import os
+import json
+import threading
+from dotenv import load_dotenv
+
+# 🌐 Google API Libraries
+import httplib2
+import google_auth_httplib2
+from google.oauth2 import service_account
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import BatchHttpRequest
+
+# 🔐 Load environment variables
+load_dotenv()
+SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE")
+GOOGLE_HTTP_TIMEOUT = int(os.getenv("GOOGLE_HTTP_TIMEOUT", "120"))
+
+# 🔌 Alternative API host, e.g. http://127.0.0.1:8090 for benchmarks/google_stub.py
+GOOGLE_API_ENDPOINT = os.getenv("GOOGLE_API_ENDPOINT")
+
+# 🔑 Scope sets used across the app (one cached client per API + scope set)
+DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive"]
+SHEETS_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+DOCS_SCOPES = [
+    "https://www.googleapis.com/auth/documents",
+    "https://www.googleapis.com/auth/drive",
+]
+
+# 🧠 Process-wide caches: credentials and discovery documents are shared by every thread,
+#    while each thread gets its own keep-alive HTTP connection (httplib2 is not thread-safe)
+_lock = threading.Lock()
+_credentials = {}
+_discovery_docs = {}
+_local = threading.local()
+
+
+# 🔐 Load service-account credentials once per scope set (tokens refresh automatically)
+def get_credentials(scopes):
+    key = tuple(sorted(scopes))
+    with _lock:
+        if key not in _credentials:
+            _credentials[key] = service_account.Credentials.from_service_account_file(
+                SERVICE_ACCOUNT_FILE, scopes=list(key)
+            )
+        return _credentials[key]
+
+
+# 📜 Load an API discovery document once (bundled copy first, network only as a fallback).
+#    With GOOGLE_API_ENDPOINT the root URLs are pointed at it: the client builds media upload
+#    and batch URLs from rootUrl, and api_endpoint alone only swaps their host (not the scheme)
+def get_discovery_document(api, version):
+    key = (api, version)
+    with _lock:
+        if key not in _discovery_docs:
+            document = get_static_doc(api, version)
+            if document is None:
+                url = f"https://{api}.googleapis.com/$discovery/rest?version={version}"
+                _, content = httplib2.Http(timeout=GOOGLE_HTTP_TIMEOUT).request(url)
+                document = content.decode("utf-8")
+            if GOOGLE_API_ENDPOINT:
+                parsed = json.loads(document)
+                parsed["rootUrl"] = parsed["mtlsRootUrl"] = f"{GOOGLE_API_ENDPOINT.rstrip('/')}/"
+                document = json.dumps(parsed)
+            _discovery_docs[key] = document
+        return _discovery_docs[key]
+
+
+# 🏭 Return this thread's client for an API, building it on first use
+def get_service(api, version, scopes):
+    services = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
+
+    key = (api, version, tuple(sorted(scopes)))
+    if key not in services:
+        http = google_auth_httplib2.AuthorizedHttp(
+            get_credentials(scopes), http=httplib2.Http(timeout=GOOGLE_HTTP_TIMEOUT)
+        )
+        services[key] = build_from_document(get_discovery_document(api, version), http=http)
+    return services[key]
+
+
+# 📁 Google Drive v3 client for the current thread
+def get_drive_service():
+    return get_service("drive", "v3", DRIVE_SCOPES)
+
+
+# 📊 Google Sheets v4 client for the current thread
+def get_sheets_service():
+    return get_service("sheets", "v4", SHEETS_SCOPES)
+
+
+# 📝 Google Docs v1 client for the current thread
+def get_docs_service():
+    return get_service("docs", "v1", DOCS_SCOPES)
+
+
+# 📦 Batch request for an API: up to 100 calls in one HTTP round trip. Built here because
+#    the client library takes the batch URL from the discovery document, so this one must be
+#    the (possibly GOOGLE_API_ENDPOINT-rewritten) shared copy; execute it in the thread whose
+#    client created the calls.
+def new_batch_request(api, version, callback=None):
+    document = json.loads(get_discovery_document(api, version))
+    return BatchHttpRequest(callback=callback, batch_uri=document["rootUrl"] + document.get("batchPath", "batch"))
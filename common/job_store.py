@@ -0,0 +1,259 @@
+# 📦 Standard Libraries
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import contextvars
+from contextlib import contextmanager
+from dotenv import load_dotenv
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Durable job queue used by daemon mode
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", ".cache/jobs.sqlite3")
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_DELAY_SECONDS = int(os.getenv("JOB_RETRY_DELAY_SECONDS", "60"))
+JOB_ERROR_COOLDOWN_SECONDS = int(os.getenv("JOB_ERROR_COOLDOWN_SECONDS", "3600"))
+
+# 🧵 Job the current code is working for (copied into worker threads by submit_in_context)
+current_job = contextvars.ContextVar("current_job", default=None)
+
+
+# 🗄️ SQLite-backed queue of per-row website/audio jobs with leases and stage checkpoints.
+#    A job leased by a worker that dies is picked up again once its lease expires,
+#    and resumes after the last checkpointed stage.
+class JobStore:
+    def __init__(self, path=JOB_STORE_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    row INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    inputs_hash TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at REAL NOT NULL DEFAULT 0,
+                    lease_owner TEXT,
+                    lease_token TEXT,
+                    lease_expires REAL,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL
+                )
+                """
+            )
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    job_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL,
+                    PRIMARY KEY (job_id, stage)
+                )
+                """
+            )
+
+    def _job(self, row):
+        if row is None:
+            return None
+        keys = ("id", "row", "kind", "inputs_hash", "payload", "status", "attempts", "result", "error")
+        job = dict(zip(keys, row))
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    # ➕ Queue a job; an unchanged job is left alone (unless it gave up more than
+    #    JOB_ERROR_COOLDOWN_SECONDS ago: then it gets a fresh set of attempts, keeping its
+    #    checkpoints), changed inputs restart it from scratch
+    def enqueue(self, row, kind, inputs_hash, payload, cooldown_seconds=JOB_ERROR_COOLDOWN_SECONDS):
+        job_id = f"{row}:{kind}"
+        now = time.time()
+        with self.lock, self.connection:
+            existing = self.connection.execute(
+                "SELECT inputs_hash, status, updated_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if existing and existing[0] == inputs_hash:
+                if existing[1] != "error" or now - (existing[2] or 0) < cooldown_seconds:
+                    return False
+                self.connection.execute(
+                    """
+                    UPDATE jobs SET status = 'queued', attempts = 0, available_at = 0, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (now, job_id),
+                )
+                return True
+            self.connection.execute("DELETE FROM checkpoints WHERE job_id = ?", (job_id,))
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO jobs (id, row, kind, inputs_hash, payload, status, updated_at)
+                VALUES (?, ?, ?, ?, ?, 'queued', ?)
+                """,
+                (job_id, row, kind, inputs_hash, json.dumps(payload), now),
+            )
+            return True
+
+    # ➕ Queue the jobs of one sheet row and drop jobs for branches the row no longer has
+    def enqueue_row(self, row, inputs_hash, jobs):
+        with self.lock, self.connection:
+            stale = [
+                job_id
+                for (job_id, kind) in self.connection.execute(
+                    "SELECT id, kind FROM jobs WHERE row = ?", (row,)
+                ).fetchall()
+                if kind not in jobs
+            ]
+            for job_id in stale:
+                self.connection.execute("DELETE FROM checkpoints WHERE job_id = ?", (job_id,))
+                self.connection.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        return sum(self.enqueue(row, kind, inputs_hash, payload) for kind, payload in jobs.items())
+
+    # 🔒 Take the oldest runnable job (queued, or running under an expired lease)
+    def lease(self, owner, lease_seconds=JOB_LEASE_SECONDS):
+        token = uuid.uuid4().hex
+        now = time.time()
+        with self.lock, self.connection:
+            # A job whose worker kept dying is given up on instead of being leased forever
+            self.connection.execute(
+                """
+                UPDATE jobs SET status = 'error', error = 'Lease expired too many times', updated_at = ?
+                WHERE status = 'running' AND lease_expires < ? AND attempts >= ?
+                """,
+                (now, now, JOB_MAX_ATTEMPTS),
+            )
+            self.connection.execute(
+                """
+                UPDATE jobs
+                SET status = 'running', lease_owner = ?, lease_token = ?, lease_expires = ?,
+                    attempts = attempts + 1, updated_at = ?
+                WHERE id = (
+                    SELECT id FROM jobs
+                    WHERE (status = 'queued' AND available_at <= ?)
+                       OR (status = 'running' AND lease_expires < ?)
+                    ORDER BY row, kind
+                    LIMIT 1
+                )
+                """,
+                (owner, token, now + lease_seconds, now, now, now),
+            )
+            return self._job(
+                self.connection.execute(
+                    """
+                    SELECT id, row, kind, inputs_hash, payload, status, attempts, result, error
+                    FROM jobs WHERE lease_token = ?
+                    """,
+                    (token,),
+                ).fetchone()
+            )
+
+    # 💓 Extend the leases of jobs this worker is still running
+    def renew(self, owner, job_ids, lease_seconds=JOB_LEASE_SECONDS):
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND lease_owner = ? AND status = 'running'",
+                [(time.time() + lease_seconds, job_id, owner) for job_id in job_ids],
+            )
+
+    def complete(self, job_id, result):
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_owner = NULL,
+                    lease_token = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (result, time.time(), job_id),
+            )
+
+    # ❌ Retry later (checkpoints are kept), or give up after JOB_MAX_ATTEMPTS
+    def fail(self, job_id, error, max_attempts=JOB_MAX_ATTEMPTS):
+        with self.lock, self.connection:
+            attempts = self.connection.execute(
+                "SELECT attempts FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()[0]
+            status = "error" if attempts >= max_attempts else "queued"
+            delay = JOB_RETRY_DELAY_SECONDS * 2 ** (attempts - 1)
+            self.connection.execute(
+                """
+                UPDATE jobs SET status = ?, error = ?, available_at = ?, lease_owner = NULL,
+                    lease_token = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (status, str(error)[:500], time.time() + delay, time.time(), job_id),
+            )
+            return status
+
+    # 📋 All jobs of one sheet row
+    def row_jobs(self, row):
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT id, row, kind, inputs_hash, payload, status, attempts, result, error
+                FROM jobs WHERE row = ?
+                """,
+                (row,),
+            ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self):
+        with self.lock:
+            return dict(
+                self.connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+            )
+
+    # 📍 (found, value) of a stage checkpoint
+    def get_checkpoint(self, job_id, stage):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM checkpoints WHERE job_id = ? AND stage = ?", (job_id, stage)
+            ).fetchone()
+        return (True, json.loads(row[0])) if row else (False, None)
+
+    def save_checkpoint(self, job_id, stage, value):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)",
+                (job_id, stage, json.dumps(value), time.time()),
+            )
+
+
+# 🧵 Run everything inside this block (including submit_in_context workers) as part of a job
+@contextmanager
+def job_context(store, job_id):
+    token = current_job.set((store, job_id))
+    try:
+        yield
+    finally:
+        current_job.reset(token)
+
+
+# 📍 Run one pipeline stage, or return its result from an earlier attempt of the same job.
+#    Outside a job (one-shot mode) the stage simply runs. `valid(value)` can reject a stale
+#    checkpoint, e.g. a downloaded file that no longer exists.
+def checkpointed(stage, fn, *args, valid=None, **kwargs):
+    job = current_job.get()
+    if job is None:
+        return fn(*args, **kwargs)
+
+    store, job_id = job
+    found, value = store.get_checkpoint(job_id, stage)
+    if found and (valid is None or valid(value)):
+        print(f"⏯️ Job {job_id}: resuming after stage '{stage.split(':')[0]}'")
+        return value
+
+    value = fn(*args, **kwargs)
+    store.save_checkpoint(job_id, stage, value)
+    return value
@@ -0,0 +1,192 @@
+# 📦 Standard Libraries
+import json
+
+# ✨ Typographic double quotes used as JSON string delimiters by some model answers
+SMART_OPEN_QUOTES = "“„"
+SMART_CLOSE_QUOTES = "”"
+
+# 🐍 Python-style literals that sometimes replace JSON ones
+LITERAL_FIXES = {"True": "true", "False": "false", "None": "null"}
+
+
+# 🔍 Yield every top-level {...} in the text (balanced, string-aware).
+#    An object cut off by the end of the text is yielded too, so it can be repaired.
+def find_json_objects(text):
+    start = None
+    depth = 0
+    in_string = False
+    escaped = False
+    for position, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"' and start is not None:
+            in_string = True
+        elif char == "{":
+            if depth == 0:
+                start = position
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start : position + 1]
+                start = None
+
+    if start is not None:
+        yield text[start:]
+
+
+# 🩹 Fix the usual LLM JSON mistakes: smart-quote delimiters, raw newlines in strings,
+#    trailing commas, Python literals, and output truncated mid-string or mid-array
+def repair_json(text):
+    out = []
+    closers = []          # Expected closing brackets, innermost last
+    in_string = False
+    smart_string = False  # String opened with a typographic quote
+    escaped = False
+    i = 0
+
+    while i < len(text):
+        char = text[i]
+
+        if in_string:
+            if escaped:
+                escaped = False
+                out.append(char)
+            elif char == "\\":
+                escaped = True
+                out.append(char)
+            elif (char == '"' and not smart_string) or (smart_string and char in SMART_CLOSE_QUOTES):
+                in_string = False
+                out.append('"')
+            elif char == '"':
+                out.append('\\"')  # Plain quote inside a smart-quoted string
+            elif char == "\n":
+                out.append("\\n")
+            elif char == "\r":
+                pass
+            elif char == "\t":
+                out.append("\\t")
+            else:
+                out.append(char)
+            i += 1
+            continue
+
+        if char == '"' or char in SMART_OPEN_QUOTES or char in SMART_CLOSE_QUOTES:
+            in_string = True
+            smart_string = char != '"'
+            out.append('"')
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+            out.append(char)
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if closers:
+                closers.pop()
+            out.append(char)
+        elif char.isalpha():
+            word_end = i
+            while word_end < len(text) and text[word_end].isalpha():
+                word_end += 1
+            word = text[i:word_end]
+            out.append(LITERAL_FIXES.get(word, word))
+            i = word_end
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    # ✂️ Truncated output: close the open string, drop a dangling key/comma, close brackets
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+    repaired = "".join(out).rstrip()
+    if closers:
+        repaired = _drop_incomplete_tail(repaired)
+    for closer in reversed(closers):
+        repaired = repaired.rstrip().rstrip(",") + closer
+    return repaired
+
+
+def _drop_trailing_comma(out):
+    position = len(out) - 1
+    while position >= 0 and out[position].isspace():
+        position -= 1
+    if position >= 0 and out[position] == ",":
+        del out[position]
+
+
+# ✂️ Remove a half-written member at the end ( `"key":` or `"key"` with no value yet)
+def _drop_incomplete_tail(text):
+    stripped = text.rstrip().rstrip(",").rstrip()
+    if stripped.endswith(":"):
+        stripped = stripped[:-1].rstrip()
+        return _drop_string_at_end(stripped)
+    if stripped.endswith('"'):
+        # A bare string directly after "{" or "," inside an object is a key without a value
+        before = _drop_string_at_end(stripped).rstrip()
+        if before.endswith(("{", ",")) and _innermost_is_object(before):
+            return before
+    return stripped
+
+
+def _drop_string_at_end(text):
+    position = len(text) - 2
+    while position >= 0:
+        if text[position] == '"' and (position == 0 or text[position - 1] != "\\"):
+            return text[:position]
+        position -= 1
+    return text
+
+
+def _innermost_is_object(text):
+    in_string = False
+    escaped = False
+    stack = []
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append(char)
+        elif char in "}]" and stack:
+            stack.pop()
+    return bool(stack) and stack[-1] == "{"
+
+
+# ⚡ Parse the JSON object in a model answer: strict parse first, repairs only when needed
+def parse_json_object(text):
+    text = text.strip()
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    candidates = list(find_json_objects(text))
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            pass
+    for candidate in candidates:
+        try:
+            return json.loads(repair_json(candidate))
+        except json.JSONDecodeError:
+            pass
+
+    raise ValueError("Response did not contain a JSON object that could be parsed or repaired.")
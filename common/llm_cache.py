@@ -0,0 +1,193 @@
+# 📦 Standard Libraries
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Cache configuration (LLM_CACHE_BACKEND: "sqlite" = memory + SQLite, "memory", or "none")
+LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "sqlite").lower()
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "256"))
+
+
+# 🔑 Stable hash of a prompt template, stored alongside entries for invalidation
+def hash_template(template):
+    return hashlib.sha256((template or "").encode("utf-8")).hexdigest()
+
+
+# 🧠 In-memory LRU backend
+class MemoryLRUBackend:
+    def __init__(self, max_entries=LLM_CACHE_MEMORY_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _, _ = entry
+            if expires_at and expires_at < time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at, namespace, template_hash):
+        with self.lock:
+            self.entries[key] = (value, expires_at, namespace, template_hash)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    # 🧹 Drop entries of a namespace that were produced by a different prompt template
+    #    (entries promoted from a slower tier carry no namespace and are dropped too)
+    def invalidate(self, namespace, template_hash):
+        with self.lock:
+            stale = [
+                key
+                for key, (_, _, entry_namespace, entry_hash) in self.entries.items()
+                if entry_namespace in (namespace, None) and entry_hash != template_hash
+            ]
+            for key in stale:
+                del self.entries[key]
+            return len(stale)
+
+
+# 💾 Persistent SQLite backend (one shared connection guarded by a lock)
+class SQLiteBackend:
+    def __init__(self, path=LLM_CACHE_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    namespace TEXT,
+                    template_hash TEXT
+                )
+                """
+            )
+
+    def get(self, key):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at and expires_at < time.time():
+                with self.connection:
+                    self.connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            return value
+
+    def set(self, key, value, expires_at, namespace, template_hash):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, value, expires_at, namespace, template_hash),
+            )
+
+    def invalidate(self, namespace, template_hash):
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM responses WHERE namespace = ? AND template_hash != ?",
+                (namespace, template_hash),
+            )
+            return cursor.rowcount
+
+
+# 🗃️ Tiered response cache: checks backends in order and promotes hits to faster tiers
+class ResponseCache:
+    def __init__(self, backends, ttl_seconds=LLM_CACHE_TTL_SECONDS):
+        self.backends = backends
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        self.checked_templates = set()
+        self.hits = 0
+        self.misses = 0
+
+    # 🔑 Key = hash of the model, temperature and full prompt messages
+    def make_key(self, model, messages, temperature):
+        payload = json.dumps(
+            {"model": model, "temperature": temperature, "messages": messages},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # 🧹 Once per process, drop entries created with an older version of this template
+    def register_template(self, namespace, template):
+        template_hash = hash_template(template)
+        with self.lock:
+            if (namespace, template_hash) in self.checked_templates:
+                return template_hash
+            self.checked_templates.add((namespace, template_hash))
+
+        removed = sum(b.invalidate(namespace, template_hash) for b in self.backends)
+        if removed:
+            print(f"🧹 LLM cache: dropped {removed} stale '{namespace}' entries (prompt changed).")
+        return template_hash
+
+    def get(self, key):
+        for index, backend in enumerate(self.backends):
+            value = backend.get(key)
+            if value is not None:
+                # Promote to the faster tiers in front of this one
+                for faster in self.backends[:index]:
+                    faster.set(key, value, self._expires_at(), None, None)
+                with self.lock:
+                    self.hits += 1
+                return value
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value, namespace=None, template=None):
+        template_hash = hash_template(template) if template is not None else None
+        expires_at = self._expires_at()
+        for backend in self.backends:
+            backend.set(key, value, expires_at, namespace, template_hash)
+
+    def _expires_at(self):
+        return time.time() + self.ttl_seconds if self.ttl_seconds else None
+
+    # 📊 Hit/miss statistics for the current process
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# 🏭 Build the configured cache (an empty backend list disables caching)
+def build_response_cache(backend=LLM_CACHE_BACKEND):
+    if backend == "none":
+        return ResponseCache([])
+    if backend == "memory":
+        return ResponseCache([MemoryLRUBackend()])
+    return ResponseCache([MemoryLRUBackend(), SQLiteBackend()])
+
+
+# 🌍 Shared cache instance used by every summarizer
+response_cache = build_response_cache()
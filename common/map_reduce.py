@@ -0,0 +1,115 @@
+# 📦 Standard Libraries
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+# 🧩 Shared helpers
+from common.tokens import count_tokens, split_by_tokens
+from common.metrics import submit_in_context
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Inputs above the threshold are summarized piecewise (map) and then merged (reduce)
+MAP_REDUCE_THRESHOLD_TOKENS = int(os.getenv("MAP_REDUCE_THRESHOLD_TOKENS", "24000"))
+MAP_CHUNK_TOKENS = int(os.getenv("MAP_CHUNK_TOKENS", "8000"))
+REDUCE_INPUT_TOKENS = int(os.getenv("REDUCE_INPUT_TOKENS", "24000"))
+MAP_CONCURRENCY = int(os.getenv("MAP_CONCURRENCY", "4"))
+
+
+# ❓ Should this input go through map-reduce instead of a single call?
+def needs_map_reduce(text, threshold=MAP_REDUCE_THRESHOLD_TOKENS):
+    return count_tokens(text) > threshold
+
+
+# 📦 Group partial results so each group's JSON fits in one reduce prompt
+def _group_partials(partials, max_tokens):
+    groups = []
+    current = []
+    current_tokens = 0
+    for partial in partials:
+        partial_tokens = count_tokens(json.dumps(partial, ensure_ascii=False))
+        if current and current_tokens + partial_tokens > max_tokens:
+            groups.append(current)
+            current = []
+            current_tokens = 0
+        current.append(partial)
+        current_tokens += partial_tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+# ✂️ Shrink a partial result whose JSON is over max_tokens, so no reduce prompt is ever built
+#    from an oversized partial: lists of bullets lose their last items and long texts are cut
+#    at a line boundary, while short fields (titles, headings) and the structure stay intact
+def _shrink_partial(partial, max_tokens):
+    def cut(value, ratio):
+        if isinstance(value, str) and len(value) > 200:
+            kept = value[: int(len(value) * ratio)]
+            return kept[: kept.rfind("\n")] if "\n" in kept else kept
+        if isinstance(value, list):
+            if len(value) > 1 and all(isinstance(item, str) for item in value):
+                return value[: max(1, int(len(value) * ratio))]
+            return [cut(item, ratio) for item in value]
+        if isinstance(value, dict):
+            return {key: cut(item, ratio) for key, item in value.items()}
+        return value
+
+    for _ in range(10):
+        tokens = count_tokens(json.dumps(partial, ensure_ascii=False))
+        if tokens <= max_tokens:
+            return partial
+        partial = cut(partial, max_tokens / tokens * 0.9)
+    return partial
+
+
+# 🧵 Like executor.map, but workers keep the caller's context (row tag for metrics/budgets)
+def _run_all(executor, fn, items):
+    futures = [submit_in_context(executor, fn, item) for item in items]
+    return [future.result() for future in futures]
+
+
+# 🌲 Merge partial results with reduce_fn(list_of_partials) -> merged JSON, in groups until a
+#    single reduce call can see every partial. Partials are capped at half the reduce budget,
+#    so every group holds at least two of them and each round makes progress; a group of one
+#    is passed through unchanged. Anything that merges many partials should go through here.
+def reduce_partials(
+    partials,
+    reduce_fn,
+    reduce_tokens=REDUCE_INPUT_TOKENS,
+    max_workers=MAP_CONCURRENCY,
+    executor=None,
+):
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(partials)))) as executor:
+            return reduce_partials(partials, reduce_fn, reduce_tokens, executor=executor)
+
+    while len(partials) > 1:
+        partials = [_shrink_partial(partial, reduce_tokens // 2) for partial in partials]
+        groups = _group_partials(partials, reduce_tokens)
+        if len(groups) == 1:
+            break
+        merged = _run_all(executor, reduce_fn, [group for group in groups if len(group) > 1])
+        partials = [group[0] if len(group) == 1 else merged.pop(0) for group in groups]
+
+    return reduce_fn(partials) if len(partials) > 1 else partials[0]
+
+
+# 🗺️ Summarize token-bounded pieces in parallel, then merge them (tree-reduce if needed)
+#    map_fn(piece) -> partial JSON, reduce_fn(list_of_partials) -> merged JSON
+def map_reduce(
+    text,
+    map_fn,
+    reduce_fn,
+    chunk_tokens=MAP_CHUNK_TOKENS,
+    reduce_tokens=REDUCE_INPUT_TOKENS,
+    max_workers=MAP_CONCURRENCY,
+):
+    pieces = split_by_tokens(text, chunk_tokens)
+    print(f"🗺️ Map-reduce: {len(pieces)} piece(s) of up to {chunk_tokens} tokens.")
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pieces)))) as executor:
+        partials = _run_all(executor, map_fn, pieces)
+        return reduce_partials(partials, reduce_fn, reduce_tokens, executor=executor)
@@ -0,0 +1,242 @@
+# 📦 Standard Libraries
+import os
+import json
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from dotenv import load_dotenv
+
+# 🧩 Shared helpers
+from common.tokens import count_tokens
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# 📝 Every OpenAI call is appended here as one JSON line
+METRICS_FILE = os.getenv("METRICS_FILE", ".cache/metrics/openai_calls.jsonl")
+
+# 💰 Optional budgets (0 = unlimited); inputs are trimmed to fit before the call is made
+ROW_TOKEN_BUDGET = int(os.getenv("ROW_TOKEN_BUDGET", "0"))
+RUN_TOKEN_BUDGET = int(os.getenv("RUN_TOKEN_BUDGET", "0"))
+ROW_COST_BUDGET_USD = float(os.getenv("ROW_COST_BUDGET_USD", "0"))
+RUN_COST_BUDGET_USD = float(os.getenv("RUN_COST_BUDGET_USD", "0"))
+
+# 🔢 Completion tokens per chat call: a rough estimate until the real usage is known, and a
+#    hard cap sent as max_tokens (0 = no cap). Both the up-front trim and the per-call check
+#    reserve COMPLETION_RESERVE_TOKENS, so a trimmed prompt always passes the check.
+COMPLETION_TOKENS_ESTIMATE = int(os.getenv("OPENAI_COMPLETION_TOKENS_ESTIMATE", "1500"))
+MAX_COMPLETION_TOKENS = int(os.getenv("OPENAI_MAX_COMPLETION_TOKENS", "4096"))
+COMPLETION_RESERVE_TOKENS = MAX_COMPLETION_TOKENS or COMPLETION_TOKENS_ESTIMATE
+
+# 💲 Prices in USD: (per 1M prompt tokens, per 1M completion tokens) or per audio minute
+CHAT_PRICES = {
+    "gpt-4.1-2025-04-14": (2.00, 8.00),
+}
+DEFAULT_CHAT_PRICE = (2.00, 8.00)
+AUDIO_PRICE_PER_MINUTE = {
+    "whisper-1": 0.006,
+}
+
+# 🧵 Sheet row the current code is working for (copied into worker threads by submit_in_context)
+current_row = contextvars.ContextVar("current_row", default=None)
+
+
+# 🚫 Raised before a call when nothing is left in the row or run budget
+class BudgetExceeded(Exception):
+    pass
+
+
+# 💰 Running token/cost totals with optional limits
+class Budget:
+    def __init__(self, max_tokens=0, max_cost_usd=0.0):
+        self.max_tokens = max_tokens
+        self.max_cost_usd = max_cost_usd
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.audio_seconds = 0.0
+        self.cost_usd = 0.0
+
+    def add(self, prompt_tokens=0, completion_tokens=0, audio_seconds=0.0, cost_usd=0.0):
+        with self.lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self.audio_seconds += audio_seconds
+            self.cost_usd += cost_usd
+
+    # 🔢 Prompt tokens still affordable under both the token and the cost limit (None = unlimited)
+    def remaining_prompt_tokens(self, model, reserve_completion_tokens):
+        with self.lock:
+            limits = []
+            if self.max_tokens:
+                used = self.prompt_tokens + self.completion_tokens
+                limits.append(self.max_tokens - used - reserve_completion_tokens)
+            if self.max_cost_usd:
+                prompt_price, completion_price = CHAT_PRICES.get(model, DEFAULT_CHAT_PRICE)
+                left = self.max_cost_usd - self.cost_usd
+                left -= reserve_completion_tokens * completion_price / 1_000_000
+                limits.append(int(left * 1_000_000 / prompt_price))
+            return min(limits) if limits else None
+
+    def remaining_cost_usd(self):
+        with self.lock:
+            return self.max_cost_usd - self.cost_usd if self.max_cost_usd else None
+
+    def totals(self):
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "audio_seconds": round(self.audio_seconds, 1),
+                "cost_usd": round(self.cost_usd, 4),
+            }
+
+
+_lock = threading.Lock()
+run_budget = Budget(RUN_TOKEN_BUDGET, RUN_COST_BUDGET_USD)
+_row_budgets = {}
+
+
+# 💰 Budget for one sheet row (shared by its website and audio branches)
+def get_row_budget(row):
+    with _lock:
+        if row not in _row_budgets:
+            _row_budgets[row] = Budget(ROW_TOKEN_BUDGET, ROW_COST_BUDGET_USD)
+        return _row_budgets[row]
+
+
+def _budgets():
+    row = current_row.get()
+    return [run_budget] if row is None else [run_budget, get_row_budget(row)]
+
+
+# 🧵 Tag everything inside this block (including submit_in_context workers) with a sheet row
+@contextmanager
+def row_context(row):
+    token = current_row.set(row)
+    try:
+        yield get_row_budget(row)
+    finally:
+        current_row.reset(token)
+
+
+# 🧵 executor.submit that carries the current row (and other context vars) into the worker
+def submit_in_context(executor, fn, *args, **kwargs):
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
+
+
+# 💲 Cost of one call
+def call_cost(model, prompt_tokens=0, completion_tokens=0, audio_seconds=0.0):
+    if model in AUDIO_PRICE_PER_MINUTE:
+        return audio_seconds / 60 * AUDIO_PRICE_PER_MINUTE[model]
+    prompt_price, completion_price = CHAT_PRICES.get(model, DEFAULT_CHAT_PRICE)
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+# ✂️ Trim `text` so the prompt fits in what is left of the row and run budgets.
+#    `overhead_tokens` is every other message in the call (system prompt, template), counted
+#    the same way check_chat_budget counts them.
+def fit_to_budget(text, model, overhead_tokens=0, reserve_completion_tokens=COMPLETION_RESERVE_TOKENS):
+    limits = [
+        budget.remaining_prompt_tokens(model, reserve_completion_tokens)
+        for budget in _budgets()
+    ]
+    limits = [limit for limit in limits if limit is not None]
+    if not limits:
+        return text
+
+    allowed = min(limits) - overhead_tokens
+    if allowed <= 0:
+        raise BudgetExceeded(f"No token/cost budget left for a {model} call.")
+
+    tokens = count_tokens(text, model)
+    if tokens <= allowed:
+        return text
+
+    print(f"✂️ Trimming input from {tokens} to ~{allowed} tokens to stay within budget.")
+    # A cut by character share is only approximate, so re-count until it really fits
+    trimmed = text
+    trimmed_tokens = tokens
+    while trimmed_tokens > allowed:
+        trimmed = trimmed[: int(len(trimmed) * allowed / trimmed_tokens * 0.98)]
+        trimmed_tokens = count_tokens(trimmed, model)
+    return trimmed
+
+
+# 🚫 Refuse a chat call whose prompt plus reserved completion the row/run budget cannot cover
+#    (fit_to_budget trims once up front; map/reduce and fill calls each need their own check)
+def check_chat_budget(model, prompt_tokens, reserve_completion_tokens):
+    for budget in _budgets():
+        remaining = budget.remaining_prompt_tokens(model, reserve_completion_tokens)
+        if remaining is not None and prompt_tokens > remaining:
+            raise BudgetExceeded(
+                f"A {model} call with {prompt_tokens} prompt + {reserve_completion_tokens} completion "
+                "tokens exceeds the remaining budget."
+            )
+
+
+# 🎧 Whether any row/run budget limits spend (the only thing audio length is checked against)
+def audio_budget_active():
+    return any(budget.max_cost_usd for budget in _budgets())
+
+
+# 🎧 Refuse a Whisper call that the remaining cost budget cannot cover
+def check_audio_budget(model, audio_seconds):
+    cost = call_cost(model, audio_seconds=audio_seconds)
+    for budget in _budgets():
+        remaining = budget.remaining_cost_usd()
+        if remaining is not None and cost > remaining:
+            raise BudgetExceeded(
+                f"Transcribing {audio_seconds:.0f}s of audio (${cost:.3f}) exceeds the remaining budget."
+            )
+
+
+# 📝 Record one OpenAI call: totals for the row/run budgets + one JSONL line
+def record_call(
+    kind,
+    model,
+    latency_seconds,
+    prompt_tokens=0,
+    completion_tokens=0,
+    audio_seconds=0.0,
+    retries=0,
+    error=None,
+):
+    cost = call_cost(model, prompt_tokens, completion_tokens, audio_seconds)
+    for budget in _budgets():
+        budget.add(prompt_tokens, completion_tokens, audio_seconds, cost)
+
+    entry = {
+        "ts": round(time.time(), 3),
+        "row": current_row.get(),
+        "kind": kind,
+        "model": model,
+        "latency_s": round(latency_seconds, 3),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "audio_seconds": round(audio_seconds, 1),
+        "retries": retries,
+        "cost_usd": round(cost, 5),
+        "error": error,
+    }
+    write_metric(entry)
+
+
+# 💾 Append one JSON line to the metrics file
+def write_metric(entry):
+    with _lock:
+        directory = os.path.dirname(METRICS_FILE)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(METRICS_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+# 📊 Write a per-row summary line once the row is finished
+def record_row_summary(row):
+    write_metric({"ts": round(time.time(), 3), "row": row, "kind": "row_summary", **get_row_budget(row).totals()})
@@ -0,0 +1,235 @@
+# 📦 Standard Libraries
+import os
+import json
+import time
+import random
+import openai
+from dotenv import load_dotenv
+
+# 🧩 Shared helpers
+from common.concurrency import openai_slot
+from common.llm_cache import response_cache
+from common.metrics import (
+    record_call,
+    check_audio_budget,
+    check_chat_budget,
+    COMPLETION_TOKENS_ESTIMATE,
+    MAX_COMPLETION_TOKENS,
+    COMPLETION_RESERVE_TOKENS,
+)
+from common.rate_limiter import RateLimiter
+from common.tokens import count_tokens
+from common.json_repair import parse_json_object
+from common.profiler import profiler
+
+# 🔐 Load environment variables
+load_dotenv()
+openai.api_key = os.getenv("OPENAI_API_KEY")
+
+# 🔌 Alternative endpoint, e.g. http://127.0.0.1:8089/v1 for benchmarks/openai_stub.py
+if os.getenv("OPENAI_API_BASE"):
+    openai.api_base = os.getenv("OPENAI_API_BASE")
+
+# 🚦 Account limits shared by every worker (0 = unlimited); keep them slightly under the real ones
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "0"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "0"))
+WHISPER_RPM = int(os.getenv("WHISPER_RPM", "0"))
+
+# 🔁 Retry settings for rate limits, timeouts and transient server errors
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+OPENAI_BACKOFF_BASE = float(os.getenv("OPENAI_BACKOFF_BASE", "1"))
+OPENAI_BACKOFF_MAX = float(os.getenv("OPENAI_BACKOFF_MAX", "60"))
+OPENAI_REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "120"))
+
+RETRYABLE_ERRORS = (
+    openai.error.RateLimitError,
+    openai.error.Timeout,
+    openai.error.APIError,
+    openai.error.ServiceUnavailableError,
+    openai.error.APIConnectionError,
+    openai.error.TryAgain,
+)
+
+chat_limiter = RateLimiter(OPENAI_RPM, OPENAI_TPM)
+whisper_limiter = RateLimiter(WHISPER_RPM)
+
+
+# ⏳ Seconds the provider asked us to wait (Retry-After header), if any
+def get_retry_after(error):
+    headers = getattr(error, "headers", None) or {}
+    for name in ("retry-after-ms", "Retry-After-Ms"):
+        if headers.get(name):
+            try:
+                return float(headers[name]) / 1000
+            except ValueError:
+                pass
+    for name in ("retry-after", "Retry-After"):
+        if headers.get(name):
+            try:
+                return float(headers[name])
+            except ValueError:
+                pass
+    return None
+
+
+# 🔁 Run `send()` under the rate limiter, retrying retryable errors with backoff + jitter.
+#    Returns (response, latency_of_last_attempt, retries).
+def call_with_retries(
+    send, limiter, estimated_tokens=0, description="OpenAI call", stage_name="openai.chat", bytes_sent=0
+):
+    for attempt in range(OPENAI_MAX_RETRIES + 1):
+        limiter.acquire(estimated_tokens)
+        with openai_slot, profiler.stage(stage_name, bytes_sent):
+            started = time.perf_counter()
+            try:
+                return send(), time.perf_counter() - started, attempt
+            except RETRYABLE_ERRORS as e:
+                if attempt == OPENAI_MAX_RETRIES:
+                    e.retries = attempt
+                    raise
+                error = e
+
+        # ⏳ Honor Retry-After when given, otherwise full-jitter exponential backoff
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            wait_seconds = retry_after
+        else:
+            wait_seconds = random.uniform(0, min(OPENAI_BACKOFF_MAX, OPENAI_BACKOFF_BASE * 2**attempt))
+
+        # 🛑 A rate limit applies to the whole account, so every worker waits
+        if isinstance(error, openai.error.RateLimitError):
+            limiter.pause(wait_seconds)
+
+        print(f"⏳ {description} failed ({type(error).__name__}), retry {attempt + 1} in {wait_seconds:.1f}s...")
+        time.sleep(wait_seconds)
+
+
+# 💬 Send one chat completion and return (content, usage); every call is recorded in metrics
+def chat_completion(model, messages, temperature):
+    prompt_tokens = sum(count_tokens(message["content"], model) for message in messages)
+    estimated_tokens = prompt_tokens + COMPLETION_TOKENS_ESTIMATE
+
+    # 💰 Every call is checked on its own, reserving the most it can complete
+    check_chat_budget(model, prompt_tokens, COMPLETION_RESERVE_TOKENS)
+    limits = {"max_tokens": MAX_COMPLETION_TOKENS} if MAX_COMPLETION_TOKENS else {}
+
+    started = time.perf_counter()
+    try:
+        response, latency, retries = call_with_retries(
+            lambda: openai.ChatCompletion.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                request_timeout=OPENAI_REQUEST_TIMEOUT,
+                **limits,
+            ),
+            chat_limiter,
+            estimated_tokens,
+            description=f"{model} chat",
+        )
+    except Exception as e:
+        record_call(
+            "chat",
+            model,
+            time.perf_counter() - started,
+            retries=getattr(e, "retries", 0),
+            error=str(e)[:200],
+        )
+        raise
+
+    usage = dict(response.get("usage") or {})
+    chat_limiter.settle(estimated_tokens, usage.get("total_tokens", 0))
+    record_call(
+        "chat",
+        model,
+        latency,
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+        retries=retries,
+    )
+    return response["choices"][0]["message"]["content"], usage
+
+
+# 🎙️ Send one audio file to Whisper; checked against the cost budget and recorded in metrics
+def transcribe(audio_file, model, task, response_format="text", audio_seconds=0.0):
+    check_audio_budget(model, audio_seconds)
+    audio_file.seek(0, os.SEEK_END)
+    audio_bytes = audio_file.tell()
+
+    def send():
+        audio_file.seek(0)  # Re-send the whole file on a retry
+        return openai.Audio.transcribe(
+            model=model,
+            file=audio_file,
+            response_format=response_format,
+            task=task,
+            request_timeout=OPENAI_REQUEST_TIMEOUT,
+        )
+
+    started = time.perf_counter()
+    try:
+        response, latency, retries = call_with_retries(
+            send,
+            whisper_limiter,
+            description=f"{model} transcription",
+            stage_name="openai.whisper",
+            bytes_sent=audio_bytes,
+        )
+    except Exception as e:
+        record_call(
+            "transcription",
+            model,
+            time.perf_counter() - started,
+            retries=getattr(e, "retries", 0),
+            error=str(e)[:200],
+        )
+        raise
+
+    record_call(
+        "transcription", model, latency, audio_seconds=audio_seconds, retries=retries
+    )
+    return response
+
+
+# 🗃️ Chat completion through the response cache; `parse` turns the answer into data
+#    and only answers that parse successfully are cached
+def cached_chat(
+    model, messages, temperature, parse, namespace, template, usage=None, stage="single"
+):
+    response_cache.register_template(namespace, template)
+    cache_key = response_cache.make_key(model, messages, temperature)
+
+    content = response_cache.get(cache_key)
+    if content is not None:
+        if usage is not None:
+            usage.add(stage, cached=True)
+        return parse(content)
+
+    content, call_usage = chat_completion(model, messages, temperature)
+    if usage is not None:
+        usage.add(stage, call_usage)
+
+    result = parse(content)
+    response_cache.set(cache_key, content, namespace=namespace, template=template)
+    return result
+
+
+# 🧩 Ask only for the parts missing from a structured answer: the original conversation is
+#    continued with the partial answer, so the model does not redo what it already returned
+def request_missing_sections(
+    model, messages, temperature, partial, fill_prompt, namespace, template, usage=None
+):
+    follow_up = messages + [
+        {"role": "assistant", "content": json.dumps(partial, ensure_ascii=False)},
+        {"role": "user", "content": fill_prompt},
+    ]
+    return cached_chat(
+        model,
+        follow_up,
+        temperature,
+        parse=parse_json_object,
+        namespace=namespace,
+        template=template,
+        usage=usage,
+        stage="fill",
+    )
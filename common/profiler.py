@@ -0,0 +1,201 @@
+# 📦 Standard Libraries
+import os
+import io
+import sys
+import json
+import time
+import pstats
+import cProfile
+import threading
+from contextlib import contextmanager
+from dotenv import load_dotenv
+
+# 🧩 Shared helpers
+from common.metrics import current_row
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# 📁 Where run reports (JSON) and cProfile dumps are written
+PROFILE_DIR = os.getenv("PROFILE_DIR", ".cache/profiles")
+
+
+# 📏 Nearest-rank percentile of a sorted list
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+# ⏱️ Collects one sample per stage run: stage name, sheet row, seconds, bytes
+class StageProfiler:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.perf_counter()
+            self.started_at = time.time()
+            self.samples = []
+            self.active = {}
+            self.peak = {}
+
+    @contextmanager
+    def stage(self, name, bytes_transferred=0):
+        sample = {"stage": name, "row": current_row.get(), "bytes": bytes_transferred}
+        with self.lock:
+            self.active[name] = self.active.get(name, 0) + 1
+            self.peak[name] = max(self.peak.get(name, 0), self.active[name])
+        started = time.perf_counter()
+        try:
+            yield sample
+        finally:
+            sample["seconds"] = time.perf_counter() - started
+            with self.lock:
+                self.active[name] -= 1
+                self.samples.append(sample)
+
+    # 📊 Per-stage p50/p95, bytes and concurrency; `capacities` maps a stage prefix to its
+    #    worker/slot limit so utilization = average concurrency / limit
+    def report(self, capacities=None):
+        with self.lock:
+            samples = list(self.samples)
+            peak = dict(self.peak)
+            wall_seconds = time.perf_counter() - self.started
+
+        stages = {}
+        for sample in samples:
+            stages.setdefault(sample["stage"], []).append(sample)
+
+        report_stages = {}
+        for name, runs in sorted(stages.items()):
+            durations = sorted(run["seconds"] for run in runs)
+            busy_seconds = sum(durations)
+            report_stages[name] = {
+                "count": len(runs),
+                "total_s": round(busy_seconds, 3),
+                "p50_s": round(percentile(durations, 0.50), 3),
+                "p95_s": round(percentile(durations, 0.95), 3),
+                "max_s": round(durations[-1], 3),
+                "bytes": sum(run["bytes"] for run in runs),
+                "avg_concurrency": round(busy_seconds / wall_seconds, 2) if wall_seconds else 0,
+                "peak_concurrency": peak.get(name, 0),
+            }
+
+        utilization = {}
+        for prefix, capacity in (capacities or {}).items():
+            busy = sum(stage["total_s"] for name, stage in report_stages.items() if name.startswith(prefix))
+            utilization[prefix] = round(busy / (wall_seconds * capacity), 3) if wall_seconds and capacity else 0
+
+        rows = {}
+        for sample in samples:
+            if sample["row"] is not None:
+                row = rows.setdefault(str(sample["row"]), {})
+                row[sample["stage"]] = round(row.get(sample["stage"], 0) + sample["seconds"], 3)
+
+        return {
+            "started_at": round(self.started_at, 3),
+            "wall_s": round(wall_seconds, 3),
+            "stages": report_stages,
+            "utilization": utilization,
+            "rows": rows,
+        }
+
+    # 🖨️ Print the report as a table and export it as JSON (returns the JSON path)
+    def print_report(self, capacities=None, export=True):
+        report = self.report(capacities)
+        print(f"\n⏱️ Run report ({report['wall_s']:.1f}s wall time)")
+        print(f"{'stage':<22}{'count':>7}{'p50 s':>9}{'p95 s':>9}{'max s':>9}{'total s':>10}{'MB':>9}{'avg/peak':>11}")
+        for name, stage in report["stages"].items():
+            print(
+                f"{name:<22}{stage['count']:>7}{stage['p50_s']:>9.2f}{stage['p95_s']:>9.2f}"
+                f"{stage['max_s']:>9.2f}{stage['total_s']:>10.2f}{stage['bytes'] / (1024*1024):>9.2f}"
+                f"{stage['avg_concurrency']:>7.2f}/{stage['peak_concurrency']:<3}"
+            )
+        for prefix, value in report["utilization"].items():
+            print(f"🧵 {prefix}* utilization: {value:.0%}")
+
+        if not export:
+            return None
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"run-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Run report saved to {path}")
+        return path
+
+
+# 📸 Stats of a profiler that may still be running in another thread: disable() only acts
+#    on the calling thread, so the data is snapshotted instead of stopping the profiler
+class ProfileSnapshot:
+    def __init__(self, profile):
+        profile.snapshot_stats()
+        self.stats = profile.stats
+
+    def create_stats(self):
+        pass
+
+
+# 🔬 cProfile for the main thread and every thread started while it is active.
+#    Python 3.12+ profiles through sys.monitoring: one profiler already sees every thread,
+#    and a second enabled one would raise. Older versions only see the enabling thread, so
+#    each new thread starts its own profiler from a threading.setprofile hook.
+class ThreadedCProfile:
+    PROCESS_WIDE = sys.version_info >= (3, 12)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.profiles = []
+
+    # Runs inside a new thread's bootstrap: it must never raise, or the thread dies before
+    # running its target (and an executor waiting on it hangs)
+    def _start_in_thread(self, frame, event, arg):
+        sys.setprofile(None)
+        try:
+            profile = cProfile.Profile()
+            profile.enable()
+        except Exception as e:
+            print(f"⚠️ cProfile not started in {threading.current_thread().name}: {e}")
+            return
+        with self.lock:
+            self.profiles.append(profile)
+
+    def __enter__(self):
+        main_profile = cProfile.Profile()
+        self.profiles.append(main_profile)
+        main_profile.enable()
+        if not self.PROCESS_WIDE:
+            threading.setprofile(self._start_in_thread)
+        return self
+
+    def __exit__(self, *exc):
+        if not self.PROCESS_WIDE:
+            threading.setprofile(None)
+        self.profiles[0].disable()
+        return False
+
+    # 💾 Dump merged stats (open with `python -m pstats` or snakeviz) and print the top entries
+    def save(self, top=25):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"run-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+        with self.lock:
+            stats = pstats.Stats(
+                self.profiles[0],
+                *[ProfileSnapshot(profile) for profile in self.profiles[1:]],
+                stream=io.StringIO(),
+            )
+        stats.dump_stats(path)
+
+        output = io.StringIO()
+        stats.stream = output
+        stats.sort_stats("cumulative").print_stats(top)
+        print(output.getvalue())
+        print(f"💾 cProfile stats saved to {path}")
+        return path
+
+
+# 🔗 Shared profiler used by every module
+profiler = StageProfiler()
+stage = profiler.stage
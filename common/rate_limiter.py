@@ -0,0 +1,70 @@
+import time
+import threading
+
+
+# 🪣 Token bucket: `capacity` units, refilled continuously at `capacity` per `period` seconds
+class TokenBucket:
+    def __init__(self, capacity, period=60.0):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    # ⏳ Seconds until `amount` units are available (0 = available now)
+    def wait_time(self, amount, now):
+        self._refill(now)
+        amount = min(amount, self.capacity)  # A request bigger than the bucket waits for a full one
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def take(self, amount):
+        self.available -= min(amount, self.capacity)
+
+    # ↩️ Give back (or charge extra for) the difference between estimate and actual usage
+    def adjust(self, amount):
+        self.available = min(self.capacity, self.available + amount)
+
+
+# 🚦 Requests-per-minute + tokens-per-minute limiter shared by every worker thread
+#    (0 disables a limit). A 429 pauses all callers until the provider's Retry-After passes.
+class RateLimiter:
+    def __init__(self, requests_per_minute=0, tokens_per_minute=0):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    # ⏳ Block until one request using ~`tokens` tokens fits under both limits
+    def acquire(self, tokens=0):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = self.paused_until - now
+                if self.requests:
+                    wait = max(wait, self.requests.wait_time(1, now))
+                if self.tokens and tokens:
+                    wait = max(wait, self.tokens.wait_time(tokens, now))
+
+                if wait <= 0:
+                    if self.requests:
+                        self.requests.take(1)
+                    if self.tokens and tokens:
+                        self.tokens.take(tokens)
+                    return
+            time.sleep(min(wait, 5.0))
+
+    # 🧾 Correct the token bucket once the real usage is known
+    def settle(self, estimated_tokens, actual_tokens):
+        if self.tokens and actual_tokens:
+            with self.lock:
+                self.tokens.adjust(estimated_tokens - actual_tokens)
+
+    # 🛑 Hold every caller back for `seconds` (provider said we are over the limit)
+    def pause(self, seconds):
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
@@ -0,0 +1,116 @@
+# 📦 Standard Libraries
+import os
+import json
+import hashlib
+import threading
+from dotenv import load_dotenv
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Local index of processed sheet rows
+ROW_INDEX_PATH = os.getenv("ROW_INDEX_PATH", ".cache/row_index.json")
+INCREMENTAL_SCAN = os.getenv("INCREMENTAL_SCAN", "true").lower() == "true"
+
+# 🔢 Input columns A:C (date, website URL, audio folder link)
+INPUT_COLUMNS = 3
+
+
+# 🔑 Hash of a row's input cells, used to notice edits to already-processed rows
+def hash_inputs(row):
+    cells = [(row[i] if len(row) > i else "").strip() for i in range(INPUT_COLUMNS)]
+    return hashlib.sha256("\x1f".join(cells).encode("utf-8")).hexdigest()
+
+
+# 🗂️ Row number -> input hash + output links, persisted as JSON
+class RowIndex:
+    def __init__(self, spreadsheet_id, path=ROW_INDEX_PATH):
+        self.spreadsheet_id = spreadsheet_id
+        self.path = path
+        self.lock = threading.Lock()
+        self.rows = {}
+        self.branches = {}  # Rows that finished with errors -> links of the branches that succeeded
+        self.sheet_modified = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # A different spreadsheet means a fresh index
+        if data.get("spreadsheet_id") != self.spreadsheet_id:
+            return
+        self.rows = {int(row): entry for row, entry in data.get("rows", {}).items()}
+        self.branches = {int(row): entry for row, entry in data.get("branches", {}).items()}
+        self.sheet_modified = data.get("sheet_modified")
+
+    # 💾 Atomically write the index to disk
+    def save(self):
+        with self.lock:
+            data = {
+                "spreadsheet_id": self.spreadsheet_id,
+                "sheet_modified": self.sheet_modified,
+                "rows": {str(row): entry for row, entry in sorted(self.rows.items())},
+                "branches": {str(row): entry for row, entry in sorted(self.branches.items())},
+            }
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+
+    # ➕ Remember a processed row
+    def record(self, row, inputs_hash, website_link="", audio_link=""):
+        with self.lock:
+            self.rows[row] = {
+                "hash": inputs_hash,
+                "website": website_link,
+                "audio": audio_link,
+            }
+            self.branches.pop(row, None)
+
+    # 🧩 Remember the branches that succeeded in a row that failed overall, so the retry
+    #    reuses their documents instead of uploading duplicates
+    def record_branches(self, row, inputs_hash, website_link="", audio_link=""):
+        with self.lock:
+            self.branches[row] = {
+                "hash": inputs_hash,
+                "website": "" if website_link == "ERROR" else website_link,
+                "audio": "" if audio_link == "ERROR" else audio_link,
+            }
+
+    # 🔗 Link a branch produced for these exact inputs in an earlier, failed run (or None)
+    def branch_output(self, row, inputs_hash, branch):
+        with self.lock:
+            entry = self.branches.get(row)
+            if entry is None or entry["hash"] != inputs_hash:
+                return None
+            return entry.get(branch) or None
+
+    def has(self, row):
+        with self.lock:
+            return row in self.rows
+
+    # ✅ Row was processed and its inputs have not changed since
+    def is_current(self, row, inputs_hash):
+        with self.lock:
+            entry = self.rows.get(row)
+            return entry is not None and entry["hash"] == inputs_hash
+
+    # ❌ Rows that finished with errors: below the watermark, but still to be retried
+    def errored_rows(self):
+        with self.lock:
+            return sorted(self.branches)
+
+    # 📏 Last row N such that rows 2..N are all indexed, done or errored (everything up to N
+    #    except the errored rows can be skipped)
+    def watermark(self):
+        with self.lock:
+            row = 1
+            while row + 1 in self.rows or row + 1 in self.branches:
+                row += 1
+            return row
@@ -0,0 +1,192 @@
+# 📦 Standard Libraries
+import os
+import json
+import time
+import random
+import threading
+from dotenv import load_dotenv
+
+# 🌐 Google API Libraries
+from googleapiclient.errors import HttpError
+from common.google_clients import get_sheets_service
+from common.profiler import stage
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Flush when this many rows are buffered, or every N seconds, whichever comes first
+SHEET_FLUSH_ROWS = int(os.getenv("SHEET_FLUSH_ROWS", "25"))
+SHEET_FLUSH_SECONDS = float(os.getenv("SHEET_FLUSH_SECONDS", "10"))
+SHEET_MAX_RETRIES = int(os.getenv("SHEET_MAX_RETRIES", "6"))
+
+# 📓 Write-ahead journal: finished rows land here before they reach the sheet
+SHEET_JOURNAL_PATH = os.getenv("SHEET_JOURNAL_PATH", ".cache/sheet_results.jsonl")
+
+# 🔁 HTTP statuses worth retrying (quota exceeded / transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+# 📝 Buffers per-row D:F results and writes them with values().batchUpdate
+class BufferedSheetWriter:
+    def __init__(
+        self,
+        spreadsheet_id,
+        sheet_name="Sheet1",
+        first_column="D",
+        last_column="F",
+        flush_rows=SHEET_FLUSH_ROWS,
+        flush_seconds=SHEET_FLUSH_SECONDS,
+        journal_path=SHEET_JOURNAL_PATH,
+    ):
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_name = sheet_name
+        self.first_column = first_column
+        self.last_column = last_column
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.journal_path = journal_path
+
+        self.pending = {}
+        self.other_sheets = []  # Journal lines for other spreadsheets/tabs, kept as they are
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+        self._load_journal()
+
+    # 📓 Reload rows that finished in a previous run but never reached this sheet. Entries are
+    #    tagged with their spreadsheet and tab, so a changed GOOGLE_SHEET_ID never replays (or
+    #    skips) rows that belong to another sheet; those stay in the journal for a later run.
+    def _load_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        untagged = 0
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn last line from a crash
+                if "spreadsheet_id" not in entry:
+                    untagged += 1  # Older journal format: the sheet is unknown, so the row is redone
+                    continue
+                if (entry["spreadsheet_id"], entry.get("sheet_name")) != (self.spreadsheet_id, self.sheet_name):
+                    self.other_sheets.append(line if line.endswith("\n") else line + "\n")
+                    continue
+                self.pending[entry["row"]] = entry["values"]
+        if untagged:
+            print(f"📓 Ignored {untagged} journal row(s) not tagged with a spreadsheet; they will be processed again.")
+        if self.pending:
+            print(f"📓 Recovered {len(self.pending)} unflushed row result(s) from the journal.")
+
+    # 📓 Rewrite the journal so it only holds rows that are still unflushed
+    def _rewrite_journal(self):
+        directory = os.path.dirname(self.journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.journal_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.writelines(self.other_sheets)
+            for row, values in self.pending.items():
+                f.write(self._journal_line(row, values))
+        os.replace(temp_path, self.journal_path)
+
+    def _journal_line(self, row, values):
+        entry = {"spreadsheet_id": self.spreadsheet_id, "sheet_name": self.sheet_name, "row": row, "values": values}
+        return json.dumps(entry) + "\n"
+
+    # 🔢 Rows already finished (flushed or not) that must not be processed again
+    def finished_rows(self):
+        with self.lock:
+            return set(self.pending)
+
+    # ➕ Record one finished row; it is durable as soon as this returns
+    def add(self, row, values):
+        directory = os.path.dirname(self.journal_path)
+        with self.lock:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(self._journal_line(row, values))
+                f.flush()
+                os.fsync(f.fileno())
+            self.pending[row] = values
+            if len(self.pending) >= self.flush_rows:
+                self.wake.set()
+
+    # 📤 Send every buffered row in one batchUpdate, backing off on 429 / 5xx
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                batch = dict(self.pending)
+            if not batch:
+                return
+
+            body = {
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {
+                        "range": f"{self.sheet_name}!{self.first_column}{row}:{self.last_column}{row}",
+                        "values": [values],
+                    }
+                    for row, values in sorted(batch.items())
+                ],
+            }
+
+            for attempt in range(SHEET_MAX_RETRIES + 1):
+                try:
+                    with stage("sheets.write"):
+                        get_sheets_service().spreadsheets().values().batchUpdate(
+                            spreadsheetId=self.spreadsheet_id, body=body
+                        ).execute()
+                    break
+                except HttpError as e:
+                    if e.resp.status not in RETRYABLE_STATUSES or attempt == SHEET_MAX_RETRIES:
+                        raise
+                    retry_after = e.resp.get("retry-after")
+                    wait_seconds = (
+                        float(retry_after)
+                        if retry_after
+                        else min(64, 2**attempt) + random.random()
+                    )
+                    print(f"⏳ Sheets write throttled ({e.resp.status}), retrying in {wait_seconds:.1f}s...")
+                    time.sleep(wait_seconds)
+
+            # ✅ Drop flushed rows unless a newer result arrived meanwhile
+            with self.lock:
+                for row, values in batch.items():
+                    if self.pending.get(row) == values:
+                        del self.pending[row]
+                self._rewrite_journal()
+
+            print(f"📝 Wrote {len(batch)} row result(s) to the sheet.")
+
+    # 🔁 Background loop: flush on the interval or when the buffer fills up
+    def _run(self):
+        while not self.stopping:
+            self.wake.wait(self.flush_seconds)
+            self.wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ Sheet flush failed (results kept in journal): {e}")
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    # 🛑 Stop the background loop and flush whatever is left
+    def close(self):
+        self.stopping = True
+        self.wake.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
@@ -0,0 +1,112 @@
+# 📦 Standard Libraries
+import re
+import threading
+
+# 🔢 tiktoken gives exact counts; without it we fall back to a ~4 chars/token estimate
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+_encodings = {}
+_encodings_lock = threading.Lock()
+
+# ✂️ Sentence boundary: end punctuation followed by whitespace
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+# 🔤 Return (and memoize) the tiktoken encoding for a model
+def _get_encoding(model):
+    with _encodings_lock:
+        if model not in _encodings:
+            try:
+                _encodings[model] = tiktoken.encoding_for_model(model)
+            except KeyError:
+                _encodings[model] = tiktoken.get_encoding("cl100k_base")
+        return _encodings[model]
+
+
+# 🔢 Count tokens in a piece of text
+def count_tokens(text, model="gpt-4o"):
+    if not text:
+        return 0
+    if tiktoken is None:
+        return len(text) // 4 + 1
+    return len(_get_encoding(model).encode(text, disallowed_special=()))
+
+
+# ✂️ Halve text (between words, or between characters for a single huge "word" such as a
+#    URL or base64 blob) until every part fits the budget
+def _bisect(text, max_tokens):
+    if count_tokens(text) <= max_tokens:
+        return [text]
+    words = text.split()
+    if len(words) > 1:
+        middle = len(words) // 2
+        halves = [" ".join(words[:middle]), " ".join(words[middle:])]
+    else:
+        middle = max(1, len(text) // 2)
+        halves = [text[:middle], text[middle:]]
+    return _bisect(halves[0], max_tokens) + _bisect(halves[1], max_tokens)
+
+
+# 🧱 Break an oversized unit into sentences, then halve any sentence that is still too big
+def _split_unit(unit, max_tokens):
+    if count_tokens(unit) <= max_tokens:
+        return [unit]
+
+    pieces = []
+    for sentence in SENTENCE_BOUNDARY.split(unit):
+        pieces.extend(_bisect(sentence, max_tokens))
+    return pieces
+
+
+# ✂️ Split text on paragraph/line/sentence boundaries into pieces of at most max_tokens
+def split_by_tokens(text, max_tokens):
+    units = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        for line in paragraph.splitlines():
+            if line.strip():
+                units.extend(_split_unit(line.strip(), max_tokens))
+
+    # 📦 Greedily pack units into pieces without crossing the token budget
+    pieces = []
+    current = []
+    current_tokens = 0
+    for unit in units:
+        unit_tokens = count_tokens(unit) + 1  # + the newline joining it to the previous unit
+        if current and current_tokens + unit_tokens > max_tokens:
+            pieces.append("\n".join(current))
+            current = []
+            current_tokens = 0
+        current.append(unit)
+        current_tokens += unit_tokens
+
+    if current:
+        pieces.append("\n".join(current))
+    return pieces
+
+
+# 📊 Thread-safe token counter grouped by pipeline stage (e.g. "map", "reduce")
+class TokenUsage:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = {}
+
+    def add(self, stage, usage=None, cached=False):
+        usage = usage or {}
+        with self.lock:
+            totals = self.stages.setdefault(
+                stage,
+                {"calls": 0, "cached_calls": 0, "prompt_tokens": 0, "completion_tokens": 0},
+            )
+            if cached:
+                totals["cached_calls"] += 1
+                return
+            totals["calls"] += 1
+            totals["prompt_tokens"] += usage.get("prompt_tokens", 0)
+            totals["completion_tokens"] += usage.get("completion_tokens", 0)
+
+    def summary(self):
+        with self.lock:
+            return {stage: dict(totals) for stage, totals in self.stages.items()}
@@ -1,29 +1,54 @@
 # 📦 Standard Libraries
+import io
 import os
 import re
+import time
+import signal
+import socket
+import argparse
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from dotenv import load_dotenv
 
 # 🌐 Website Processing Modules
-from website.extract import extract_text_from_url
+from website.crawler import extract_site_text
 from website.summarize import summarize_with_openai
-from website.document import create_docx_in_memory as create_website_doc
-from website.drive import upload_docx_to_gdrive
+from website.document import website_blocks
+from website.drive import upload_docx_to_gdrive, FOLDER_ID as WEBSITE_DRIVE_FOLDER_ID
 
 # 🎧 Audio Processing Modules
-from audio.transcription import transcribe_audio, split_audio
-from audio.summarizer import generate_summary
-from audio.doc_generator import generate_docx as create_audio_doc
-from audio.drive_utils import upload_file_to_drive_in_memory, download_audio_from_drive
-
-# 📊 Google Sheets & Drive API
-from googleapiclient.discovery import build
-from google.oauth2 import service_account
+from audio.folder_processor import process_audio_folder
+from audio.transcript_cache import transcript_cache
+
+# 📊 Google Sheets & Drive API (shared, per-thread pooled clients)
+from common.google_clients import get_drive_service, get_sheets_service
+
+# 🚦 Shared concurrency limits
+from common.concurrency import MAX_ROW_WORKERS, MAX_OPENAI_CALLS, MAX_DRIVE_CALLS, drive_slot
+from common.llm_cache import response_cache
+from common.sheet_writer import BufferedSheetWriter
+from common.row_index import RowIndex, hash_inputs, INCREMENTAL_SCAN
+from common.metrics import row_context, submit_in_context, record_row_summary, run_budget
+from common.job_store import JobStore, job_context, checkpointed, JOB_MAX_ATTEMPTS
+from common.profiler import profiler, stage, ThreadedCProfile
+from common.doc_output import publish_document
+from common.drive_uploads import get_files_metadata
 
 # 🔐 Load environment variables
 load_dotenv()
 GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
-SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE")
-AUDIO_DRIVE_FOLDER_ID = os.getenv("AUDIO_DRIVE_FOLDER_ID")
+
+# 🔁 Daemon mode: how often the sheet is polled, and how often finished jobs are collected
+DAEMON_POLL_SECONDS = int(os.getenv("DAEMON_POLL_SECONDS", "60"))
+DAEMON_TICK_SECONDS = 5
+
+# ⏱️ Worker/slot limit behind each stage prefix (utilization figures in the run report)
+PROFILE_CAPACITIES = {
+    "branch.": MAX_ROW_WORKERS,
+    "openai.": MAX_OPENAI_CALLS,
+    "drive.": MAX_DRIVE_CALLS,
+}
 
 
 # 🔗 Extract folder ID from Google Drive folder link
@@ -32,50 +57,43 @@ def extract_folder_id(drive_link):
     return match.group(1) if match else None
 
 
-# 🔍 Get first .m4a file ID from folder
-def get_first_m4a_file_id_in_folder(folder_id):
-    credentials = service_account.Credentials.from_service_account_file(
-        SERVICE_ACCOUNT_FILE, scopes=["https://www.googleapis.com/auth/drive"]
-    )
-    service = build("drive", "v3", credentials=credentials)
-
-    results = (
-        service.files()
-        .list(
-            q=f"'{folder_id}' in parents and mimeType contains 'audio' and trashed = false",
-            pageSize=10,
-            fields="files(id, name)",
-            includeItemsFromAllDrives=True,
-            supportsAllDrives=True,
-        )
-        .execute()
-    )
+# 📇 Folder names looked up ahead of time for a batch of rows (folder id -> name)
+folder_names = {}
+
 
-    files = results.get("files", [])
-    for file in files:
-        if file["name"].lower().endswith(".m4a"):
-            print(f"🎯 Found audio file: {file['name']}")
-            return file["id"]
-    print("⚠️ No .m4a file found in folder.")
-    return None
+# 📇 Fetch the folder names of every audio row with one Drive batch request (per 100 folders)
+#    instead of one files.get per row; a row whose name is missing falls back to its own call
+def prefetch_folder_names(rows):
+    folder_ids = [extract_folder_id(row[2]) for _, row in rows if len(row) > 2 and row[2]]
+    folder_ids = [folder_id for folder_id in folder_ids if folder_id]
+    if len(folder_ids) < 2:
+        return
+    try:
+        found = get_files_metadata(folder_ids, fields="id, name")
+    except Exception as e:
+        print(f"⚠️ Folder name prefetch failed ({e}), looking names up per row.")
+        return
+    folder_names.update({folder_id: file.get("name", "Company") for folder_id, file in found.items()})
+    print(f"📇 Prefetched {len(found)} of {len(set(folder_ids))} folder name(s) via batch requests.")
 
 
 # 📁 Get folder name (used as company name)
 def get_drive_folder_name(folder_id):
-    credentials = service_account.Credentials.from_service_account_file(
-        SERVICE_ACCOUNT_FILE, scopes=["https://www.googleapis.com/auth/drive"]
-    )
-    service = build("drive", "v3", credentials=credentials)
-
-    folder = (
-        service.files()
-        .get(
-            fileId=folder_id,
-            fields="name",
-            supportsAllDrives=True,
+    if folder_id in folder_names:
+        return folder_names[folder_id]
+
+    service = get_drive_service()
+
+    with drive_slot:
+        folder = (
+            service.files()
+            .get(
+                fileId=folder_id,
+                fields="name",
+                supportsAllDrives=True,
+            )
+            .execute()
         )
-        .execute()
-    )
 
     return folder.get("name", "Company")
 
@@ -89,141 +107,396 @@ def format_website_name(url):
     return main_parts[0].capitalize() if main_parts else "Website"
 
 
-# 🚀 Main batch processor
-def main():
-    print("🚀 Smart Summariser - Website + Audio Mode")
+# 🌐 Website branch: scrape, summarize, render and upload (returns doc link or "ERROR")
+def process_website(i, website_url, raise_errors=False):
+    with stage("branch.website"):
+        try:
+            print(f"\n🌐 Row {i}: Summarizing website: {website_url}")
+            # ⏯️ In daemon mode each stage is checkpointed, so a retried job skips finished stages
+            raw_text = checkpointed("scraped", extract_site_text, website_url)
+            with stage("website.summarize"):
+                summary = checkpointed("summarized", summarize_with_openai, raw_text)
+            title = f"{format_website_name(website_url)} Website Summary"
+
+            file_id = checkpointed(
+                "uploaded",
+                publish_document,
+                website_blocks(summary, title),
+                f"{title}.docx",
+                WEBSITE_DRIVE_FOLDER_ID,
+                lambda docx_bytes, name: upload_docx_to_gdrive(io.BytesIO(docx_bytes), name),
+            )
+            print(f"✅ Row {i}: Website summary uploaded.")
+            return f"https://docs.google.com/document/d/{file_id}/edit"
+        except Exception as e:
+            print(f"❌ Website error (row {i}): {e}")
+            if raise_errors:
+                raise
+            return "ERROR"
+
+
+# 🔊 Audio branch: download, transcribe, summarize, render and upload (returns doc link or "ERROR")
+def process_audio(i, audio_folder_link, date_only, raise_errors=False):
+    with stage("branch.audio"):
+        try:
+            print(f"\n🎧 Row {i}: Summarizing audio folder: {audio_folder_link}")
+            folder_id = extract_folder_id(audio_folder_link)
+            if not folder_id:
+                raise ValueError("Invalid folder link.")
+
+            company_name = get_drive_folder_name(folder_id)
+
+            # Every recording in the folder; date_only (without time) appears inside the document(s)
+            links = process_audio_folder(folder_id, company_name, date_only)
+
+            print(f"✅ Row {i}: Audio summary uploaded ({len(links)} document(s)).")
+            return "\n".join(links)
+        except Exception as e:
+            print(f"❌ Audio error (row {i}): {e}")
+            if raise_errors:
+                raise
+            return "ERROR"
+
+
+# 🕒 Last modification time of the spreadsheet (tells us whether anyone edited it)
+def get_sheet_modified_time():
+    service = get_drive_service()
+    with drive_slot:
+        sheet_file = (
+            service.files()
+            .get(fileId=GOOGLE_SHEET_ID, fields="modifiedTime", supportsAllDrives=True)
+            .execute()
+        )
+    return sheet_file.get("modifiedTime")
 
-    credentials = service_account.Credentials.from_service_account_file(
-        SERVICE_ACCOUNT_FILE,
-        scopes=[
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ],
-    )
-    service = build("sheets", "v4", credentials=credentials)
 
-    # Load sheet rows
+# 📥 Read a range of Sheet1 values
+def read_sheet_range(service, cell_range):
     sheet = (
         service.spreadsheets()
         .values()
-        .get(spreadsheetId=GOOGLE_SHEET_ID, range="Sheet1!A2:F")
+        .get(spreadsheetId=GOOGLE_SHEET_ID, range=cell_range)
         .execute()
     )
-    rows = sheet.get("values", [])
+    return sheet.get("values", [])
+
+
+# 📥 Read several single rows of Sheet1 (A:F) in one values().batchGet
+def read_sheet_rows(service, rows):
+    if not rows:
+        return []
+    response = (
+        service.spreadsheets()
+        .values()
+        .batchGet(spreadsheetId=GOOGLE_SHEET_ID, ranges=[f"Sheet1!A{i}:F{i}" for i in rows])
+        .execute()
+    )
+    return [
+        (i, (value_range.get("values") or [[]])[0])
+        for i, value_range in zip(rows, response.get("valueRanges", []))
+    ]
+
+
+# 🔎 Return [(row_number, row)] still needing work, reading as little of the sheet as possible
+def load_pending_rows(service, index):
+    watermark = index.watermark() if INCREMENTAL_SCAN else 1
+    start_row = watermark + 1
+    candidates = list(enumerate(read_sheet_range(service, f"Sheet1!A{start_row}:F"), start=start_row))
+
+    # ❌ Errored rows count towards the watermark but are retried: read just those rows
+    errored = read_sheet_rows(service, [i for i in index.errored_rows() if i <= watermark])
+    candidates += errored
+    seen = {i for i, _ in errored}
+
+    # ✏️ Rows up to the watermark are only re-read (inputs only) if the sheet was edited
+    edited = set()
+    if watermark >= 2:
+        print(f"⚡ Incremental scan: rows 2-{watermark} already indexed, reading from row {start_row}.")
+        sheet_modified = get_sheet_modified_time()
+        if sheet_modified != index.sheet_modified:
+            head = read_sheet_range(service, f"Sheet1!A2:C{watermark}")
+            for i, row in enumerate(head, start=2):
+                if not index.is_current(i, hash_inputs(row)) and i not in seen:
+                    edited.add(i)
+                    candidates.append((i, row))
+
+            # Edits elsewhere in the sheet only: no need to verify again next run
+            if not edited:
+                index.sheet_modified = sheet_modified
+
+    pending = []
+    for i, row in candidates:
+        status = row[5] if len(row) > 5 else ""
+        inputs_hash = hash_inputs(row)
+
+        if i in edited or (index.has(i) and not index.is_current(i, inputs_hash)):
+            print(f"✏️ Row {i}: Inputs changed since it was processed. Reprocessing.")
+            pending.append((i, row))
+        elif index.is_current(i, inputs_hash):
+            print(f"⏩ Row {i}: Already processed. Skipping.")
+        elif status.strip().lower() == "done":
+            # Done before the index existed: remember it so later scans skip it
+            index.record(
+                i,
+                inputs_hash,
+                row[3] if len(row) > 3 else "",
+                row[4] if len(row) > 4 else "",
+            )
+            print(f"⏩ Row {i}: Already processed. Skipping.")
+        else:
+            pending.append((i, row))
+
+    index.save()
+    return sorted(pending)
+
+
+# 🚀 Main batch processor
+def main():
+    print("🚀 Smart Summariser - Website + Audio Mode")
+    profiler.reset()
+
+    service = get_sheets_service()
+    index = RowIndex(GOOGLE_SHEET_ID)
+
+    # Load sheet rows that still need processing
+    rows = load_pending_rows(service, index)
     if not rows:
         print("❌ No rows to process.")
         return
+    prefetch_folder_names(rows)
+
+    # 🧵 Website and audio branches of every row run on one bounded pool.
+    #    Each finished row is journaled immediately and written to D:F in batches.
+    print(f"🧵 Processing with up to {MAX_ROW_WORKERS} concurrent workers.")
+    with BufferedSheetWriter(GOOGLE_SHEET_ID) as writer, ThreadPoolExecutor(
+        max_workers=MAX_ROW_WORKERS
+    ) as executor:
+        # Rows finished by a previous (crashed) run are flushed, never reprocessed
+        finished_rows = writer.finished_rows()
+
+        futures = {}
+        results = {}
+        remaining = {}
+
+        for i, row in rows:
+            date = row[0] if len(row) > 0 else ""
+            website_url = row[1] if len(row) > 1 else ""
+            audio_folder_link = row[2] if len(row) > 2 else ""
+
+            if i in finished_rows:
+                print(f"⏩ Row {i}: Already processed. Skipping.")
+                continue
+
+            # Format date (keep only date, remove time)
+            date_only = date.split()[0] if date else ""
+
+            results[i] = {"website": "", "audio": "", "hash": hash_inputs(row)}
+            remaining[i] = 0
+
+            # ♻️ A branch that succeeded in an earlier run of this row (the other one failed)
+            #    is not run again, so its document is not uploaded twice
+            for branch, wanted in (("website", website_url), ("audio", audio_folder_link)):
+                link = index.branch_output(i, results[i]["hash"], branch) if wanted else None
+                if link:
+                    print(f"♻️ Row {i}: Reusing {branch} document from the previous run.")
+                    results[i][branch] = link
+
+            # 🏷️ Both branches run tagged with the row (per-row OpenAI metrics and budget)
+            with row_context(i):
+                if website_url and not results[i]["website"]:
+                    future = submit_in_context(executor, process_website, i, website_url)
+                    futures[future] = (i, "website")
+                    remaining[i] += 1
+
+                if audio_folder_link and not results[i]["audio"]:
+                    future = submit_in_context(
+                        executor, process_audio, i, audio_folder_link, date_only
+                    )
+                    futures[future] = (i, "audio")
+                    remaining[i] += 1
+
+            # Nothing (left) to run for this row, mark it straight away
+            if remaining[i] == 0:
+                website_link, audio_link = results[i]["website"], results[i]["audio"]
+                writer.add(i, [website_link, audio_link, "done"])
+                index.record(i, results[i]["hash"], website_link, audio_link)
+
+        for future in as_completed(futures):
+            i, branch = futures[future]
+            results[i][branch] = future.result()
+            remaining[i] -= 1
+
+            if remaining[i] == 0:
+                website_link, audio_link = results[i]["website"], results[i]["audio"]
+
+                # ❌ A failed branch marks the row "error" (not indexed, so the next run retries it)
+                if "ERROR" in (website_link, audio_link):
+                    writer.add(i, [website_link, audio_link, "error"])
+                    index.record_branches(i, results[i]["hash"], website_link, audio_link)
+                    index.save()
+                    print(f"⚠️ Row {i}: Finished with errors, will be retried next run.")
+                else:
+                    writer.add(i, [website_link, audio_link, "done"])
+                    index.record(i, results[i]["hash"], website_link, audio_link)
+                    index.save()
+                    print(f"📝 Row {i}: Finished, queued for sheet write.")
+                record_row_summary(i)
+
+    # 🕒 Remember the sheet's state after our own writes so the next run can skip verification
+    index.sheet_modified = get_sheet_modified_time()
+    index.save()
+
+    print(f"🗃️ Transcript cache: {transcript_cache.stats()}")
+    print(f"🗃️ LLM response cache: {response_cache.stats()}")
+    print(f"💰 OpenAI usage this run: {run_budget.totals()}")
+    profiler.print_report(PROFILE_CAPACITIES)
+    print("\n✅ All rows processed successfully.")
+
 
-    for i, row in enumerate(rows, start=2):  # Starting from row 2
+# 📨 Queue website/audio jobs for every sheet row that still needs work
+def enqueue_pending_rows(store, service, index, writer):
+    queued = 0
+    rows = load_pending_rows(service, index)
+    prefetch_folder_names(rows)
+    for i, row in rows:
         date = row[0] if len(row) > 0 else ""
         website_url = row[1] if len(row) > 1 else ""
         audio_folder_link = row[2] if len(row) > 2 else ""
-        status = row[5] if len(row) > 5 else ""
-
-        if status.strip().lower() == "done":
-            print(f"⏩ Row {i}: Already processed. Skipping.")
-            continue
-
-        website_doc_link = ""
-        audio_doc_link = ""
+        inputs_hash = hash_inputs(row)
 
-        # Format date (keep only date, remove time)
-        date_only = date.split()[0] if date else ""
-
-        # 🌐 Process Website
+        jobs = {}
         if website_url:
-            try:
-                print(f"\n🌐 Row {i}: Summarizing website: {website_url}")
-                raw_text = extract_text_from_url(website_url)
-                summary = summarize_with_openai(raw_text)
-                name = format_website_name(website_url)
-                doc_stream = create_website_doc(summary, f"{name} Website Summary")
-                file_id = upload_docx_to_gdrive(
-                    doc_stream, f"{name} Website Summary.docx"
-                )
-                website_doc_link = f"https://docs.google.com/document/d/{file_id}/edit"
-                print("✅ Website summary uploaded.")
-            except Exception as e:
-                print(f"❌ Website error (row {i}): {e}")
-                website_doc_link = "ERROR"
-
-        # 🔊 Process Audio
+            jobs["website"] = {"url": website_url}
         if audio_folder_link:
-            try:
-                print(f"\n🎧 Row {i}: Summarizing audio folder: {audio_folder_link}")
-                folder_id = extract_folder_id(audio_folder_link)
-                if not folder_id:
-                    raise ValueError("Invalid folder link.")
+            jobs["audio"] = {"link": audio_folder_link, "date": date.split()[0] if date else ""}
 
-                audio_file_id = get_first_m4a_file_id_in_folder(folder_id)
-                if not audio_file_id:
-                    raise FileNotFoundError("No .m4a file found in folder.")
+        # Nothing to run for this row, mark it straight away
+        if not jobs:
+            writer.add(i, ["", "", "done"])
+            index.record(i, inputs_hash)
+            continue
 
-                company_name = get_drive_folder_name(folder_id)
+        queued += store.enqueue_row(i, inputs_hash, jobs)
 
-                audio_path = download_audio_from_drive(audio_file_id)
+    index.save()
+    if queued:
+        print(f"📨 Queued {queued} new job(s). Queue: {store.counts()}")
 
-                # Check file size in bytes (25 MB = 25 * 1024 * 1024)
-                file_size_bytes = os.path.getsize(audio_path)
-                max_size_bytes = 25 * 1024 * 1024
 
-                if file_size_bytes > max_size_bytes:
-                    print(
-                        f"⚠️ Audio file size {file_size_bytes / (1024*1024):.2f} MB exceeds 25 MB, splitting..."
-                    )
-                    chunks = split_audio(audio_path)
-                else:
-                    print(
-                        f"ℹ️ Audio file size {file_size_bytes / (1024*1024):.2f} MB is under 25 MB, processing whole file."
-                    )
-                    chunks = [audio_path]
-
-                transcripts = [transcribe_audio(chunk) for chunk in chunks]
-                full_transcript = "\n".join(transcripts)
-                summary_data = generate_summary(full_transcript)
-
-                # Pass date_only (without time) to appear inside the document
-                docx_file = create_audio_doc(summary_data, company_name, date_only)
-                final_name = f"{company_name} Meeting Notes.docx"
-
-                uploaded_id = upload_file_to_drive_in_memory(
-                    docx_file, folder_id=AUDIO_DRIVE_FOLDER_ID, final_name=final_name
-                )
-                audio_doc_link = (
-                    f"https://docs.google.com/document/d/{uploaded_id}/edit"
-                )
-
-                # Clean up chunk files if split
-                if len(chunks) > 1:
-                    for chunk_file in chunks:
-                        if os.path.exists(chunk_file):
-                            os.remove(chunk_file)
-
-                # Always remove original audio file
-                if os.path.exists(audio_path):
-                    os.remove(audio_path)
-
-                print("✅ Audio summary uploaded.")
-            except Exception as e:
-                print(f"❌ Audio error (row {i}): {e}")
-                audio_doc_link = "ERROR"
-
-        # 📝 Write results to columns D, E, F
-        update_body = {"values": [[website_doc_link, audio_doc_link, "done"]]}
-        service.spreadsheets().values().update(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=f"Sheet1!D{i}:F{i}",
-            valueInputOption="USER_ENTERED",
-            body=update_body,
-        ).execute()
+# 🏃 Run one leased job inside its row + job context (stages resume from checkpoints)
+def run_job(store, job):
+    with row_context(job["row"]), job_context(store, job["id"]):
+        payload = job["payload"]
+        if job["kind"] == "website":
+            return process_website(job["row"], payload["url"], raise_errors=True)
+        return process_audio(job["row"], payload["link"], payload["date"], raise_errors=True)
 
-    print("\n✅ All rows processed successfully.")
+
+# 📝 Once every job of a row has finished (or given up), write the row back to the sheet
+def write_row_if_finished(store, index, writer, row):
+    jobs = {job["kind"]: job for job in store.row_jobs(row)}
+    if any(job["status"] not in ("done", "error") for job in jobs.values()):
+        return
+
+    website = jobs.get("website")
+    audio = jobs.get("audio")
+    values = [
+        (job["result"] if job["status"] == "done" else "ERROR") if job else ""
+        for job in (website, audio)
+    ]
+    if all(job["status"] == "done" for job in jobs.values()):
+        writer.add(row, values + ["done"])
+        index.record(row, next(iter(jobs.values()))["inputs_hash"], values[0], values[1])
+        index.save()
+        print(f"📝 Row {row}: Finished, queued for sheet write.")
+    else:
+        # Indexed as errored so the incremental scan moves past it; its failed jobs are
+        # queued again once JOB_ERROR_COOLDOWN_SECONDS have passed
+        writer.add(row, values + ["error"])
+        index.record_branches(row, next(iter(jobs.values()))["inputs_hash"], values[0], values[1])
+        index.save()
+        print(f"⚠️ Row {row}: Gave up after {JOB_MAX_ATTEMPTS} attempt(s), marked as error (retried after a cool-down).")
+    record_row_summary(row)
+
+
+# 🔁 Daemon mode: poll the sheet, queue jobs in the local SQLite store and keep the pool busy.
+#    A restart (or a second worker) picks up expired leases and resumes from the last checkpoint.
+def run_daemon():
+    print("🚀 Smart Summariser - Daemon Mode")
+    profiler.reset()
+    store = JobStore()
+    service = get_sheets_service()
+    index = RowIndex(GOOGLE_SHEET_ID)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    stopping = threading.Event()
+
+    def stop(signum, frame):
+        print("🛑 Stopping after the running jobs finish...")
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    with BufferedSheetWriter(GOOGLE_SHEET_ID) as writer, ThreadPoolExecutor(
+        max_workers=MAX_ROW_WORKERS
+    ) as executor:
+        running = {}
+        next_poll = 0
+        while not stopping.is_set() or running:
+            if not stopping.is_set() and time.monotonic() >= next_poll:
+                try:
+                    enqueue_pending_rows(store, service, index, writer)
+                except Exception as e:
+                    print(f"⚠️ Sheet poll failed: {e}")
+                next_poll = time.monotonic() + DAEMON_POLL_SECONDS
+
+            # 🔒 Fill free workers with leased jobs
+            while not stopping.is_set() and len(running) < MAX_ROW_WORKERS:
+                job = store.lease(worker_id)
+                if job is None:
+                    break
+                print(f"🏃 Job {job['id']} (attempt {job['attempts']}) started.")
+                running[executor.submit(run_job, store, job)] = job
+
+            done, _ = wait(running, timeout=DAEMON_TICK_SECONDS, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                try:
+                    store.complete(job["id"], future.result())
+                except Exception as e:
+                    status = store.fail(job["id"], e)
+                    print(f"⚠️ Job {job['id']} failed ({status}): {e}")
+                write_row_if_finished(store, index, writer, job["row"])
+
+            # 💓 Keep the leases of still-running jobs alive
+            store.renew(worker_id, [job["id"] for job in running.values()])
+
+    print(f"📊 Queue: {store.counts()}")
+    print(f"💰 OpenAI usage this run: {run_budget.totals()}")
+    profiler.print_report(PROFILE_CAPACITIES)
 
 
 if __name__ == "__main__":
-    try:
-        main()
-    except Exception as e:
-        print("❌ Script failed:", e)
+    parser = argparse.ArgumentParser(description="Smart Summariser")
+    parser.add_argument(
+        "--daemon", action="store_true", help="Keep polling the sheet and process rows as jobs"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Run under cProfile (all worker threads) and save the stats"
+    )
+    args = parser.parse_args()
+
+    # 🔬 cProfile adds overhead, so it only runs when asked for
+    profiling = ThreadedCProfile() if args.profile else nullcontext()
+    with profiling:
+        try:
+            if args.daemon:
+                run_daemon()
+            else:
+                main()
+        except Exception as e:
+            print("❌ Script failed:", e)
+    if args.profile:
+        profiling.save()
 
 # Helo
\ No newline at end of file
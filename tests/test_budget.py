@@ -0,0 +1,43 @@
+# 🧪 Budget regression tests: run from the repo root with `python -m pytest -q`
+import random
+
+import pytest
+
+from common import metrics
+from common.tokens import count_tokens
+
+MODEL = "gpt-4.1-2025-04-14"
+SYSTEM_PROMPT = "You are an expert analyst. Return the summary as JSON with a title and sections."
+TEMPLATE = "Summarize this webpage into the sections below.\n\n{webpage_text}\n\nReturn JSON only."
+
+
+def page_text(tokens):
+    rng = random.Random(0)
+    words = ["pricing", "platform", "customers", "analytics", "teams", "integration", "support"]
+    text = ""
+    while count_tokens(text, MODEL) < tokens:
+        text += " ".join(rng.choice(words) for _ in range(200)) + ".\n"
+    return text
+
+
+@pytest.fixture
+def run_budget(monkeypatch):
+    budget = metrics.Budget(max_tokens=10000)
+    monkeypatch.setattr(metrics, "run_budget", budget)
+    return budget
+
+
+# ✂️ A prompt trimmed by fit_to_budget must be accepted by the per-call check
+def test_trimmed_prompt_passes_chat_check(run_budget):
+    overhead = count_tokens(SYSTEM_PROMPT, MODEL) + count_tokens(TEMPLATE, MODEL)
+    text = metrics.fit_to_budget(page_text(50000), MODEL, overhead_tokens=overhead)
+
+    prompt_tokens = count_tokens(SYSTEM_PROMPT, MODEL) + count_tokens(TEMPLATE.format(webpage_text=text), MODEL)
+    metrics.check_chat_budget(MODEL, prompt_tokens, metrics.COMPLETION_RESERVE_TOKENS)
+    assert prompt_tokens + metrics.COMPLETION_RESERVE_TOKENS <= run_budget.max_tokens
+
+
+# 🚫 An untrimmed prompt over the budget is still refused
+def test_untrimmed_prompt_is_refused(run_budget):
+    with pytest.raises(metrics.BudgetExceeded):
+        metrics.check_chat_budget(MODEL, count_tokens(page_text(50000), MODEL), metrics.COMPLETION_RESERVE_TOKENS)
@@ -0,0 +1,242 @@
+# 📦 Standard Libraries
+import os
+import re
+import heapq
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
+from dotenv import load_dotenv
+
+# 🌐 Parsing + fetching
+import requests
+from website.fetcher import fetch_url, USER_AGENT
+from website.extract import extract_page, extract_text_from_url
+from common.profiler import stage
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Crawl limits
+CRAWL_ENABLED = os.getenv("CRAWL_ENABLED", "true").lower() == "true"
+CRAWL_MAX_PAGES = int(os.getenv("CRAWL_MAX_PAGES", "8"))
+CRAWL_MAX_DEPTH = int(os.getenv("CRAWL_MAX_DEPTH", "2"))
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))
+
+# ⭐ Pages that usually hold the summary sections (lower score = crawled earlier)
+PRIORITY_KEYWORDS = {
+    "about": 30,
+    "pricing": 30,
+    "price": 25,
+    "plans": 25,
+    "products": 30,
+    "product": 25,
+    "services": 30,
+    "service": 25,
+    "offers": 25,
+    "deals": 20,
+    "reviews": 25,
+    "testimonials": 25,
+    "company": 20,
+    "team": 15,
+    "contact": 10,
+}
+LOW_PRIORITY_KEYWORDS = ("blog", "news", "careers", "jobs", "privacy", "terms", "cookie", "tag", "author", "page")
+SKIP_KEYWORDS = ("login", "signin", "signup", "register", "cart", "checkout", "account", "wp-admin")
+SKIP_EXTENSIONS = (
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".ico", ".zip",
+    ".mp3", ".mp4", ".m4a", ".css", ".js", ".xml", ".json", ".doc", ".docx",
+)
+TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "mc_")
+
+# 🧬 Near-duplicate pages: simhash fingerprints within this Hamming distance
+SIMHASH_MAX_DISTANCE = 3
+
+
+# 🔗 Canonical form of a URL so the same page is never queued twice
+def normalize_url(url, base_url=None):
+    url = urljoin(base_url, url) if base_url else url
+    parts = urlparse(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+
+    host = parts.hostname or ""
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query)
+            if not key.lower().startswith(TRACKING_PARAMS)
+        )
+    )
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return urlunparse((parts.scheme.lower(), host.lower(), path, "", query, ""))
+
+
+# 🏠 Same site = same host, ignoring a leading "www."
+def same_site(url, start_url):
+    def bare(u):
+        return (urlparse(u).hostname or "").lower().removeprefix("www.")
+
+    return bare(url) == bare(start_url)
+
+
+# ⭐ Crawl order: shallow pages first, pages about the business before the rest
+def score_url(url, depth):
+    path = urlparse(url).path.lower()
+    score = depth * 20
+    for keyword, bonus in PRIORITY_KEYWORDS.items():
+        if keyword in path:
+            score -= bonus
+            break
+    if any(keyword in path for keyword in LOW_PRIORITY_KEYWORDS):
+        score += 40
+    return score
+
+
+def should_skip(url):
+    path = urlparse(url).path.lower()
+    return path.endswith(SKIP_EXTENSIONS) or any(k in path for k in SKIP_KEYWORDS)
+
+
+# 🤖 Load robots.txt for the site, following RFC 9309: a missing file (404 and other 4xx)
+#    allows everything, 401/403 mean the site blocks crawlers, and an unreachable file
+#    (5xx, 429, network error) disallows everything for this crawl. The start page itself
+#    is always fetched, it is the page the row asked for.
+def load_robots(start_url):
+    parts = urlparse(start_url)
+    parser = RobotFileParser()
+    try:
+        result = fetch_url(f"{parts.scheme}://{parts.netloc}/robots.txt", use_validators=False)
+        parser.parse(result.content.decode("utf-8", errors="replace").splitlines())
+    except requests.HTTPError as e:
+        status = e.response.status_code if e.response is not None else 0
+        if status in (401, 403):
+            print(f"🤖 robots.txt of {parts.netloc} is {status}, crawling the start page only.")
+            parser.disallow_all = True
+        elif status == 429 or status >= 500:
+            print(f"🤖 robots.txt of {parts.netloc} unavailable ({status}), crawling the start page only.")
+            parser.disallow_all = True
+        else:
+            parser.parse([])
+    except Exception as e:
+        print(f"🤖 robots.txt of {parts.netloc} unreachable ({e}), crawling the start page only.")
+        parser.disallow_all = True
+    return parser
+
+
+# 🧬 64-bit simhash over word 3-shingles (near-identical pages give close fingerprints)
+def simhash(text):
+    words = re.findall(r"\w+", text.lower())
+    shingles = [" ".join(words[i : i + 3]) for i in range(max(1, len(words) - 2))]
+    weights = [0] * 64
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def is_near_duplicate(fingerprint, seen_fingerprints):
+    return any(bin(fingerprint ^ seen).count("1") <= SIMHASH_MAX_DISTANCE for seen in seen_fingerprints)
+
+
+# 📄 Fetch one page and return (final_url, text, links) — None for non-HTML pages
+def fetch_page(url):
+    result = fetch_url(url)
+    if result.content_type and "html" not in result.content_type.lower():
+        return None
+
+    text, links = extract_page(result.content)
+    return result.url, text, links
+
+
+# 🕸️ Crawl the site breadth-first by priority and return [(url, text)] of unique pages
+def crawl_site(
+    start_url,
+    max_pages=CRAWL_MAX_PAGES,
+    max_depth=CRAWL_MAX_DEPTH,
+    concurrency=CRAWL_CONCURRENCY,
+):
+    start_url = normalize_url(start_url)
+    robots = load_robots(start_url)
+
+    frontier = [(0, 0, start_url, 0)]
+    queued = {start_url}
+    counter = 1
+    pages = []
+    fingerprints = []
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        while frontier and len(pages) < max_pages:
+            # 📦 Take the best-ranked URLs for this round
+            batch = []
+            while frontier and len(batch) < concurrency:
+                _, _, url, depth = heapq.heappop(frontier)
+                if url == start_url or robots.can_fetch(USER_AGENT, url):
+                    batch.append((url, depth))
+
+            futures = [(executor.submit(fetch_page, url), url, depth) for url, depth in batch]
+            for future, url, depth in futures:
+                try:
+                    page = future.result()
+                except Exception as e:
+                    if url == start_url:
+                        raise
+                    print(f"⚠️ Crawl skipped {url}: {e}")
+                    continue
+                if page is None:
+                    continue
+
+                final_url, text, links = page
+                fingerprint = simhash(text)
+                if not text or is_near_duplicate(fingerprint, fingerprints):
+                    continue
+                if len(pages) < max_pages:
+                    fingerprints.append(fingerprint)
+                    pages.append((final_url, text))
+
+                if depth >= max_depth:
+                    continue
+
+                # 🔗 Queue new same-site links
+                for link in links:
+                    link = normalize_url(link, final_url)
+                    if not link or link in queued or should_skip(link):
+                        continue
+                    if not same_site(link, start_url):
+                        continue
+                    queued.add(link)
+                    heapq.heappush(frontier, (score_url(link, depth + 1), counter, link, depth + 1))
+                    counter += 1
+
+    print(f"🕸️ Crawled {len(pages)} page(s) from {start_url}")
+    return pages
+
+
+# 📚 Combine crawled pages into one corpus, dropping lines already seen on another page
+def build_corpus(pages):
+    seen_lines = set()
+    sections = []
+    for url, text in pages:
+        lines = []
+        for line in text.splitlines():
+            key = line.strip().lower()
+            if key and key not in seen_lines:
+                seen_lines.add(key)
+                lines.append(line)
+        if lines:
+            sections.append(f"## Page: {url}\n" + "\n".join(lines))
+    return "\n\n".join(sections)
+
+
+# 🌐 Text for the website summarizer: whole-site corpus when crawling is on, single page otherwise
+def extract_site_text(url):
+    with stage("website.scrape"):
+        if not CRAWL_ENABLED:
+            return extract_text_from_url(url)
+        return build_corpus(crawl_site(url))
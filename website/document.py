@@ -0,0 +1,23 @@
+import io
+
+from common.doc_blocks import block, text_runs, markdown_blocks
+from common.docx_renderer import render_docx
+
+
+# 🧱 Document blocks for a structured website summary (shared by every output backend)
+def website_blocks(summary_json, document_title):
+    # 🧾 Document title as the level 0 heading
+    blocks = [block("Title", text_runs(document_title))]
+
+    # 🔁 Each section: its heading, then the content lines
+    #    ("- " lines become bullets, nested by indentation, with **bold** / *italic* markup)
+    for section in summary_json.get("sections", []):
+        blocks.append(block("Heading1", text_runs(section["heading"])))
+        blocks += markdown_blocks(section["content"])
+    return blocks
+
+
+# 📄 Creates a formatted DOCX document in memory based on a structured summary JSON
+def create_docx_in_memory(summary_json, document_title):
+    # 📤 Return a binary stream (used for uploading or downloading)
+    return io.BytesIO(render_docx(website_blocks(summary_json, document_title)))
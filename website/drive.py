@@ -0,0 +1,25 @@
+import os
+from dotenv import load_dotenv
+from common.google_clients import get_drive_service
+from common.drive_uploads import upload_queue
+
+# 🔐 Load environment variables from .env
+load_dotenv()
+
+# 📁 Config values loaded from environment
+FOLDER_ID = os.getenv("WEBSITE_DRIVE_FOLDER_ID")  # Shared Drive folder ID
+
+
+# 🔐 Auth using service account for headless Drive access (Shared Drives supported)
+def authenticate_google_drive():
+    return get_drive_service()
+
+
+# 📤 Uploads a DOCX file (from memory) to Google Drive as a Google Doc in a Shared Drive
+#    (through the shared upload queue: multipart for small files, rate-limited)
+def upload_docx_to_gdrive(docx_stream, filename):
+    docx_stream.seek(0)
+    file_id = upload_queue.upload(docx_stream.read(), filename, FOLDER_ID)
+
+    print(f"Uploaded to Google Drive as: {filename} (ID: {file_id})")
+    return file_id
@@ -0,0 +1,255 @@
+# 📦 Standard Libraries
+import os
+import re
+from html.parser import HTMLParser
+from dotenv import load_dotenv
+
+# 🌐 Fetching
+from website.fetcher import fetch_url
+
+# ⚡ lxml is optional: it is the fastest backend when installed
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Extraction backend: "auto" (lxml if installed, else stream), "lxml", "stream" or "bs4"
+EXTRACT_BACKEND = os.getenv("EXTRACT_BACKEND", "auto").lower()
+
+# 📏 <main>/<article> is used on its own only if it holds at least this much text
+MIN_MAIN_CONTENT_CHARS = int(os.getenv("MIN_MAIN_CONTENT_CHARS", "200"))
+
+# 🚫 Elements that never carry page content
+DROP_TAGS = {
+    "script", "style", "noscript", "template", "svg", "iframe", "canvas",
+    "nav", "footer", "header", "aside", "form", "button", "select", "option",
+}
+
+# 🚫 Landmarks and class/id names used by navigation, banners and other template blocks
+BOILERPLATE_ROLES = {"navigation", "banner", "contentinfo", "complementary", "search", "dialog"}
+BOILERPLATE_PATTERN = re.compile(
+    r"(^|[\s_-])(cookie|consent|gdpr|newsletter|popup|modal|breadcrumbs?|share|social|"
+    r"navbar|nav|menu|sidebar|footer|site-header|skip-link|subscribe)([\s_-]|$)",
+    re.IGNORECASE,
+)
+
+# 🧱 Tags that start a new line of text
+BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "li", "ul", "ol", "br", "tr", "td", "th",
+    "table", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "dd", "dt", "hr",
+}
+
+# 🔚 Tags without a closing tag
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+    "param", "source", "track", "wbr",
+}
+
+CHARSET_PATTERN = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+
+# 🔤 Decode HTML bytes using the declared charset (UTF-8 otherwise)
+def decode_html(content):
+    if isinstance(content, str):
+        return content
+    match = CHARSET_PATTERN.search(content[:4096])
+    encoding = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+# 🚫 Does this element look like navigation, a banner or another template block?
+def is_boilerplate(tag, attrs):
+    if tag in ("html", "body", "main", "article"):
+        return False
+    if tag in DROP_TAGS:
+        return True
+    if (attrs.get("role") or "").lower() in BOILERPLATE_ROLES:
+        return True
+    if (attrs.get("aria-hidden") or "").lower() == "true":
+        return True
+    names = f"{attrs.get('id') or ''} {attrs.get('class') or ''}"
+    return bool(BOILERPLATE_PATTERN.search(names))
+
+
+# 🧹 Strip lines, drop empty ones and lines repeated elsewhere on the page
+def clean_lines(text):
+    seen = set()
+    lines = []
+    for line in text.splitlines():
+        line = " ".join(line.split())
+        key = line.lower()
+        if line and key not in seen:
+            seen.add(key)
+            lines.append(line)
+    return "\n".join(lines)
+
+
+# 🌊 Streaming backend (stdlib HTMLParser, no tree is built)
+class StreamingTextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []          # [(tag, skipping, is_main)]
+        self.skip_depth = 0
+        self.main_depth = 0
+        self.all_parts = []
+        self.main_parts = []
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "a" and attrs.get("href"):
+            self.links.append(attrs["href"])
+
+        if tag in BLOCK_TAGS:
+            self._emit("\n")
+        if tag in VOID_TAGS:
+            return
+
+        skipping = is_boilerplate(tag, attrs)
+        is_main = tag in ("main", "article") or (attrs.get("role") or "").lower() == "main"
+        self.stack.append((tag, skipping, is_main))
+        self.skip_depth += skipping
+        self.main_depth += is_main
+
+    def handle_endtag(self, tag):
+        if tag in BLOCK_TAGS:
+            self._emit("\n")
+        if not any(open_tag == tag for open_tag, _, _ in self.stack):
+            return  # Stray closing tag
+
+        # Pop up to and including the matching tag (closes unclosed children too)
+        while self.stack:
+            open_tag, skipping, is_main = self.stack.pop()
+            self.skip_depth -= skipping
+            self.main_depth -= is_main
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        self._emit(data)
+
+    def _emit(self, text):
+        if self.skip_depth:
+            return
+        self.all_parts.append(text)
+        if self.main_depth:
+            self.main_parts.append(text)
+
+    def result(self):
+        main_text = "".join(self.main_parts)
+        if len(main_text.strip()) >= MIN_MAIN_CONTENT_CHARS:
+            return clean_lines(main_text), self.links
+        return clean_lines("".join(self.all_parts)), self.links
+
+
+def extract_with_stream(html):
+    parser = StreamingTextExtractor()
+    parser.feed(decode_html(html))
+    parser.close()
+    return parser.result()
+
+
+# ⚡ lxml backend
+def extract_with_lxml(html):
+    root = lxml.html.fromstring(html)
+    links = [href for href in root.xpath("//a/@href")]
+
+    # 🚫 Remove boilerplate subtrees (collect first, then remove, so iteration stays valid)
+    doomed = [
+        element
+        for element in root.iter()
+        if isinstance(element.tag, str) and is_boilerplate(element.tag, element.attrib)
+    ]
+    for element in doomed:
+        parent = element.getparent()
+        if parent is not None:
+            # Keep the text that follows the removed element
+            if element.tail:
+                previous = element.getprevious()
+                if previous is not None:
+                    previous.tail = (previous.tail or "") + element.tail
+                else:
+                    parent.text = (parent.text or "") + element.tail
+            parent.remove(element)
+    etree.strip_elements(root, etree.Comment, with_tail=False)
+
+    # 🧱 Put block elements on their own lines
+    for element in root.iter(*BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+        element.text = "\n" + (element.text or "")
+
+    main = root.xpath("//main | //article | //*[@role='main']")
+    if main:
+        main_text = "\n".join("".join(element.itertext()) for element in main)
+        if len(main_text.strip()) >= MIN_MAIN_CONTENT_CHARS:
+            return clean_lines(main_text), links
+    return clean_lines("".join(root.itertext())), links
+
+
+# 🍲 BeautifulSoup backend (html.parser), kept for environments without lxml
+def extract_with_bs4(html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    links = [a["href"] for a in soup.find_all("a", href=True)]
+
+    for element in soup.find_all(True):
+        if element.decomposed:
+            continue
+        attrs = {
+            key: " ".join(value) if isinstance(value, list) else value
+            for key, value in (element.attrs or {}).items()
+        }
+        if is_boilerplate(element.name, attrs):
+            element.decompose()
+
+    main = soup.find(["main", "article"]) or soup.find(attrs={"role": "main"})
+    if main is not None:
+        main_text = main.get_text(separator="\n")
+        if len(main_text.strip()) >= MIN_MAIN_CONTENT_CHARS:
+            return clean_lines(main_text), links
+    return clean_lines(soup.get_text(separator="\n")), links
+
+
+BACKENDS = {
+    "lxml": extract_with_lxml,
+    "stream": extract_with_stream,
+    "bs4": extract_with_bs4,
+}
+
+
+# 🧩 Resolve the configured backend name
+def resolve_backend(backend=EXTRACT_BACKEND):
+    if backend == "auto":
+        return "lxml" if lxml is not None else "stream"
+    if backend == "lxml" and lxml is None:
+        return "stream"
+    return backend
+
+
+# 📄 Extract (clean main-content text, raw links) from an HTML document
+def extract_page(html, backend=EXTRACT_BACKEND):
+    if not html or not html.strip():
+        return "", []
+    return BACKENDS[resolve_backend(backend)](html)
+
+
+# 🧽 Converts raw HTML into clean, readable text
+def html_to_text(html, backend=EXTRACT_BACKEND):
+    return extract_page(html, backend)[0]
+
+
+# 🌐 Extracts clean, readable text content from a given website URL
+def extract_text_from_url(url):
+    # 🔗 Fetch the page through the pooled fetcher (timeouts, size cap, conditional GET).
+    #    An unchanged page (304) yields the same text, so its summary comes from the LLM cache.
+    result = fetch_url(url)
+
+    return html_to_text(result.content)
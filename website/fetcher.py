@@ -0,0 +1,186 @@
+# 📦 Standard Libraries
+import os
+import json
+import hashlib
+import threading
+from collections import defaultdict
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+
+# 🌐 HTTP Libraries
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 🧩 Shared helpers
+from common.profiler import stage
+
+# 🗜️ Brotli is optional: urllib3 decodes "br" responses only when it is installed
+try:
+    import brotli  # noqa: F401
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# 🔐 Load environment variables
+load_dotenv()
+
+# ⚙️ Fetcher settings
+FETCH_CONNECT_TIMEOUT = float(os.getenv("FETCH_CONNECT_TIMEOUT", "5"))
+FETCH_READ_TIMEOUT = float(os.getenv("FETCH_READ_TIMEOUT", "20"))
+FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(5 * 1024 * 1024)))
+FETCH_PER_HOST_LIMIT = int(os.getenv("FETCH_PER_HOST_LIMIT", "2"))
+FETCH_POOL_SIZE = int(os.getenv("FETCH_POOL_SIZE", "32"))
+FETCH_CACHE_DIR = os.getenv("FETCH_CACHE_DIR", ".cache/http")
+USER_AGENT = os.getenv(
+    "FETCH_USER_AGENT", "Mozilla/5.0 (compatible; SmartSummarizer/1.0)"
+)
+
+
+# 📄 Result of one fetch (content is the decoded body, even for 304 responses)
+class FetchResult:
+    def __init__(self, url, status, content, content_type="", not_modified=False):
+        self.url = url
+        self.status = status
+        self.content = content
+        self.content_type = content_type
+        self.not_modified = not_modified
+
+
+# 🏷️ ETag / Last-Modified store with the body that goes with them
+class ValidatorStore:
+    def __init__(self, directory=FETCH_CACHE_DIR):
+        self.directory = directory
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    # 📥 Return (meta, body) for a URL, or (None, None) if never stored
+    def get(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return meta, f.read()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None, None
+
+    # 💾 Store validators and body (only when the server sent a validator). Both files are
+    #    written to temp files and swapped in with os.replace, body first and meta last: the old
+    #    meta is dropped before the body changes, so a crash or a concurrent fetch of the same
+    #    URL never pairs validators with a body they don't belong to (get() sees a miss instead)
+    def save(self, url, headers, body):
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(body_path + suffix, "wb") as f:
+            f.write(body)
+        with open(meta_path + suffix, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "content_type": headers.get("Content-Type", ""),
+                },
+                f,
+            )
+
+        try:
+            os.remove(meta_path)
+        except FileNotFoundError:
+            pass
+        os.replace(body_path + suffix, body_path)
+        os.replace(meta_path + suffix, meta_path)
+
+
+# 🔌 Shared keep-alive session with a connection pool and light transport-level retries
+def build_session():
+    session = requests.Session()
+    retries = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=FETCH_POOL_SIZE, pool_maxsize=FETCH_POOL_SIZE, max_retries=retries
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+    return session
+
+
+session = build_session()
+validator_store = ValidatorStore()
+
+# 🚦 Per-host concurrency limits so one slow site can't take every connection
+_host_slots = defaultdict(lambda: threading.BoundedSemaphore(FETCH_PER_HOST_LIMIT))
+_host_slots_lock = threading.Lock()
+
+
+def host_slot(url):
+    host = urlparse(url).netloc.lower()
+    with _host_slots_lock:
+        return _host_slots[host]
+
+
+# 🌐 Fetch a URL with timeouts, a size cap and conditional GET support
+def fetch_url(url, max_bytes=FETCH_MAX_BYTES, use_validators=True):
+    headers = {}
+    meta, cached_body = validator_store.get(url) if use_validators else (None, None)
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with host_slot(url), stage("website.fetch") as sample:
+        with session.get(
+            url,
+            headers=headers,
+            timeout=(FETCH_CONNECT_TIMEOUT, FETCH_READ_TIMEOUT),
+            stream=True,
+        ) as response:
+            # ♻️ Unchanged since last fetch: reuse the stored body
+            if response.status_code == 304 and cached_body is not None:
+                print(f"♻️ Not modified: {url}")
+                return FetchResult(
+                    response.url,
+                    304,
+                    cached_body,
+                    meta.get("content_type", ""),
+                    not_modified=True,
+                )
+
+            response.raise_for_status()
+
+            # 📏 Stop reading once the (decompressed) body reaches the cap
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body.extend(chunk)
+                if len(body) >= max_bytes:
+                    print(f"✂️ Truncated {url} at {max_bytes} bytes.")
+                    del body[max_bytes:]
+                    break
+
+            body = bytes(body)
+            sample["bytes"] = len(body)
+            if use_validators:
+                validator_store.save(url, response.headers, body)
+
+            return FetchResult(
+                response.url,
+                response.status_code,
+                body,
+                response.headers.get("Content-Type", ""),
+            )
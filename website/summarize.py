@@ -0,0 +1,241 @@
+import json
+from common.openai_client import cached_chat, request_missing_sections, RETRYABLE_ERRORS
+from common.json_repair import parse_json_object
+from common.map_reduce import needs_map_reduce, map_reduce
+from common.tokens import TokenUsage, count_tokens
+from common.metrics import fit_to_budget, BudgetExceeded
+
+# 🤖 Model settings (also part of the response cache key)
+OPENAI_MODEL = "gpt-4.1-2025-04-14"
+TEMPERATURE = 0.3  # Low temperature = more predictable structure
+SYSTEM_PROMPT = "You are a helpful assistant."
+
+# 🧠 Prompt instructing GPT to behave like a business analyst and return only a well-structured JSON
+WEBSITE_PROMPT_TEMPLATE = """
+You are a professional business analyst. Analyze the following website content and extract comprehensive, detailed business information in JSON format.
+
+Each section should contain **4–6 bullet points** with rich, descriptive details — not short or generic phrases. Bold important keywords using `**bold**` markdown format. DO NOT include explanations, just return the valid JSON only.
+
+Use this exact structure:
+
+{{
+  "title": "<Website Title or Company Name>",
+  "sections": [
+    {{
+      "heading": "Purpose",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }},
+    {{
+      "heading": "Target Audience",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }},
+    {{
+      "heading": "About the Company",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }},
+    {{
+      "heading": "Company Information",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }},
+    {{
+      "heading": "Unique Selling Proposition (USP)",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }},
+    {{
+      "heading": "Reviews/Testimonials",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }},
+    {{
+      "heading": "Products/Service Categories",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }},
+    {{
+      "heading": "Offers",
+      "content": "- Bullet point 1\\n- Bullet point 2\\n..."
+    }}
+  ]
+}}
+
+Analyze this content:
+\"\"\"{webpage_text}\"\"\"
+"""
+
+
+# 🔗 Prompt used to merge partial summaries of different parts of the same website
+WEBSITE_MERGE_PROMPT = """
+You are a professional business analyst. You will be given several partial JSON summaries, each produced from a different part of the same website.
+
+Merge them into ONE summary that uses exactly the same structure as the partial summaries, with the same section headings in the same order.
+
+Each section should contain **4–6 bullet points** with rich, descriptive details. Keep the most specific facts, merge duplicates, and drop bullets that only say information was not available when another part has real details. Bold important keywords using `**bold**` markdown format. DO NOT include explanations, just return the valid JSON only.
+"""
+
+
+# 📐 Sections every website summary must have, in document order
+WEBSITE_SECTIONS = [
+    "Purpose",
+    "Target Audience",
+    "About the Company",
+    "Company Information",
+    "Unique Selling Proposition (USP)",
+    "Reviews/Testimonials",
+    "Products/Service Categories",
+    "Offers",
+]
+
+# 🩹 Follow-up prompt when an answer left sections out (only those sections are regenerated)
+WEBSITE_FILL_PROMPT = """
+Your JSON is missing these parts: {fields}.
+
+Return only valid JSON with the same structure, containing just those parts ("title" and/or a "sections" list with only the missing headings). Each section should contain **4–6 bullet points**.
+"""
+
+
+# 🧹 Parse the JSON object in a raw GPT answer (code fences, smart quotes, trailing commas
+#    and truncated output are repaired instead of failing the whole call)
+def parse_summary_json(content):
+    try:
+        return parse_json_object(content)
+    except ValueError:
+        print("⚠️ Raw output was:\n", content)
+        raise
+
+
+# 📐 Coerce a parsed answer into the website structure and list what it is missing
+def normalize_website_summary(data):
+    def as_text(value):
+        if isinstance(value, list):
+            return "\n".join(
+                item if str(item).lstrip().startswith("-") else f"- {item}" for item in value if item
+            )
+        return value.strip() if isinstance(value, str) else ""
+
+    title = data.get("title") if isinstance(data.get("title"), str) else ""
+    sections = {}
+    for section in data.get("sections") or []:
+        if isinstance(section, dict) and section.get("heading"):
+            content = as_text(section.get("content"))
+            if content:
+                sections[section["heading"].strip()] = content
+
+    missing = [] if title.strip() else ["title"]
+    missing += [heading for heading in WEBSITE_SECTIONS if heading not in sections]
+    return title.strip(), sections, missing
+
+
+# 🧱 Rebuild the summary with the known sections first (in order), then any extra ones
+def build_website_summary(title, sections):
+    ordered = [heading for heading in WEBSITE_SECTIONS if heading in sections]
+    ordered += [heading for heading in sections if heading not in WEBSITE_SECTIONS]
+    return {
+        "title": title or "Website Summary",
+        "sections": [{"heading": heading, "content": sections[heading]} for heading in ordered],
+    }
+
+
+# 🩹 Regenerate only the missing title/sections (one follow-up call)
+def complete_website_summary(messages, data, usage=None, fill=True):
+    title, sections, missing = normalize_website_summary(data)
+    if missing and fill:
+        print(f"🩹 Website summary missing {missing}, requesting only those parts...")
+        fill = request_missing_sections(
+            OPENAI_MODEL,
+            messages,
+            TEMPERATURE,
+            data,
+            WEBSITE_FILL_PROMPT.format(fields=", ".join(missing)),
+            namespace="website-fill",
+            template=WEBSITE_FILL_PROMPT,
+            usage=usage,
+        )
+        fill_title, fill_sections, _ = normalize_website_summary(fill)
+        title = title or fill_title
+        for heading, content in fill_sections.items():
+            sections.setdefault(heading, content)
+    return build_website_summary(title, sections)
+
+
+# 🧩 Summarize one block of website text into the section structure
+def summarize_text_piece(webpage_text, usage=None, stage="single"):
+    prompt = WEBSITE_PROMPT_TEMPLATE.format(webpage_text=webpage_text)
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+    data = cached_chat(
+        OPENAI_MODEL,
+        messages,
+        TEMPERATURE,
+        parse=parse_summary_json,
+        namespace="website",
+        template=WEBSITE_PROMPT_TEMPLATE,
+        usage=usage,
+        stage=stage,
+    )
+    # Map pieces only cover part of the input, so gaps are left for the merge step to fill
+    return complete_website_summary(messages, data, usage, fill=stage != "map")
+
+
+# 🔗 Merge partial website summaries into one summary with the same sections
+def merge_website_summaries(partials, usage=None):
+    messages = [
+        {"role": "system", "content": WEBSITE_MERGE_PROMPT},
+        {"role": "user", "content": json.dumps(partials, ensure_ascii=False, indent=2)},
+    ]
+    data = cached_chat(
+        OPENAI_MODEL,
+        messages,
+        TEMPERATURE,
+        parse=parse_summary_json,
+        namespace="website-merge",
+        template=WEBSITE_MERGE_PROMPT,
+        usage=usage,
+        stage="reduce",
+    )
+    return complete_website_summary(messages, data, usage)
+
+
+# 📊 Summarizes website content into a detailed, structured JSON using OpenAI GPT
+def summarize_with_openai(webpage_text):
+    usage = TokenUsage()
+
+    # 💰 Trim the page text up front if the row/run budget can't cover all of it
+    webpage_text = fit_to_budget(
+        webpage_text,
+        OPENAI_MODEL,
+        overhead_tokens=count_tokens(SYSTEM_PROMPT) + count_tokens(WEBSITE_PROMPT_TEMPLATE),
+    )
+
+    # 🤖 Send prompt(s) to GPT model; very large pages are split, summarized in parallel and merged
+    try:
+        if needs_map_reduce(webpage_text):
+            summary = map_reduce(
+                webpage_text,
+                map_fn=lambda piece: summarize_text_piece(piece, usage, stage="map"),
+                reduce_fn=lambda partials: merge_website_summaries(partials, usage),
+            )
+        else:
+            summary = summarize_text_piece(webpage_text, usage)
+
+        print(f"🔢 Website summary tokens: {usage.summary()}")
+        return summary
+
+    # 🚫 Exhausted retries / budget: fail the branch so the row is marked "error" and retried,
+    #    instead of uploading a placeholder document
+    except RETRYABLE_ERRORS + (BudgetExceeded,):
+        raise
+
+    # ❌ Handle cases where no JSON could be recovered from the GPT response
+    except ValueError as e:
+        print("⚠️ OpenAI JSON parsing failed:", e)
+
+        # Provide a fallback summary structure
+        return {
+            "title": "Summary Unavailable",
+            "sections": [
+                {
+                    "heading": "Error",
+                    "content": "OpenAI returned invalid or incomplete JSON.",
+                }
+            ],
+        }